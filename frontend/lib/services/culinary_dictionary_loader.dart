@@ -36,36 +36,12 @@ class CulinaryDictionaryLoader {
       // Construire les dictionnaires de manière optimisée
       if (ingredientsData['ingredients'] != null) {
         final ingredients = ingredientsData['ingredients'] as Map<String, dynamic>;
-        _ingredientsDictionary = Map.fromEntries(
-          ingredients.entries.map((entry) {
-            final translations = entry.value as Map<String, dynamic>;
-            return MapEntry(
-              entry.key.toLowerCase(),
-              {
-                'en': entry.key,
-                'fr': translations['fr'] as String? ?? entry.key,
-                'es': translations['es'] as String? ?? entry.key,
-              },
-            );
-          }),
-        );
+        _ingredientsDictionary = _buildDictionary(ingredients);
       }
       
       if (recipeNamesData['recipe_names'] != null) {
         final recipeNames = recipeNamesData['recipe_names'] as Map<String, dynamic>;
-        _recipeNamesDictionary = Map.fromEntries(
-          recipeNames.entries.map((entry) {
-            final translations = entry.value as Map<String, dynamic>;
-            return MapEntry(
-              entry.key.toLowerCase(),
-              {
-                'en': entry.key,
-                'fr': translations['fr'] as String? ?? entry.key,
-                'es': translations['es'] as String? ?? entry.key,
-              },
-            );
-          }),
-        );
+        _recipeNamesDictionary = _buildDictionary(recipeNames);
       }
       
       if (instructionsData['instructions'] != null) {
@@ -102,6 +78,26 @@ class CulinaryDictionaryLoader {
     }
   }
 
+  /// Construit un dictionnaire (clé en minuscules → traductions), alias compris
+  static Map<String, Map<String, String>> _buildDictionary(Map<String, dynamic> entries) {
+    final dictionary = <String, Map<String, String>>{};
+    for (final entry in entries.entries) {
+      final translations = entry.value as Map<String, dynamic>;
+      final value = {
+        'en': entry.key,
+        'fr': translations['fr'] as String? ?? entry.key,
+        'es': translations['es'] as String? ?? entry.key,
+      };
+      dictionary[entry.key.toLowerCase()] = value;
+      // Clés fusionnées dans cette entrée (near_duplicates.py --collapse)
+      final aliases = (translations['aliases'] as List<dynamic>? ?? const []).cast<String>();
+      for (final alias in aliases) {
+        dictionary.putIfAbsent(alias.toLowerCase(), () => {...value, 'en': alias});
+      }
+    }
+    return dictionary;
+  }
+
   /// Traduit un ingrédient
   static String? translateIngredient(String ingredient, String targetLanguage) {
     if (!_isLoaded) return null;
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Échantillonnage adaptatif de random.php avec règle d'arrêt de Good-Turing
+
+Au lieu d'un nombre fixe de tirages, les recettes aléatoires sont demandées par
+lots et la courbe de découverte des ingrédients est suivie :
+  - f1 = nombre d'ingrédients vus une seule fois, n = nombre total d'occurrences
+  - masse non vue (Good-Turing) = f1 / n, couverture estimée = 1 - f1 / n
+  - gain attendu par requête = ingrédients moyens par recette x f1 / n
+L'échantillonnage s'arrête dès que le gain attendu passe sous le seuil (après un
+minimum de tirages), ou au nombre maximal de tirages.
+
+Usage:
+    python3 scripts/translation/adaptive_sampler.py [gain_min]
+"""
+
+import sys
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+from async_fetcher import fetch_all
+from mealdb_sync import meal_ingredients
+
+MIN_GAIN = 0.5          # nouveaux ingrédients attendus par requête
+BATCH_SIZE = 10
+MIN_DRAWS = 20
+MAX_DRAWS = 1000
+
+
+class DiscoveryTracker:
+    """Courbe de découverte des ingrédients (comparés en minuscules)"""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.draws = 0
+        self.occurrences = 0
+        self.singletons = 0
+        self.curve: List[int] = []
+
+    def observe(self, ingredients: Iterable[str]):
+        """Ajoute les ingrédients d'une recette tirée"""
+        for ingredient in {ingredient.lower() for ingredient in ingredients}:
+            self.counts[ingredient] += 1
+            self.occurrences += 1
+            # f1 suivi au fil de l'eau : +1 à la première occurrence, -1 à la deuxième
+            if self.counts[ingredient] == 1:
+                self.singletons += 1
+            elif self.counts[ingredient] == 2:
+                self.singletons -= 1
+        self.draws += 1
+        self.curve.append(len(self.counts))
+
+    @property
+    def unseen_mass(self) -> float:
+        """Estimation de Good-Turing de la probabilité qu'une occurrence soit nouvelle"""
+        if not self.occurrences:
+            return 1.0
+        return self.singletons / self.occurrences
+
+    @property
+    def coverage(self) -> float:
+        return 1.0 - self.unseen_mass
+
+    @property
+    def expected_gain(self) -> float:
+        """Nouveaux ingrédients attendus au prochain tirage"""
+        if not self.draws:
+            return float('inf')
+        return self.occurrences / self.draws * self.unseen_mass
+
+    def report(self) -> Dict:
+        return {
+            'draws': self.draws,
+            'ingredients': len(self.counts),
+            'singletons': self.singletons,
+            'coverage': self.coverage,
+            'expected_gain': self.expected_gain,
+        }
+
+
+def sample_ingredients(min_gain: float = MIN_GAIN, batch_size: int = BATCH_SIZE,
+                       min_draws: int = MIN_DRAWS, max_draws: int = MAX_DRAWS) -> Tuple[Set[str], Dict]:
+    """
+    Tire des recettes aléatoires jusqu'à ce que le gain attendu par requête passe sous
+    min_gain. Retourne (ingrédients trouvés, rapport de couverture).
+    """
+    tracker = DiscoveryTracker()
+    ingredients: Set[str] = set()
+    errors = 0
+    while tracker.draws + errors < max_draws:
+        start = tracker.draws + errors
+        batch = [("random.php", variant) for variant in range(start, min(start + batch_size, max_draws))]
+        for data in fetch_all(batch, timeout=5):
+            if isinstance(data, Exception):
+                print(f"   ⚠️  Erreur lors de la récupération: {data}")
+            if isinstance(data, Exception) or not data or not data.get('meals'):
+                errors += 1
+                continue
+            found = meal_ingredients(data['meals'][0])
+            ingredients.update(found)
+            tracker.observe(found)
+        print(f"   {tracker.draws} tirages: {len(tracker.counts)} ingrédients, "
+              f"couverture estimée {tracker.coverage:.1%}, gain attendu {tracker.expected_gain:.2f}/requête")
+        if tracker.draws >= min_draws and tracker.expected_gain < min_gain:
+            break
+
+    report = tracker.report()
+    report['errors'] = errors
+    report['stopped_early'] = tracker.draws + errors < max_draws
+    return ingredients, report
+
+
+def main():
+    min_gain = float(sys.argv[1]) if len(sys.argv) > 1 else MIN_GAIN
+    ingredients, report = sample_ingredients(min_gain)
+    print(f"✅ {len(ingredients)} ingrédients en {report['draws']} tirages "
+          f"(couverture estimée {report['coverage']:.1%}, gain attendu {report['expected_gain']:.2f}/requête)")
+
+
+if __name__ == '__main__':
+    main()
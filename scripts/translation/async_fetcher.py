@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Récupération concurrente des endpoints TheMealDB (asyncio, bibliothèque standard)
+
+AsyncFetcher remplace les boucles requests.get() + time.sleep() des scripts :
+  - pool de connexions HTTP/1.1 keep-alive (une connexion TLS réutilisée par requête
+    au lieu d'une nouvelle à chaque appel), au plus `concurrency` requêtes en cours
+  - seau à jetons (rate requêtes/s, rafale de burst) partagé par toutes les requêtes
+  - nouvelles tentatives avec attente exponentielle aléatoire (full jitter) sur les
+    erreurs réseau, 429 et 5xx, en respectant Retry-After
+  - une seule requête pour plusieurs demandes identiques en cours
+  - cache et modes d'enregistrement/rejeu de mealdb_http (les réponses en cache ne
+    consomment pas de jeton)
+
+Usage:
+    python3 scripts/translation/async_fetcher.py bench [nombre]
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import random
+import ssl
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote, urljoin, urlsplit
+
+from mealdb_http import DEFAULT_TTL, MEALDB_API, lookup, store
+
+CONCURRENCY = 8
+# Même cadence que la boucle la plus rapide des scripts (une requête toutes les 0,2 s)
+RATE = float(os.environ.get('MEALDB_RATE', '5'))
+BURST = 10
+RETRIES = 3
+BACKOFF = 0.5
+MAX_REDIRECTS = 5
+USER_AGENT = 'recipe-translation-scripts/1.0'
+
+Request = Union[str, Tuple[str, Optional[int]]]
+
+
+class HttpStatusError(Exception):
+    def __init__(self, status: int, url: str, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status} pour {url}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Seau à jetons : rate jetons par seconde, au plus capacity en réserve"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ConnectionPool:
+    """Connexions keep-alive inactives, par (schéma, hôte, port)"""
+
+    def __init__(self):
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self._ssl = ssl.create_default_context()
+
+    async def acquire(self, scheme: str, host: str, port: int):
+        idle = self._idle.get((scheme, host, port))
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        if scheme == 'https':
+            reader, writer = await asyncio.open_connection(host, port, ssl=self._ssl, server_hostname=host)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return reader, writer, False
+
+    def release(self, scheme: str, host: str, port: int, reader, writer):
+        self._idle.setdefault((scheme, host, port), []).append((reader, writer))
+
+    async def close(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        for connections in self._idle.values():
+            for _, writer in connections:
+                try:
+                    await writer.wait_closed()
+                except (OSError, ssl.SSLError):
+                    pass
+        self._idle.clear()
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> Tuple[bytes, bool]:
+    """Corps de la réponse et indicateur "connexion réutilisable" """
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';', 1)[0], 16)
+            if size == 0:
+                # Trailers éventuels jusqu'à la ligne vide
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        return b''.join(chunks), True
+    if 'content-length' in headers:
+        return await reader.readexactly(int(headers['content-length'])), True
+    return await reader.read(), False
+
+
+async def _exchange(reader, writer, method: str, host: str, path: str,
+                    headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], bytes, bool]:
+    head = f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nUser-Agent: {USER_AGENT}\r\n"
+    head += ''.join(f"{name}: {value}\r\n" for name, value in headers.items())
+    if body:
+        head += f"Content-Length: {len(body)}\r\n"
+    writer.write((head + "Connection: keep-alive\r\n\r\n").encode('ascii') + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connexion fermée par le serveur")
+    status = int(status_line.split(b' ', 2)[1])
+    response_headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        response_headers[name.strip().lower()] = value.strip()
+    response, reusable = await _read_body(reader, response_headers)
+    return status, response_headers, response, reusable
+
+
+async def http_request(pool: ConnectionPool, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                       body: bytes = b'', timeout: Optional[float] = None) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Requête HTTP/1.1 sur une connexion keep-alive du pool : (statut, en-têtes en
+    minuscules, corps). url doit être déjà encodée ; la connexion est rendue au pool
+    si le serveur la garde ouverte, fermée sinon (ou en cas d'erreur).
+    """
+    parts = urlsplit(url)
+    scheme, host = parts.scheme, parts.hostname
+    port = parts.port or (443 if scheme == 'https' else 80)
+    path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+    reader, writer, _ = await asyncio.wait_for(pool.acquire(scheme, host, port), timeout)
+    try:
+        status, response_headers, response, reusable = await asyncio.wait_for(
+            _exchange(reader, writer, method, host, path, headers or {}, body), timeout)
+    except BaseException:
+        writer.close()
+        raise
+    if reusable and response_headers.get('connection', '').lower() != 'close':
+        pool.release(scheme, host, port, reader, writer)
+    else:
+        writer.close()
+    return status, response_headers, response
+
+
+class AsyncFetcher:
+    """Client asynchrone pour l'API TheMealDB (à utiliser avec `async with`)"""
+
+    def __init__(self, base_url: str = MEALDB_API, concurrency: int = CONCURRENCY,
+                 rate: float = RATE, burst: int = BURST, retries: int = RETRIES,
+                 backoff: float = BACKOFF, timeout: float = 10, ttl: Optional[float] = DEFAULT_TTL):
+        self.base_url = base_url.rstrip('/')
+        self.ttl = ttl
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.network_requests = 0
+        self._bucket = TokenBucket(rate, burst)
+        self._slots = asyncio.Semaphore(concurrency)
+        self._pool = ConnectionPool()
+        self._in_flight: Dict[Tuple[str, Optional[int]], asyncio.Future] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._pool.close()
+
+    async def get_json(self, endpoint: str, variant: Optional[int] = None):
+        """
+        Réponse JSON de l'endpoint (ex. "filter.php?c=Beef"), ou None si le statut
+        n'est pas 200 après les redirections
+        """
+        hit, data = lookup(endpoint, variant, self.ttl)
+        if hit:
+            return data
+
+        key = (endpoint, variant)
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            data = await self._fetch_with_retries(endpoint)
+            store(endpoint, data, variant)
+            future.set_result(data)
+            return data
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # Évite l'avertissement "exception never retrieved" sans demande en double
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def fetch_all(self, requests: Iterable[Request]) -> List:
+        """Réponses dans l'ordre des demandes ; une demande en échec donne son exception"""
+        requests = [(request, None) if isinstance(request, str) else request for request in requests]
+        return await asyncio.gather(*(self.get_json(endpoint, variant) for endpoint, variant in requests),
+                                    return_exceptions=True)
+
+    async def _fetch_with_retries(self, endpoint: str):
+        url = f"{self.base_url}/{endpoint}"
+        for attempt in range(self.retries + 1):
+            try:
+                return await self._request(url)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, HttpStatusError) as error:
+                retryable = not isinstance(error, HttpStatusError) or error.status == 429 or error.status >= 500
+                if not retryable or attempt == self.retries:
+                    raise
+                delay = random.uniform(0, self.backoff * 2 ** attempt)
+                if isinstance(error, HttpStatusError) and error.retry_after:
+                    delay = max(delay, error.retry_after)
+                await asyncio.sleep(delay)
+
+    async def _request(self, url: str, redirects: int = 0):
+        # Encodage-pourcent comme requests ("filter.php?i=chicken breast", accents) ;
+        # les séquences %xx déjà présentes sont gardées
+        parts = urlsplit(url)
+        quoted = parts._replace(path=quote(parts.path or '/', safe='/%'),
+                                query=quote(parts.query, safe='=&%+')).geturl()
+
+        async with self._slots:
+            await self._bucket.acquire()
+            self.network_requests += 1
+            status, headers, body = await http_request(
+                self._pool, 'GET', quoted, {'Accept': 'application/json', 'Accept-Encoding': 'gzip'},
+                timeout=self.timeout)
+
+        if status == 429 or status >= 500:
+            retry_after = headers.get('retry-after')
+            raise HttpStatusError(status, url, float(retry_after) if retry_after and retry_after.isdigit() else None)
+        if 300 <= status < 400:
+            # Redirection suivie comme avec requests (au plus MAX_REDIRECTS), sinon erreur
+            location = headers.get('location')
+            if not location or redirects >= MAX_REDIRECTS:
+                raise HttpStatusError(status, url)
+            return await self._request(urljoin(url, location), redirects + 1)
+        if status != 200:
+            return None
+        if headers.get('content-encoding', '').lower() == 'gzip':
+            body = gzip.decompress(body)
+        return json.loads(body)
+
+
+def fetch_all(requests: Iterable[Request], **options) -> List:
+    """
+    Version synchrone pour les scripts : requests est une liste d'endpoints ou de
+    couples (endpoint, variante). Retourne les réponses JSON dans l'ordre (None si
+    statut différent de 200, exception si la demande a échoué).
+    """
+    async def run():
+        async with AsyncFetcher(**options) as fetcher:
+            return await fetcher.fetch_all(requests)
+
+    return asyncio.run(run())
+
+
+def main():
+    if len(sys.argv) > 3 or (len(sys.argv) > 1 and sys.argv[1] != 'bench'):
+        print(f"Usage: {sys.argv[0]} bench [nombre]")
+        sys.exit(1)
+    count = int(sys.argv[2]) if len(sys.argv) == 3 else 100
+
+    async def run():
+        async with AsyncFetcher() as fetcher:
+            start = time.perf_counter()
+            results = await fetcher.fetch_all(("random.php", i) for i in range(count))
+            return results, fetcher.network_requests, time.perf_counter() - start
+
+    results, network_requests, elapsed = asyncio.run(run())
+    errors = sum(1 for result in results if isinstance(result, Exception))
+    print(f"⚡ {count} recettes en {elapsed:.1f}s ({network_requests} requêtes réseau, {errors} erreurs)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+API de traduction par lots
+
+translate_batch(entries, langs=("fr", "es")) calcule toutes les langues cibles
+en un seul appel du traducteur par entrée. Les gros volumes sont découpés en
+morceaux répartis sur un ProcessPoolExecutor : chaque worker ouvre le
+dictionnaire compilé (compiled_dictionary.py) par mmap au démarrage au lieu de
+recevoir une copie sérialisée des dictionnaires, les pages étant partagées entre
+processus par le cache du système.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from compiled_dictionary import CompiledDictionary, load_compiled
+
+LANGS = ('fr', 'es')
+CHUNK_SIZE = 2000
+# En dessous de ce nombre d'entrées, le démarrage des processus coûte plus qu'il ne rapporte
+PARALLEL_THRESHOLD = 20000
+
+Translator = Callable[[str, str], Dict[str, str]]
+WorkerSetup = Callable[[CompiledDictionary], None]
+
+_TRANSLATOR: Optional[Translator] = None
+_COMPILED: Optional[CompiledDictionary] = None
+
+
+def _default_translator() -> Tuple[Translator, WorkerSetup]:
+    # Import tardif : translate_all_ingredients utilise lui-même translate_batch
+    import translate_all_ingredients
+    return translate_all_ingredients.translate_ingredient, translate_all_ingredients.attach_compiled_dictionary
+
+
+def _init_worker(translator: Translator, worker_setup: Optional[WorkerSetup], compiled_file: str):
+    global _TRANSLATOR, _COMPILED
+    _TRANSLATOR = translator
+    _COMPILED = CompiledDictionary(Path(compiled_file))
+    if worker_setup is not None:
+        worker_setup(_COMPILED)
+
+
+def _translate_chunk(chunk: List[Tuple[str, str]], langs: Tuple[str, ...]) -> List[Tuple[str, Dict[str, str]]]:
+    translate = _TRANSLATOR
+    results = []
+    for key, en_name in chunk:
+        translations = translate(key, en_name)
+        results.append((key, {lang: translations[lang] for lang in langs}))
+    return results
+
+
+def translate_batch(entries: Iterable[Tuple[str, str]],
+                    langs: Iterable[str] = LANGS,
+                    translator: Optional[Translator] = None,
+                    worker_setup: Optional[WorkerSetup] = None,
+                    workers: Optional[int] = None,
+                    chunk_size: int = CHUNK_SIZE,
+                    parallel_threshold: int = PARALLEL_THRESHOLD) -> Dict[str, Dict[str, str]]:
+    """
+    Traduit des couples (clé, nom anglais) dans toutes les langues demandées.
+    Retourne {clé: {langue: traduction}}.
+
+    translator(clé, nom) doit retourner un dict contenant toutes les langues ;
+    worker_setup(dictionnaire compilé) prépare chaque worker (par défaut : le
+    traducteur d'ingrédients de translate_all_ingredients.py).
+    """
+    langs = tuple(langs)
+    entries = list(entries)
+    if translator is None:
+        translator, default_setup = _default_translator()
+        worker_setup = worker_setup or default_setup
+
+    workers = workers or os.cpu_count() or 1
+    if len(entries) < parallel_threshold or workers == 1:
+        return dict(_translate_inline(entries, langs, translator))
+
+    with load_compiled() as compiled:
+        compiled_file = str(compiled.path)
+    chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+    results: Dict[str, Dict[str, str]] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(translator, worker_setup, compiled_file)) as pool:
+        for chunk_results in pool.map(_translate_chunk, chunks, [langs] * len(chunks)):
+            results.update(chunk_results)
+    return results
+
+
+def _translate_inline(entries: List[Tuple[str, str]], langs: Tuple[str, ...],
+                      translator: Translator) -> Iterable[Tuple[str, Dict[str, str]]]:
+    for key, en_name in entries:
+        translations = translator(key, en_name)
+        yield key, {lang: translations[lang] for lang in langs}
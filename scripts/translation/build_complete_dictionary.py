@@ -4,87 +4,31 @@ Script pour construire un dictionnaire culinaire complet
 en téléchargeant toutes les données depuis TheMealDB
 """
 
-import json
-import requests
-import time
+import sys
 from collections import defaultdict
-from pathlib import Path
 
-# Configuration
-THEMEALDB_API = "https://www.themealdb.com/api/json/v1/1"
-OUTPUT_DIR = Path(__file__).parent.parent / "frontend" / "lib" / "data" / "culinary_dictionaries"
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-# Dictionnaire de traduction manuel pour les termes courants
-TRANSLATIONS = {
-    'en': {
-        'fr': {
-            'chicken': 'poulet', 'beef': 'bœuf', 'pork': 'porc', 'lamb': 'agneau',
-            'salmon': 'saumon', 'tuna': 'thon', 'cod': 'morue', 'fish': 'poisson',
-            'tomato': 'tomate', 'onion': 'oignon', 'garlic': 'ail', 'carrot': 'carotte',
-            'potato': 'pomme de terre', 'pepper': 'poivron', 'rice': 'riz', 'pasta': 'pâtes',
-            'bread': 'pain', 'cheese': 'fromage', 'milk': 'lait', 'egg': 'œuf',
-            'salt': 'sel', 'pepper': 'poivre', 'oil': 'huile', 'butter': 'beurre',
-            'soup': 'soupe', 'salad': 'salade', 'curry': 'curry', 'stew': 'ragoût',
-            'burger': 'burger', 'pizza': 'pizza', 'cake': 'gâteau', 'pie': 'tarte',
-        },
-        'es': {
-            'chicken': 'pollo', 'beef': 'carne de res', 'pork': 'cerdo', 'lamb': 'cordero',
-            'salmon': 'salmón', 'tuna': 'atún', 'cod': 'bacalao', 'fish': 'pescado',
-            'tomato': 'tomate', 'onion': 'cebolla', 'garlic': 'ajo', 'carrot': 'zanahoria',
-            'potato': 'patata', 'pepper': 'pimiento', 'rice': 'arroz', 'pasta': 'pasta',
-            'bread': 'pan', 'cheese': 'queso', 'milk': 'leche', 'egg': 'huevo',
-            'salt': 'sal', 'pepper': 'pimienta', 'oil': 'aceite', 'butter': 'mantequilla',
-            'soup': 'sopa', 'salad': 'ensalada', 'curry': 'curry', 'stew': 'estofado',
-            'burger': 'hamburguesa', 'pizza': 'pizza', 'cake': 'pastel', 'pie': 'tarta',
-        }
-    }
-}
+from adaptive_sampler import sample_ingredients
+from async_fetcher import fetch_all
+from dictionary_store import open_store
+from lexicon import load_lexicon
+from mealdb_sync import load_catalog, meal_ingredients, sync_catalog
 
 def translate_term(term, target_lang):
     """Traduit un terme en utilisant le dictionnaire de traduction"""
-    term_lower = term.lower().strip()
-    
-    # Chercher dans les traductions manuelles
-    if target_lang == 'fr' and term_lower in TRANSLATIONS['en']['fr']:
-        return TRANSLATIONS['en']['fr'][term_lower]
-    elif target_lang == 'es' and term_lower in TRANSLATIONS['en']['es']:
-        return TRANSLATIONS['en']['es'][term_lower]
-    
-    # Si pas de traduction, retourner le terme original
-    return term
+    # Chercher dans les mots du lexique partagé, sinon retourner le terme original
+    return load_lexicon().word(term, target_lang, term)
 
 def fetch_all_ingredients():
     """Récupère tous les ingrédients depuis TheMealDB"""
     print("📥 Téléchargement de tous les ingrédients depuis TheMealDB...")
     
-    ingredients = set()
-    
-    # Récupérer des recettes aléatoires pour extraire les ingrédients
-    print("   Récupération de 100 recettes aléatoires...")
-    for i in range(100):
-        if (i + 1) % 10 == 0:
-            print(f"   Progression: {i + 1}/100...")
-        
-        try:
-            response = requests.get(f"{THEMEALDB_API}/random.php", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if 'meals' in data and data['meals']:
-                    meal = data['meals'][0]
-                    # Extraire tous les ingrédients
-                    for j in range(1, 21):
-                        ingredient_key = f'strIngredient{j}'
-                        if ingredient_key in meal and meal[ingredient_key]:
-                            ingredient = meal[ingredient_key].strip()
-                            if ingredient:
-                                ingredients.add(ingredient)
-            time.sleep(0.2)  # Éviter de surcharger l'API
-        except Exception as e:
-            print(f"   ⚠️  Erreur lors de la récupération: {e}")
-            continue
+    # Recettes aléatoires tirées jusqu'à ce que les nouveaux ingrédients se raréfient
+    print("   Récupération de recettes aléatoires (arrêt quand la découverte ralentit)...")
+    ingredients, report = sample_ingredients()
     
-    print(f"✅ {len(ingredients)} ingrédients uniques trouvés")
+    print(f"✅ {len(ingredients)} ingrédients uniques trouvés en {report['draws']} tirages")
+    print(f"   Couverture estimée: {report['coverage']:.1%} "
+          f"(gain attendu {report['expected_gain']:.2f} ingrédient/requête)")
     return sorted(ingredients)
 
 def fetch_all_recipe_names():
@@ -96,24 +40,31 @@ def fetch_all_recipe_names():
     # Récupérer par catégorie
     categories = ['Beef', 'Chicken', 'Dessert', 'Lamb', 'Miscellaneous', 'Pasta', 'Pork', 'Seafood', 'Side', 'Starter', 'Vegan', 'Vegetarian', 'Breakfast', 'Goat']
     
-    for category in categories:
-        print(f"   Récupération des recettes de la catégorie: {category}...")
-        try:
-            response = requests.get(f"{THEMEALDB_API}/filter.php?c={category}", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if 'meals' in data:
-                    for meal in data['meals']:
-                        if 'strMeal' in meal:
-                            recipe_names.add(meal['strMeal'])
-            time.sleep(0.2)
-        except Exception as e:
-            print(f"   ⚠️  Erreur pour {category}: {e}")
+    print(f"   Récupération des recettes de {len(categories)} catégories...")
+    responses = fetch_all([f"filter.php?c={category}" for category in categories], timeout=5)
+    for category, data in zip(categories, responses):
+        if isinstance(data, Exception):
+            print(f"   ⚠️  Erreur pour {category}: {data}")
             continue
+        if data:
+            if 'meals' in data:
+                for meal in data['meals']:
+                    if 'strMeal' in meal:
+                        recipe_names.add(meal['strMeal'])
     
     print(f"✅ {len(recipe_names)} noms de recettes trouvés")
     return sorted(recipe_names)
 
+def fetch_synced_catalog():
+    """Ingrédients et noms de recettes de tout le catalogue (synchronisation avec reprise)"""
+    meals = sync_catalog()
+    ingredients = set(load_catalog()['ingredients'])
+    for meal in meals.values():
+        ingredients.update(meal_ingredients(meal))
+    recipe_names = {meal['strMeal'] for meal in meals.values() if meal.get('strMeal')}
+    print(f"✅ {len(ingredients)} ingrédients et {len(recipe_names)} noms de recettes")
+    return sorted(ingredients), sorted(recipe_names)
+
 def build_ingredients_dictionary(ingredients):
     """Construit le dictionnaire d'ingrédients"""
     print("📚 Construction du dictionnaire d'ingrédients...")
@@ -166,9 +117,12 @@ def main():
     print("🚀 Construction du dictionnaire culinaire complet...")
     print("")
     
-    # Récupérer les données
-    ingredients = fetch_all_ingredients()
-    recipe_names = fetch_all_recipe_names()
+    # Récupérer les données (catalogue complet avec --sync, sinon échantillon aléatoire)
+    if '--sync' in sys.argv:
+        ingredients, recipe_names = fetch_synced_catalog()
+    else:
+        ingredients = fetch_all_ingredients()
+        recipe_names = fetch_all_recipe_names()
     
     print("")
     
@@ -176,21 +130,21 @@ def main():
     ingredients_dict = build_ingredients_dictionary(ingredients)
     recipe_names_dict = build_recipe_names_dictionary(recipe_names)
     
-    # Sauvegarder
-    ingredients_file = OUTPUT_DIR / "ingredients_fr_en_es.json"
-    recipe_names_file = OUTPUT_DIR / "recipe_names_fr_en_es.json"
-    
-    with open(ingredients_file, 'w', encoding='utf-8') as f:
-        json.dump(ingredients_dict, f, ensure_ascii=False, indent=2)
+    # Sauvegarder (reconstruction complète : le fichier n'est réécrit que si son contenu change)
+    ingredients_store = open_store('ingredients')
+    recipe_names_store = open_store('recipe_names')
     
-    with open(recipe_names_file, 'w', encoding='utf-8') as f:
-        json.dump(recipe_names_dict, f, ensure_ascii=False, indent=2)
+    for store, dictionary in ((ingredients_store, ingredients_dict),
+                              (recipe_names_store, recipe_names_dict)):
+        store.metadata.update(dictionary["metadata"])
+        store.replace(dictionary[store.section])
+        store.compact()
     
     print("")
     print("✅ Dictionnaires créés avec succès !")
-    print(f"   📁 {ingredients_file}")
+    print(f"   📁 {ingredients_store.json_file}")
     print(f"      - {len(ingredients)} ingrédients")
-    print(f"   📁 {recipe_names_file}")
+    print(f"   📁 {recipe_names_store.json_file}")
     print(f"      - {len(recipe_names)} noms de recettes")
     print("")
     print("💡 Note: Les traductions automatiques sont basiques.")
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Format binaire compilé des dictionnaires culinaires, lu par mmap
+
+Les trois dictionnaires JSON sont compilés dans un seul fichier :
+une table de clés triées, des colonnes par langue (en, fr, es) et un pool
+de chaînes UTF-8 partagé et dédupliqué. Le lecteur ouvre le fichier avec mmap
+et fait une recherche dichotomique sans construire de dict Python, donc le
+démarrage et la mémoire ne dépendent plus de la taille des dictionnaires.
+
+Disposition du fichier (entiers non signés 32 bits little-endian) :
+    en-tête      : magic 'CCD1', version, nombre de sections, nombre de langues
+    langues      : (offset, longueur) du code de chaque langue dans le pool
+    sections     : (offset nom, longueur nom, nombre d'entrées, offset colonnes,
+                    nombre maximal de mots d'une clé)
+    colonnes     : par section, 1 + nb_langues colonnes de n couples (offset, longueur),
+                   la première colonne étant la clé, triée par octets UTF-8
+    pool         : chaînes UTF-8 concaténées
+
+Usage:
+    python3 scripts/translation/compiled_dictionary.py build
+    python3 scripts/translation/compiled_dictionary.py lookup ingredients "olive oil"
+"""
+
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from dictionary_store import DICTIONARIES, WORK_DIR, DictionaryStore, atomic_write, open_store
+from phrase_trie import tokenize_phrase
+
+COMPILED_FILE = WORK_DIR / 'culinary_dictionaries.bin'
+MAGIC = b'CCD1'
+FORMAT_VERSION = 2
+LANGUAGES = ('en', 'fr', 'es')
+
+_HEADER = struct.Struct('<4sIII')
+_PAIR = struct.Struct('<II')
+_SECTION = struct.Struct('<IIIII')
+
+
+def _source_files() -> List[Path]:
+    """Fichiers dont dépend l'artefact compilé (JSON + journaux en attente)"""
+    files = []
+    for json_file, _ in DICTIONARIES.values():
+        files.append(json_file)
+        files.append(WORK_DIR / f"{json_file.name}.journal")
+    return files
+
+
+def is_stale(compiled_file: Path = COMPILED_FILE) -> bool:
+    """Vrai si l'artefact est absent ou plus ancien qu'une des sources"""
+    if not compiled_file.exists():
+        return True
+    compiled_mtime = compiled_file.stat().st_mtime_ns
+    return any(source.exists() and source.stat().st_mtime_ns > compiled_mtime
+               for source in _source_files())
+
+
+class _StringPool:
+    """Pool de chaînes UTF-8 dédupliquées"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.offsets: Dict[bytes, int] = {}
+
+    def add(self, text: str) -> Tuple[int, int]:
+        data = text.encode('utf-8')
+        offset = self.offsets.get(data)
+        if offset is None:
+            offset = len(self.buffer)
+            self.offsets[data] = offset
+            self.buffer += data
+        return offset, len(data)
+
+
+def compile_dictionaries(stores: Optional[Dict[str, DictionaryStore]] = None,
+                         compiled_file: Path = COMPILED_FILE) -> Path:
+    """Compile les dictionnaires (journal inclus) dans le fichier binaire"""
+    if stores is None:
+        stores = {name: open_store(name) for name in DICTIONARIES}
+
+    pool = _StringPool()
+    language_refs = [pool.add(lang) for lang in LANGUAGES]
+
+    sections = []
+    for name, store in stores.items():
+        name_ref = pool.add(name)
+        # Les alias d'une entrée fusionnée (near_duplicates.py) pointent vers sa traduction
+        aliases = [(alias, store.entries[key]) for alias, key in store.aliases().items()]
+        rows = sorted(((key.encode('utf-8'), key, value) for key, value in [*store.items(), *aliases]),
+                      key=lambda row: row[0])
+        columns = [bytearray() for _ in range(1 + len(LANGUAGES))]
+        for _, key, value in rows:
+            columns[0] += _PAIR.pack(*pool.add(key))
+            for i, lang in enumerate(LANGUAGES, start=1):
+                columns[i] += _PAIR.pack(*pool.add(value.get(lang, '') or ''))
+        # Longueur maximale d'une clé en mots : borne la recherche du trie (attach_dictionary)
+        max_words = max((len(tokenize_phrase(key)) for _, key, _ in rows), default=0)
+        sections.append((name_ref, len(rows), max_words, b''.join(columns)))
+
+    header_size = (_HEADER.size + _PAIR.size * len(LANGUAGES)
+                   + _SECTION.size * len(sections))
+    out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), len(LANGUAGES)))
+    for ref in language_refs:
+        out += _PAIR.pack(*ref)
+
+    # Les offsets du pool sont relatifs au début du pool, placé après les colonnes
+    columns_offset = header_size
+    for name_ref, count, max_words, columns in sections:
+        out += _SECTION.pack(name_ref[0], name_ref[1], count, columns_offset, max_words)
+        columns_offset += len(columns)
+    for _, _, _, columns in sections:
+        out += columns
+    out += pool.buffer
+
+    atomic_write(compiled_file, bytes(out))
+    return compiled_file
+
+
+class CompiledSection:
+    """Vue en lecture seule d'un dictionnaire compilé"""
+
+    def __init__(self, parent: 'CompiledDictionary', name: str, count: int, columns_offset: int,
+                 max_words: int):
+        self._mm = parent._mm
+        self._pool = parent._pool_offset
+        self.languages = parent.languages
+        self.name = name
+        self.count = count
+        self.max_words = max_words
+        self._column_size = count * _PAIR.size
+        self._columns_offset = columns_offset
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _ref(self, column: int, index: int) -> Tuple[int, int]:
+        return _PAIR.unpack_from(self._mm, self._columns_offset
+                                 + column * self._column_size + index * _PAIR.size)
+
+    def _bytes(self, column: int, index: int) -> bytes:
+        offset, length = self._ref(column, index)
+        start = self._pool + offset
+        return self._mm[start:start + length]
+
+    def key_at(self, index: int) -> str:
+        return self._bytes(0, index).decode('utf-8')
+
+    def value_at(self, index: int, lang: str) -> str:
+        return self._bytes(1 + self.languages.index(lang), index).decode('utf-8')
+
+    def find(self, key: str) -> int:
+        """Index de la clé (recherche dichotomique), -1 si absente"""
+        target = key.encode('utf-8')
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self._bytes(0, mid)
+            if current < target:
+                lo = mid + 1
+            elif current > target:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) >= 0
+
+    def get(self, key: str, default=None) -> Optional[Dict[str, str]]:
+        index = self.find(key)
+        if index < 0:
+            return default
+        return {lang: self.value_at(index, lang) for lang in self.languages}
+
+    def lookup(self, key: str, lang: str) -> Optional[str]:
+        index = self.find(key)
+        return self.value_at(index, lang) if index >= 0 else None
+
+    def keys(self) -> Iterator[str]:
+        for index in range(self.count):
+            yield self.key_at(index)
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        for index in range(self.count):
+            yield self.key_at(index), {lang: self.value_at(index, lang)
+                                       for lang in self.languages}
+
+
+class CompiledDictionary:
+    """Lecteur mmap du fichier compilé"""
+
+    def __init__(self, compiled_file: Path = COMPILED_FILE):
+        self.path = Path(compiled_file)
+        self._file = open(self.path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, section_count, language_count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Format de dictionnaire compilé invalide: {self.path}")
+
+        offset = _HEADER.size
+        language_refs = []
+        for _ in range(language_count):
+            language_refs.append(_PAIR.unpack_from(self._mm, offset))
+            offset += _PAIR.size
+        raw_sections = []
+        for _ in range(section_count):
+            raw_sections.append(_SECTION.unpack_from(self._mm, offset))
+            offset += _SECTION.size
+        columns_end = offset + sum(count * _PAIR.size * (1 + language_count)
+                                   for _, _, count, _, _ in raw_sections)
+        self._pool_offset = columns_end
+
+        self.languages = tuple(self._pool_string(*ref) for ref in language_refs)
+        self.sections: Dict[str, CompiledSection] = {}
+        for name_offset, name_length, count, columns_offset, max_words in raw_sections:
+            name = self._pool_string(name_offset, name_length)
+            self.sections[name] = CompiledSection(self, name, count, columns_offset, max_words)
+
+    def _pool_string(self, offset: int, length: int) -> str:
+        start = self._pool_offset + offset
+        return self._mm[start:start + length].decode('utf-8')
+
+    def __getitem__(self, name: str) -> CompiledSection:
+        return self.sections[name]
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_compiled(compiled_file: Path = COMPILED_FILE, rebuild: bool = True) -> CompiledDictionary:
+    """
+    Ouvre l'artefact compilé, en le reconstruisant si une source JSON est plus récente
+    ou s'il a été écrit dans une version précédente du format
+    """
+    if rebuild and is_stale(compiled_file):
+        compile_dictionaries(compiled_file=compiled_file)
+    try:
+        return CompiledDictionary(compiled_file)
+    except ValueError:
+        if not rebuild:
+            raise
+    compile_dictionaries(compiled_file=compiled_file)
+    return CompiledDictionary(compiled_file)
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'build':
+        path = compile_dictionaries()
+        with CompiledDictionary(path) as compiled:
+            for name, section in compiled.sections.items():
+                print(f"📚 {name}: {len(section)} entrées")
+        print(f"✅ Dictionnaire compilé: {path} ({path.stat().st_size} octets)")
+    elif command == 'lookup' and len(sys.argv) == 4:
+        with load_compiled() as compiled:
+            entry = compiled[sys.argv[2]].get(sys.argv[3].lower().strip())
+        if entry:
+            print(f"  EN: {entry['en']}\n  FR: {entry['fr']}\n  ES: {entry['es']}")
+        else:
+            print(f"❌ '{sys.argv[3]}' introuvable dans {sys.argv[2]}")
+            sys.exit(1)
+    else:
+        print(f"Usage: {sys.argv[0]} build | lookup <section> <clé>")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
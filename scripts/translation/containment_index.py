@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Index de containment sur les clés d'un dictionnaire
+
+Répond à "cette expression est-elle égale à une clé connue, contenue dans une clé
+ou contient-elle une clé ?" (containment de sous-chaînes, comme le test
+`a == b or a in b or b in a` qu'il remplace) sans parcourir toutes les clés :
+  - clés contenues dans l'expression : automate d'Aho-Corasick sur toutes les clés
+    (keyword_rules.KeywordAutomaton), un seul passage sur l'expression
+  - clés contenant l'expression : listes de postings par trigramme de caractères,
+    intersectées en commençant par la plus courte, puis vérifiées
+Les clés trouvées sont retournées pour permettre de fusionner au lieu d'ignorer.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from keyword_rules import KeywordAutomaton
+
+GRAM_SIZE = 3
+
+
+def _grams(text: str) -> Set[str]:
+    if len(text) < GRAM_SIZE:
+        return {text}
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class ContainmentIndex:
+    """Index des clés (comparées en minuscules) pour les tests d'égalité et de containment"""
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._originals: Dict[str, List[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._automaton: Optional[KeywordAutomaton] = None
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self._originals)
+
+    def add(self, key: str):
+        normalized = key.lower()
+        originals = self._originals.setdefault(normalized, [])
+        if key in originals:
+            return
+        originals.append(key)
+        if len(originals) > 1:
+            return
+        if len(normalized) >= GRAM_SIZE:
+            for gram in _grams(normalized):
+                self._postings.setdefault(gram, set()).add(normalized)
+        # L'automate est reconstruit au prochain test "contient une clé"
+        self._automaton = None
+
+    def _keys(self, normalized: Iterable[str]) -> List[str]:
+        return [original for key in normalized for original in self._originals[key]]
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def equal(self, phrase: str) -> List[str]:
+        """Clés égales à l'expression"""
+        return list(self._originals.get(phrase.lower(), ()))
+
+    def containing(self, phrase: str) -> List[str]:
+        """Clés qui contiennent l'expression"""
+        phrase = phrase.lower()
+        if len(phrase) < GRAM_SIZE:
+            # Expressions très courtes : vérification directe
+            return self._keys(key for key in self._originals if phrase in key)
+        postings = sorted((self._postings.get(gram, set()) for gram in _grams(phrase)), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        return self._keys(sorted(key for key in candidates if phrase in key))
+
+    def contained_in(self, phrase: str) -> List[str]:
+        """Clés contenues dans l'expression"""
+        phrase = phrase.lower()
+        if self._automaton is None:
+            self._automaton = KeywordAutomaton(sorted(self._originals))
+        found = self._automaton.find_all(phrase)
+        if '' in self._originals:
+            found.add('')
+        return self._keys(sorted(found))
+
+    def matches(self, phrase: str) -> List[str]:
+        """Toutes les clés égales, contenant ou contenues dans l'expression (sans doublon)"""
+        seen = set()
+        result = []
+        for key in self.containing(phrase) + self.contained_in(phrase):
+            if key not in seen:
+                seen.add(key)
+                result.append(key)
+        return result
+
+    def __contains__(self, phrase: str) -> bool:
+        """Vrai si l'expression est égale à, contenue dans ou contient une clé connue"""
+        normalized = phrase.lower()
+        if normalized in self._originals:
+            return True
+        return bool(self.contained_in(normalized) or self.containing(normalized))
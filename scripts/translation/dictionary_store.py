@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Stockage partagé des dictionnaires culinaires (ingrédients, noms de recettes, instructions)
+
+Chaque dictionnaire est chargé une seule fois par processus. Les entrées modifiées
+sont ajoutées à un journal (JSON Lines) au lieu de réécrire tout le fichier JSON,
+et le JSON n'est compacté que sur demande ou quand le journal dépasse un seuil.
+La compaction est ignorée si le contenu (hash SHA-256) n'a pas changé.
+
+Usage:
+    python3 scripts/translation/dictionary_store.py compact   # Réécrit les JSON
+    python3 scripts/translation/dictionary_store.py status    # Affiche les journaux en attente
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DICTIONARIES_DIR = PROJECT_ROOT / 'frontend' / 'lib' / 'data' / 'culinary_dictionaries'
+INGREDIENTS_FILE = DICTIONARIES_DIR / 'ingredients_fr_en_es.json'
+RECIPE_NAMES_FILE = DICTIONARIES_DIR / 'recipe_names_fr_en_es.json'
+INSTRUCTIONS_FILE = DICTIONARIES_DIR / 'instructions_fr_en_es.json'
+
+# Les artefacts de travail (journaux, caches...) ne doivent pas finir dans les
+# assets Flutter : tout le dossier culinary_dictionaries est embarqué dans l'app.
+WORK_DIR = PROJECT_ROOT / 'data' / 'culinary_dictionaries'
+
+# Nom logique -> (fichier JSON, clé de la section d'entrées)
+DICTIONARIES = {
+    'ingredients': (INGREDIENTS_FILE, 'ingredients'),
+    'recipe_names': (RECIPE_NAMES_FILE, 'recipe_names'),
+    'instructions': (INSTRUCTIONS_FILE, 'instructions'),
+}
+
+# Nombre d'opérations journalisées avant une compaction automatique
+COMPACT_THRESHOLD = 1000
+
+
+def content_hash(data: bytes) -> str:
+    """Hash SHA-256 d'un contenu"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def serialize_dictionary(data: Dict) -> bytes:
+    """Sérialise un dictionnaire au format des fichiers JSON du projet"""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def atomic_write(file_path: Path, payload: bytes):
+    """Écrit un fichier de manière atomique (fichier temporaire + rename)"""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+
+
+class DictionaryStore:
+    """Dictionnaire JSON avec suivi des entrées modifiées et journal d'écritures"""
+
+    def __init__(self, json_file: Path, section: str,
+                 journal_dir: Path = WORK_DIR,
+                 compact_threshold: int = COMPACT_THRESHOLD):
+        self.json_file = Path(json_file)
+        self.section = section
+        self.journal_file = Path(journal_dir) / f"{self.json_file.name}.journal"
+        self.compact_threshold = compact_threshold
+        self.data: Dict = {}
+        self._snapshot: Dict[str, Dict] = {}
+        self._metadata_snapshot: Dict = {}
+        self._file_hash: Optional[str] = None
+        self._journal_ops = 0
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Chargement
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """Charge le JSON puis rejoue le journal en attente"""
+        if self.json_file.exists():
+            raw = self.json_file.read_bytes()
+            self._file_hash = content_hash(raw)
+            self.data = json.loads(raw.decode('utf-8'))
+        else:
+            self._file_hash = None
+            self.data = {
+                "metadata": {
+                    "version": "1.0.0",
+                    "source": "Manual improvements",
+                    "languages": ["en", "fr", "es"],
+                    "total_terms": 0,
+                    "last_updated": datetime.now().strftime("%Y-%m-%d")
+                },
+                self.section: {}
+            }
+        self.data.setdefault("metadata", {})
+        self.data.setdefault(self.section, {})
+        self._journal_ops = self._replay_journal()
+        self._take_snapshot()
+
+    def _replay_journal(self) -> int:
+        """Rejoue les opérations du journal sur les données chargées"""
+        if not self.journal_file.exists():
+            return 0
+        entries = self.entries
+        metadata = self.metadata
+        ops = 0
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Dernière ligne tronquée (interruption pendant l'écriture)
+                    break
+                op = record.get('op')
+                if op == 'base':
+                    if self._file_hash and record.get('sha256') != self._file_hash:
+                        print(f"⚠️  {self.json_file.name} a changé depuis le début du journal, "
+                              f"rejeu des modifications par-dessus")
+                    continue
+                if op == 'set':
+                    entries[record['key']] = record['value']
+                elif op == 'del':
+                    entries.pop(record['key'], None)
+                elif op == 'meta':
+                    metadata[record['key']] = record['value']
+                ops += 1
+        return ops
+
+    def _take_snapshot(self):
+        self._snapshot = {key: dict(value) if isinstance(value, dict) else value
+                          for key, value in self.entries.items()}
+        self._metadata_snapshot = dict(self.metadata)
+
+    # ------------------------------------------------------------------
+    # Accès aux entrées
+    # ------------------------------------------------------------------
+
+    @property
+    def entries(self) -> Dict[str, Dict]:
+        return self.data[self.section]
+
+    @property
+    def metadata(self) -> Dict:
+        return self.data["metadata"]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str, default=None):
+        return self.entries.get(key, default)
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        return iter(self.entries.items())
+
+    def aliases(self) -> Dict[str, str]:
+        """{alias: clé canonique} des entrées fusionnées par near_duplicates.py (champ "aliases")"""
+        return {alias: key for key, value in self.entries.items() if isinstance(value, dict)
+                for alias in value.get('aliases', ()) if alias not in self.entries}
+
+    def known_keys(self) -> List[str]:
+        """Clés des entrées et de leurs alias : une clé fusionnée n'est pas une clé nouvelle"""
+        return [*self.entries, *self.aliases()]
+
+    def set(self, key: str, value: Dict):
+        self.entries[key] = value
+
+    def update(self, new_entries: Dict[str, Dict]):
+        self.entries.update(new_entries)
+
+    def delete(self, key: str):
+        self.entries.pop(key, None)
+
+    def replace(self, new_entries: Dict[str, Dict]):
+        """Remplace toutes les entrées (reconstruction complète)"""
+        self.data[self.section] = new_entries
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+
+    def dirty_keys(self) -> Tuple[List[str], List[str]]:
+        """Retourne (clés ajoutées/modifiées, clés supprimées) depuis le dernier point de sauvegarde"""
+        entries = self.entries
+        snapshot = self._snapshot
+        changed = [key for key, value in entries.items() if snapshot.get(key) != value]
+        removed = [key for key in snapshot if key not in entries]
+        return changed, removed
+
+    def _dirty_metadata(self) -> List[str]:
+        return [key for key, value in self.metadata.items()
+                if self._metadata_snapshot.get(key) != value]
+
+    def is_dirty(self) -> bool:
+        changed, removed = self.dirty_keys()
+        return bool(changed or removed or self._dirty_metadata())
+
+    def save(self, update_metadata: bool = True) -> int:
+        """
+        Journalise les entrées modifiées. Compacte le JSON si le seuil est atteint.
+        Retourne le nombre d'opérations écrites dans le journal.
+        """
+        changed, removed = self.dirty_keys()
+        if update_metadata and (changed or removed):
+            self.metadata["total_terms"] = len(self.entries)
+        meta_changed = self._dirty_metadata()
+        if not (changed or removed or meta_changed):
+            return 0
+
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        new_journal = not self.journal_file.exists() or self.journal_file.stat().st_size == 0
+        entries = self.entries
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            if new_journal:
+                f.write(json.dumps({"op": "base", "sha256": self._file_hash}) + "\n")
+            for key in changed:
+                f.write(json.dumps({"op": "set", "key": key, "value": entries[key]},
+                                   ensure_ascii=False) + "\n")
+            for key in removed:
+                f.write(json.dumps({"op": "del", "key": key}, ensure_ascii=False) + "\n")
+            for key in meta_changed:
+                f.write(json.dumps({"op": "meta", "key": key, "value": self.metadata[key]},
+                                   ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        written = len(changed) + len(removed) + len(meta_changed)
+        self._journal_ops += written
+        self._take_snapshot()
+
+        if self._journal_ops >= self.compact_threshold:
+            self.compact()
+        return written
+
+    def compact(self) -> bool:
+        """
+        Réécrit le fichier JSON complet et vide le journal.
+        Retourne False si le contenu était déjà identique (aucune écriture).
+        """
+        payload = serialize_dictionary(self.data)
+        new_hash = content_hash(payload)
+        written = False
+        if new_hash != self._file_hash:
+            atomic_write(self.json_file, payload)
+            self._file_hash = new_hash
+            written = True
+        if self.journal_file.exists():
+            self.journal_file.unlink()
+        self._journal_ops = 0
+        self._take_snapshot()
+        return written
+
+    @property
+    def pending_operations(self) -> int:
+        return self._journal_ops
+
+
+_STORES: Dict[Path, DictionaryStore] = {}
+
+
+def open_store(name: str) -> DictionaryStore:
+    """Retourne le store partagé d'un dictionnaire ('ingredients', 'recipe_names', 'instructions')"""
+    json_file, section = DICTIONARIES[name]
+    store = _STORES.get(json_file)
+    if store is None:
+        store = DictionaryStore(json_file, section)
+        _STORES[json_file] = store
+    return store
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'status'
+    if command not in ('compact', 'status'):
+        print(f"Usage: {sys.argv[0]} [compact|status]")
+        sys.exit(1)
+
+    for name in DICTIONARIES:
+        store = open_store(name)
+        if command == 'status':
+            print(f"📚 {name}: {len(store)} entrées, "
+                  f"{store.pending_operations} opération(s) en attente dans le journal")
+        elif store.compact():
+            print(f"✅ {name}: {store.json_file.name} réécrit")
+        else:
+            print(f"✓ {name}: aucun changement, fichier conservé")
+
+
+if __name__ == '__main__':
+    main()
@@ -153,6 +153,8 @@ echo "   Pour un dictionnaire vraiment complet, vous pouvez:"
 echo "   1. Utiliser l'API TheMealDB pour récupérer toutes les recettes"
 echo "   2. Extraire automatiquement tous les ingrédients"
 echo "   3. Utiliser un service de traduction pour les traductions"
+echo "   4. Importer un glossaire existant (CSV/TSV/TBX):"
+echo "      python3 scripts/translation/glossary_importer.py glossaire.tbx"
 echo ""
 echo "📁 Fichiers créés dans: $DICT_DIR"
 
@@ -4,27 +4,18 @@ Script pour extraire les ingrédients mentionnés dans les instructions des rece
 et les ajouter au dictionnaire s'ils n'y sont pas déjà
 """
 
-import json
 import re
-import requests
-import time
+import sys
 from pathlib import Path
 
-# Dictionnaire de traductions pour les ingrédients courants trouvés dans les instructions
-INGREDIENT_TRANSLATIONS = {
-    "panko breadcrumbs": {"fr": "Chapelure panko", "es": "Pan rallado panko"},
-    "breadcrumbs": {"fr": "Chapelure", "es": "Pan rallado"},
-    "panko": {"fr": "Panko", "es": "Panko"},
-    "cornstarch": {"fr": "Fécule de maïs", "es": "Maicena"},
-    "corn starch": {"fr": "Fécule de maïs", "es": "Maicena"},
-    "baking powder": {"fr": "Levure chimique", "es": "Polvo de hornear"},
-    "baking soda": {"fr": "Bicarbonate de soude", "es": "Bicarbonato de sodio"},
-    "vanilla extract": {"fr": "Extrait de vanille", "es": "Extracto de vainilla"},
-    "olive oil": {"fr": "Huile d'olive", "es": "Aceite de oliva"},
-    "vegetable oil": {"fr": "Huile végétale", "es": "Aceite vegetal"},
-    "cooking spray": {"fr": "Vaporisateur de cuisson", "es": "Spray de cocción"},
-    "nonstick spray": {"fr": "Vaporisateur antiadhésif", "es": "Spray antiadherente"},
-}
+from async_fetcher import fetch_all
+from containment_index import ContainmentIndex
+from dictionary_store import open_store
+from extraction_watermark import ExtractionWatermark
+from lexicon import load_lexicon
+from streaming_extraction import (corpus_option, counter_options, extract_stream, iter_counts, iter_meals,
+                                  print_peak_memory)
+from translation_cache import source_version
 
 def extract_ingredient_like_words(text):
     """Extrait les mots qui ressemblent à des ingrédients du texte"""
@@ -71,75 +62,66 @@ def extract_ingredient_like_words(text):
 
 def fetch_recipes_from_themealdb(num_recipes=50):
     """Récupère des recettes depuis TheMealDB"""
-    base_url = "https://www.themealdb.com/api/json/v1/1"
     recipes = []
     
     print(f"📥 Récupération de {num_recipes} recettes depuis TheMealDB...")
     
-    # Récupérer des recettes aléatoires
-    for i in range(0, num_recipes, 10):
-        try:
-            url = f"{base_url}/random.php"
-            # Récupérer 10 recettes aléatoires (on fait plusieurs appels)
-            for _ in range(min(10, num_recipes - i)):
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('meals'):
-                        recipes.extend(data['meals'])
-                time.sleep(0.5)  # Éviter de surcharger l'API
-        except Exception as e:
-            print(f"⚠️  Erreur lors de la récupération: {e}")
+    # Récupérer des recettes aléatoires (un appel par recette)
+    for data in fetch_all([("random.php", i) for i in range(num_recipes)]):
+        if isinstance(data, Exception):
+            print(f"⚠️  Erreur lors de la récupération: {data}")
             continue
+        if data and data.get('meals'):
+            recipes.extend(data['meals'])
     
     print(f"✅ {len(recipes)} recettes récupérées")
     return recipes
 
 def main():
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    json_file = project_root / "frontend" / "lib" / "data" / "culinary_dictionaries" / "ingredients_fr_en_es.json"
+    store = open_store('ingredients')
     
-    if not json_file.exists():
-        print(f"❌ Fichier non trouvé: {json_file}")
+    if not store.json_file.exists():
+        print(f"❌ Fichier non trouvé: {store.json_file}")
         return
     
-    # Lire le dictionnaire existant
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    existing_ingredients = set(data.get("ingredients", {}).keys())
+    existing_ingredients = ContainmentIndex(store.known_keys())
     print(f"📚 {len(existing_ingredients)} ingrédients déjà dans le dictionnaire")
     
-    # Récupérer des recettes
-    recipes = fetch_recipes_from_ingredients_api()
-    
-    # Extraire les ingrédients des instructions
-    found_ingredients = set()
-    for recipe in recipes:
-        instructions = recipe.get('strInstructions', '')
-        if instructions:
-            ingredients = extract_ingredient_like_words(instructions)
-            found_ingredients.update(ingredients)
-    
-    print(f"🔍 {len(found_ingredients)} ingrédients potentiels trouvés dans les instructions")
+    # Récupérer des recettes (corpus JSONL local lu en flux, ou API TheMealDB)
+    corpus_file = corpus_option(sys.argv)
+    recipes = iter_meals(corpus_file) if corpus_file else fetch_recipes_from_ingredients_api()
+    
+    # Ne traiter que les recettes nouvelles ou modifiées depuis la dernière exécution (--full : toutes).
+    # Le support d'un candidat se compte sur tout le corpus : avec --min-support N > 1,
+    # toutes les recettes sont relues et aucune n'est marquée (un candidat sous le seuil
+    # serait sinon perdu avec les recettes déjà traitées)
+    candidate_counts, min_support = counter_options(sys.argv)
+    watermark = ExtractionWatermark('v1', source_version(Path(__file__)))
+    incremental = min_support <= 1
+    if '--full' in sys.argv:
+        watermark.reset()
+    if incremental:
+        recipes = watermark.pending(recipes)
+    
+    # Extraire les ingrédients (par morceaux sur un pool de processus ; mémoire bornée avec --memory-budget)
+    candidate_counts = extract_stream(recipes, extract_ingredient_like_words, counts=candidate_counts)
+    if watermark.skipped:
+        print(f"⏭️  {watermark.skipped} recettes déjà traitées ignorées")
     
     # Filtrer ceux qui ne sont pas déjà dans le dictionnaire
+    lexicon = load_lexicon()
     new_ingredients = {}
-    for ingredient in found_ingredients:
+    found_ingredients = 0
+    # Candidats cités dans au moins min_support instructions (--min-support, 1 par défaut)
+    for ingredient, _ in iter_counts(candidate_counts, min_support):
+        found_ingredients += 1
         ingredient_lower = ingredient.lower().strip()
         
         # Vérifier si déjà présent (avec variations)
-        is_present = False
-        for existing in existing_ingredients:
-            if ingredient_lower in existing.lower() or existing.lower() in ingredient_lower:
-                is_present = True
-                break
-        
-        if not is_present:
-            # Chercher dans les traductions prédéfinies
-            if ingredient_lower in INGREDIENT_TRANSLATIONS:
-                translations = INGREDIENT_TRANSLATIONS[ingredient_lower]
+        if ingredient_lower not in existing_ingredients:
+            # Chercher dans le lexique partagé
+            translations = lexicon.phrase(ingredient_lower)
+            if translations:
                 new_ingredients[ingredient_lower] = {
                     "en": ingredient,
                     "fr": translations["fr"],
@@ -153,24 +135,26 @@ def main():
                     "es": ingredient.title()   # À améliorer manuellement
                 }
     
+    print(f"🔍 {found_ingredients} ingrédients potentiels trouvés dans les instructions")
+    print_peak_memory(candidate_counts)
+    
     if new_ingredients:
-        # Ajouter au dictionnaire
-        data["ingredients"].update(new_ingredients)
-        data["metadata"]["total_terms"] = len(data["ingredients"])
-        
-        # Sauvegarder
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Ajouter au dictionnaire (seules les nouvelles entrées sont journalisées)
+        store.update(new_ingredients)
+        store.save()
         
         print(f"\n✅ {len(new_ingredients)} nouveaux ingrédients ajoutés:")
         for ing, trans in new_ingredients.items():
             print(f"   - {ing}: FR={trans['fr']}, ES={trans['es']}")
     else:
         print("\n✅ Aucun nouvel ingrédient trouvé")
+    
+    # Les recettes traitées sont marquées une fois le dictionnaire enregistré
+    if incremental:
+        watermark.commit()
 
 def fetch_recipes_from_ingredients_api():
     """Récupère des recettes en utilisant différents ingrédients comme recherche"""
-    base_url = "https://www.themealdb.com/api/json/v1/1"
     recipes = []
     
     # Ingrédients variés pour obtenir des recettes diverses
@@ -181,17 +165,11 @@ def fetch_recipes_from_ingredients_api():
     
     print(f"📥 Récupération de recettes depuis TheMealDB...")
     
-    for term in search_terms:
-        try:
-            url = f"{base_url}/search.php?s={term}"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('meals'):
-                    recipes.extend(data['meals'][:5])  # Limiter à 5 par terme
-            time.sleep(0.3)
-        except Exception as e:
+    for data in fetch_all([f"search.php?s={term}" for term in search_terms]):
+        if isinstance(data, Exception):
             continue
+        if data and data.get('meals'):
+            recipes.extend(data['meals'][:5])  # Limiter à 5 par terme
     
     # Dédupliquer par ID
     seen_ids = set()
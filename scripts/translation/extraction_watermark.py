@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Filigrane d'extraction : recettes déjà traitées par un extracteur
+
+Pour chaque extracteur, data/culinary_dictionaries/extraction_<nom>.state garde
+une ligne par recette traitée (idMeal + empreinte de strInstructions), sous un
+en-tête contenant la version de l'extracteur :
+    # version 3f2a9c0d41b7e5aa
+    52772\t9c1e4b7a02d3f6e8
+Une exécution ne traite que les recettes nouvelles ou dont les instructions ont
+changé ; un changement de version de l'extracteur les rend toutes à traiter. Les
+nouvelles lignes sont ajoutées en fin de fichier une fois le dictionnaire
+enregistré ; le fichier est réécrit quand la version change ou quand les lignes
+remplacées dépassent les lignes utiles.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from dictionary_store import WORK_DIR, atomic_write
+
+HEADER_PREFIX = '# version '
+
+
+def instructions_hash(instructions: str) -> str:
+    return hashlib.blake2b(instructions.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class ExtractionWatermark:
+    """Recettes déjà traitées par une version donnée d'un extracteur"""
+
+    def __init__(self, name: str, version: str, state_dir: Path = WORK_DIR):
+        self.version = version
+        self.state_file = Path(state_dir) / f"extraction_{name}.state"
+        self.processed: Dict[str, str] = {}
+        self.skipped = 0
+        self._pending: List[Tuple[str, str]] = []
+        self._lines = 0
+        self._stale_file = False
+        self._load()
+
+    def _load(self):
+        if not self.state_file.exists():
+            self._stale_file = True
+            return
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            header = f.readline().rstrip('\n')
+            if header != f"{HEADER_PREFIX}{self.version}":
+                # Nouvelle version de l'extracteur : tout est à retraiter
+                self._stale_file = True
+                return
+            for line in f:
+                meal_id, sep, digest = line.rstrip('\n').partition('\t')
+                if sep and digest:
+                    self.processed[meal_id] = digest
+                    self._lines += 1
+
+    def reset(self):
+        """Oublie les recettes traitées : elles seront toutes retraitées puis réenregistrées"""
+        self.processed.clear()
+        self._stale_file = True
+
+    def pending(self, meals: Iterable[Dict]) -> Iterator[Dict]:
+        """Recettes nouvelles ou modifiées (celles sans idMeal sont toujours traitées)"""
+        for meal in meals:
+            meal_id = meal.get('idMeal')
+            instructions = meal.get('strInstructions') or ''
+            if meal_id is None:
+                yield meal
+                continue
+            digest = instructions_hash(instructions)
+            if self.processed.get(meal_id) == digest:
+                self.skipped += 1
+                continue
+            self.processed[meal_id] = digest
+            self._pending.append((meal_id, digest))
+            yield meal
+
+    def commit(self) -> int:
+        """Enregistre les recettes traitées depuis le dernier commit ; retourne leur nombre"""
+        count = len(self._pending)
+        if not count and not self._stale_file:
+            return 0
+        self._lines += count
+        if self._stale_file or self._lines > 2 * len(self.processed):
+            lines = [f"{HEADER_PREFIX}{self.version}\n"]
+            lines.extend(f"{meal_id}\t{digest}\n" for meal_id, digest in self.processed.items())
+            atomic_write(self.state_file, ''.join(lines).encode('utf-8'))
+            self._lines = len(self.processed)
+            self._stale_file = False
+        else:
+            with open(self.state_file, 'a', encoding='utf-8') as f:
+                f.writelines(f"{meal_id}\t{digest}\n" for meal_id, digest in self._pending)
+        self._pending = []
+        return count
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Index approché des clés du dictionnaire (fautes de frappe, pluriels mal écrits)
+
+Index SymSpell : chaque clé est enregistrée sous toutes ses variantes obtenues en
+supprimant jusqu'à max_distance caractères. Une recherche génère les suppressions
+du terme cherché, récupère les clés qui partagent une variante et vérifie chaque
+candidate avec la distance de Damerau-Levenshtein (transpositions adjacentes
+comprises, arrêt dès que la borne est dépassée). Deux chaînes à distance k
+partagent toujours une variante à k suppressions au plus de chaque côté, donc
+aucune clé n'est manquée.
+
+La distance acceptée dépend de la longueur de la clé (allowed_distance) : aucune
+tolérance pour les mots courts ("peas" / "pears"), 1 puis 2 pour les expressions.
+KnownEntries ne reprend automatiquement une traduction que pour une variante
+d'orthographe à une faute près (lettre ajoutée, retirée ou inversée, jamais
+remplacée, ni préfixe ou mot ajouté : "unsalted" n'est pas "salted") ; au-delà,
+une clé proche n'est que suggérée (improve_translations.py).
+
+Usage:
+    python3 scripts/translation/fuzzy_index.py lookup "skirty steak" ["tinned tomatos" ...]
+    python3 scripts/translation/fuzzy_index.py bench
+"""
+
+import random
+import sys
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from dictionary_store import open_store
+
+MAX_DISTANCE = 2
+# Distance maximale pour reprendre une traduction sans relecture
+AUTO_REUSE_DISTANCE = 1
+LANGS = ('fr', 'es')
+
+
+def allowed_distance(text: str) -> int:
+    """Nombre de fautes tolérées pour une clé de cette longueur"""
+    if len(text) <= 5:
+        return 0
+    if len(text) <= 11:
+        return 1
+    return 2
+
+
+def damerau_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """Distance de Damerau-Levenshtein (alignement optimal), ou max_distance + 1 si elle est dépassée"""
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    # Seule la bande |i - j| <= max_distance peut rester sous la borne
+    over = max_distance + 1
+    previous2: List[int] = []
+    previous = [min(j, over) for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        current[0] = min(i, over)
+        row_min = current[0]
+        char = a[i - 1]
+        for j in range(max(1, i - max_distance), min(len(b), i + max_distance) + 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != b[j - 1]))
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = min(value, over)
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return over
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _deletes(text: str, distance: int) -> Set[str]:
+    variants = {text}
+    frontier = {text}
+    for _ in range(distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants |= frontier
+    return variants
+
+
+class FuzzyIndex:
+    """Index SymSpell des clés (comparées telles quelles, donc déjà en minuscules)"""
+
+    def __init__(self, keys: Iterable[str] = (), max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.keys: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._variants: Dict[str, List[int]] = {}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    def add(self, key: str):
+        if key in self._ids:
+            return
+        key_id = self._ids[key] = len(self.keys)
+        self.keys.append(key)
+        for variant in _deletes(key, self.max_distance):
+            self._variants.setdefault(variant, []).append(key_id)
+
+    def lookup(self, term: str, max_distance: Optional[int] = None) -> List[Tuple[int, str]]:
+        """(distance, clé) des clés à max_distance au plus de term, les plus proches d'abord"""
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        candidates: Set[int] = set()
+        for variant in _deletes(term, max_distance):
+            candidates.update(self._variants.get(variant, ()))
+        matches = []
+        for key_id in candidates:
+            key = self.keys[key_id]
+            distance = damerau_levenshtein(term, key, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, key))
+        matches.sort()
+        return matches
+
+    def lookup_many(self, terms: Iterable[str], max_distance: Optional[int] = None) -> Dict[str, List[Tuple[int, str]]]:
+        """lookup() pour un lot de termes (chaque terme distinct n'est cherché qu'une fois)"""
+        return {term: self.lookup(term, max_distance) for term in dict.fromkeys(terms)}
+
+
+def _at_word_start(longer: str, shorter: str, size: int) -> bool:
+    """Vrai si shorter est longer privé d'un bloc de size caractères placé en début de mot ou contenant un espace"""
+    for i in range(len(shorter) + 1):
+        if longer[:i] + longer[i + size:] == shorter and (i == 0 or longer[i - 1] == ' ' or ' ' in longer[i:i + size]):
+            return True
+    return False
+
+
+def is_spelling_variant(a: str, b: str, distance: int) -> bool:
+    """
+    Vrai si a et b (à distance distance) ne diffèrent que par des lettres ajoutées
+    ou retirées ("tomatos", "skirty") ou une inversion de deux lettres voisines :
+    un remplacement donne trop souvent un autre mot ("custard" / "mustard"), un
+    préfixe ou un mot ajouté aussi ("salted" / "unsalted").
+    """
+    if distance == abs(len(a) - len(b)):
+        longer, shorter = (a, b) if len(a) > len(b) else (b, a)
+        return not _at_word_start(longer, shorter, distance)
+    if distance != 1 or len(a) != len(b):
+        return False
+    diff = [i for i in range(len(a)) if a[i] != b[i]]
+    return len(diff) == 2 and diff[1] == diff[0] + 1 and a[diff[0]] == b[diff[1]]
+
+
+def is_translated(key: str, value: Mapping[str, str]) -> bool:
+    en = (value.get('en') or key).strip().lower()
+    return all((value.get(lang) or '').strip().lower() not in ('', en) for lang in LANGS)
+
+
+class KnownEntries:
+    """Entrées déjà traduites d'un dictionnaire, retrouvables à partir d'une clé mal orthographiée"""
+
+    def __init__(self, entries: Mapping[str, Mapping[str, str]]):
+        self.values: Dict[str, Dict[str, str]] = {}
+        for key, value in entries.items():
+            if is_translated(key, value):
+                self.values[key] = dict(value)
+        self.index = FuzzyIndex(self.values)
+
+    def nearest(self, key: str, max_distance: int = AUTO_REUSE_DISTANCE) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        (clé connue, entrée) la plus proche dans la tolérance de la clé (et à
+        max_distance au plus), None si aucune ou ambiguë
+        """
+        limit = min(allowed_distance(key), max_distance)
+        matches = [(distance, match) for distance, match in self.index.lookup(key, limit)
+                   if match != key and allowed_distance(match) >= distance
+                   and is_spelling_variant(key, match, distance)]
+        if not matches:
+            return None
+        best = matches[0][0]
+        closest = [match for distance, match in matches if distance == best]
+        # Deux clés aussi proches avec des traductions différentes : on ne choisit pas
+        if len({tuple(self.values[match].get(lang, '') for lang in LANGS) for match in closest}) > 1:
+            return None
+        return closest[0], self.values[closest[0]]
+
+    def nearest_many(self, keys: Iterable[str], max_distance: int = AUTO_REUSE_DISTANCE
+                     ) -> Dict[str, Tuple[str, Dict[str, str]]]:
+        """nearest() pour un lot de clés ; seules les clés avec une entrée proche sont retournées"""
+        found = {}
+        for key in dict.fromkeys(keys):
+            match = self.nearest(key, max_distance)
+            if match is not None:
+                found[key] = match
+        return found
+
+
+def _typo(text: str, rng: random.Random) -> str:
+    i = rng.randrange(len(text))
+    edit = rng.choice(('delete', 'insert', 'replace', 'swap'))
+    if edit == 'delete':
+        return text[:i] + text[i + 1:]
+    if edit == 'insert':
+        return text[:i] + rng.choice('abcdefghijklmnopqrstuvwxyz') + text[i:]
+    if edit == 'replace':
+        return text[:i] + rng.choice('abcdefghijklmnopqrstuvwxyz') + text[i + 1:]
+    return text[:i] + text[i + 1:i + 2] + text[i:i + 1] + text[i + 2:]
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'bench'
+    keys = list(open_store('ingredients').entries) + list(open_store('recipe_names').entries)
+    start = time.perf_counter()
+    index = FuzzyIndex(keys)
+    built = time.perf_counter() - start
+
+    if command == 'lookup' and len(sys.argv) > 2:
+        for term, matches in index.lookup_many(term.lower().strip() for term in sys.argv[2:]).items():
+            found = ', '.join(f"{key} ({distance})" for distance, key in matches[:5]) or 'aucune clé proche'
+            print(f"🔎 {term}: {found}")
+    elif command == 'bench':
+        rng = random.Random(0)
+        queries = [_typo(rng.choice(keys), rng) for _ in range(2000)]
+        start = time.perf_counter()
+        results = index.lookup_many(queries)
+        elapsed = time.perf_counter() - start
+        found = sum(1 for matches in results.values() if matches)
+        print(f"⚡ {len(index)} clés indexées en {built:.2f}s ({len(index._variants)} variantes)")
+        print(f"   {len(results)} recherches: {elapsed / len(results) * 1e6:.0f} µs par recherche, "
+              f"{found} avec au moins une clé à distance ≤ {index.max_distance}")
+    else:
+        print(f"Usage: {sys.argv[0]} lookup <terme>... | bench")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
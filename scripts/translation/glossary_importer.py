@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Import de glossaires culinaires externes (CSV, TSV, TBX) dans ingredients_fr_en_es.json
+
+Le glossaire est lu ligne à ligne (csv) ou entrée par entrée (TBX lu avec
+iterparse, les entrées lues étant détachées de la racine) : la mémoire ne dépend
+pas du nombre d'entrées déjà lues. Chaque terme anglais donne la clé (minuscules, espaces
+normalisés) ; les traductions fr/es sont fusionnées par lots dans les entrées
+existantes selon la priorité choisie :
+  - existing (défaut) : une traduction existante est conservée, le glossaire ne
+    fait que compléter les langues manquantes
+  - glossary : les traductions du glossaire remplacent celles du dictionnaire
+Les colonnes CSV/TSV sont reconnues par leur en-tête (en, fr, es, english,
+français, spanish...) ou données avec --columns en,fr,es.
+
+Une fusion de plus de COMPACT_THRESHOLD entrées réécrit le JSON une seule fois
+au lieu de journaliser chaque entrée.
+
+Usage:
+    python3 scripts/translation/glossary_importer.py glossaire.csv [--priority existing|glossary]
+        [--columns en,fr,es] [--dry-run]
+"""
+
+import csv
+import re
+import sys
+import time
+import unicodedata
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from dictionary_store import COMPACT_THRESHOLD, DictionaryStore, open_store
+
+LANGUAGES = ('en', 'fr', 'es')
+PRIORITIES = ('existing', 'glossary')
+BATCH_SIZE = 5000
+XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+# Noms de colonnes reconnus dans l'en-tête d'un CSV/TSV
+COLUMN_NAMES = {
+    'en': 'en', 'eng': 'en', 'english': 'en', 'anglais': 'en', 'inglés': 'en', 'ingles': 'en',
+    'fr': 'fr', 'fra': 'fr', 'fre': 'fr', 'french': 'fr', 'français': 'fr', 'francais': 'fr',
+    'es': 'es', 'spa': 'es', 'spanish': 'es', 'espagnol': 'es', 'español': 'es', 'espanol': 'es',
+}
+
+Record = Dict[str, str]
+
+
+def normalize_term(term: str) -> str:
+    if not term.isascii():
+        term = unicodedata.normalize('NFC', term)
+    return ' '.join(term.split())
+
+
+def _language(name: str) -> Optional[str]:
+    # "en-GB", "fr_FR", "English" -> en / fr
+    name = name.strip().lower()
+    return COLUMN_NAMES.get(name) or COLUMN_NAMES.get(re.split(r'[-_]', name)[0])
+
+
+def iter_delimited(path: Path, columns: Optional[List[str]] = None) -> Iterator[Record]:
+    """Termes d'un CSV/TSV ; la première ligne est l'en-tête sauf si columns est donné"""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if path.suffix.lower() in ('.tsv', '.tab'):
+            delimiter = '\t'
+        else:
+            sample = f.read(4096)
+            f.seek(0)
+            try:
+                delimiter = csv.Sniffer().sniff(sample, delimiters=',;\t').delimiter
+            except csv.Error:
+                delimiter = ','
+        reader = csv.reader(f, delimiter=delimiter)
+        if columns is None:
+            header = next(reader, [])
+            columns = [_language(name) or '' for name in header]
+        if 'en' not in columns:
+            raise ValueError(f"{path}: aucune colonne anglaise (en-tête ou --columns)")
+        for row in reader:
+            yield {lang: row[index] for index, lang in enumerate(columns) if lang and index < len(row)}
+
+
+def _is(tag: str, *names: str) -> bool:
+    """Vrai si le nom local de la balise (sans espace de noms) est l'un des noms"""
+    return tag.endswith(names) and tag.rsplit('}', 1)[-1] in names
+
+
+def iter_tbx(path: Path) -> Iterator[Record]:
+    """Termes d'un fichier TBX (termEntry/langSet en TBX 2, conceptEntry/langSec en TBX 3)"""
+    languages: Dict[str, Optional[str]] = {}
+    # Éléments ouverts (racine -> élément courant) : le parent d'une entrée est l'avant-dernier
+    open_elements: List[ET.Element] = []
+    for event, element in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            open_elements.append(element)
+            continue
+        open_elements.pop()
+        if not _is(element.tag, 'termEntry', 'conceptEntry'):
+            continue
+        record: Record = {}
+        for lang_set in element:
+            if not _is(lang_set.tag, 'langSet', 'langSec'):
+                continue
+            code = lang_set.get(XML_LANG) or lang_set.get('lang') or ''
+            if code not in languages:
+                languages[code] = _language(code)
+            lang = languages[code]
+            if not lang or lang in record:
+                continue
+            # Premier terme du langSet (term directement, dans tig ou dans ntig/termGrp)
+            term = next((node.text for node in lang_set.iter() if node.text and _is(node.tag, 'term')), None)
+            if term:
+                record[lang] = term
+        yield record
+        # Détache l'entrée lue de son parent (body) : vidée seulement, elle y resterait attachée
+        element.clear()
+        if open_elements:
+            open_elements[-1].remove(element)
+
+
+def iter_glossary(path: Path, columns: Optional[List[str]] = None) -> Iterator[Record]:
+    if path.suffix.lower() in ('.tbx', '.xml'):
+        return iter_tbx(path)
+    return iter_delimited(path, columns)
+
+
+def merge_entry(existing: Optional[Dict], record: Record, priority: str) -> Optional[Dict]:
+    """Nouvelle valeur d'une entrée (record normalisé), ou None si le glossaire ne change rien"""
+    if existing is None:
+        # Langue absente du glossaire : laissée vide pour les traducteurs et le remplissage LibreTranslate
+        return {lang: record[lang] for lang in LANGUAGES if record.get(lang)}
+    merged = dict(existing)
+    for lang in ('fr', 'es'):
+        value = record.get(lang)
+        current = (existing.get(lang) or '').strip()
+        # Une traduction identique à l'anglais est un repli, pas une vraie traduction
+        missing = not current or current.lower() == (existing.get('en') or '').strip().lower()
+        if value and (priority == 'glossary' or missing):
+            merged[lang] = value
+    return merged if merged != existing else None
+
+
+def import_glossary(records: Iterator[Record], store: DictionaryStore, priority: str = 'existing',
+                    batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    """
+    Fusionne les termes dans le store par lots (une passe, recherche par clé).
+    Retourne les compteurs (added, updated, unchanged, skipped).
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"priorité '{priority}' inconnue ({', '.join(PRIORITIES)})")
+    stats = {'added': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0}
+    entries = store.entries
+    aliases = store.aliases()
+    batch: Dict[str, Dict] = {}
+
+    for record in records:
+        record = {lang: normalize_term(term) for lang, term in record.items()}
+        key = record.get('en', '').lower()
+        # Un terme fusionné par near_duplicates.py complète son entrée canonique
+        key = aliases.get(key, key)
+        if not key or not (record.get('fr') or record.get('es')):
+            stats['skipped'] += 1
+            continue
+        # Un terme répété dans le glossaire se fusionne avec sa version du lot en cours
+        existing = batch.get(key, entries.get(key))
+        merged = merge_entry(existing, record, priority)
+        if merged is None:
+            stats['unchanged'] += 1
+            continue
+        stats['added' if key not in entries and key not in batch else 'updated'] += 1
+        batch[key] = merged
+        if len(batch) >= batch_size:
+            store.update(batch)
+            batch = {}
+    store.update(batch)
+    return stats
+
+
+def save_merged(store: DictionaryStore, changed: int):
+    """Journalise une petite fusion ; réécrit le JSON une seule fois pour une grosse"""
+    if changed >= COMPACT_THRESHOLD:
+        store.metadata['total_terms'] = len(store.entries)
+        store.compact()
+    else:
+        store.save()
+
+
+def _option(argv: List[str], name: str) -> Optional[str]:
+    if name not in argv:
+        return None
+    index = argv.index(name) + 1
+    if index >= len(argv):
+        print(f"❌ {name} attend une valeur")
+        sys.exit(1)
+    return argv[index]
+
+
+def main():
+    args = sys.argv[1:]
+    priority = _option(args, '--priority') or 'existing'
+    columns = _option(args, '--columns')
+    if not args or args[0].startswith('--') or priority not in PRIORITIES:
+        print(f"Usage: {sys.argv[0]} glossaire.(csv|tsv|tbx) [--priority existing|glossary] "
+              f"[--columns en,fr,es] [--dry-run]")
+        sys.exit(1)
+    path = Path(args[0])
+    if not path.exists():
+        print(f"❌ Fichier non trouvé: {path}")
+        sys.exit(1)
+
+    store = open_store('ingredients')
+    before = len(store)
+    start = time.perf_counter()
+    records = iter_glossary(path, [_language(name) or '' for name in columns.split(',')] if columns else None)
+    try:
+        stats = import_glossary(records, store, priority)
+    except (ValueError, ET.ParseError) as error:
+        print(f"❌ {error}")
+        sys.exit(1)
+    print(f"📥 {path.name}: {stats['added']} ajoutés, {stats['updated']} mis à jour, "
+          f"{stats['unchanged']} inchangés, {stats['skipped']} ignorés "
+          f"({time.perf_counter() - start:.1f}s, priorité {priority})")
+    if '--dry-run' in args:
+        print("ℹ️  --dry-run : dictionnaire non modifié")
+        return
+    save_merged(store, stats['added'] + stats['updated'])
+    print(f"✅ {before} → {len(store)} ingrédients dans {store.json_file.name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,13 +4,14 @@ Outil interactif pour améliorer les traductions des recettes
 Permet d'ajouter, modifier et tester les traductions d'instructions
 """
 
-import json
-import os
 import sys
-from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, List
 
+from dictionary_store import open_store
+from fuzzy_index import FuzzyIndex, allowed_distance
+from instruction_index import InstructionIndex
+
 # Couleurs pour le terminal
 GREEN = '\033[0;32m'
 YELLOW = '\033[1;33m'
@@ -18,78 +19,76 @@ BLUE = '\033[0;34m'
 RED = '\033[0;31m'
 NC = '\033[0m'  # No Color
 
-PROJECT_ROOT = Path(__file__).parent.parent
-DICTIONARIES_DIR = PROJECT_ROOT / 'frontend' / 'lib' / 'data' / 'culinary_dictionaries'
-INSTRUCTIONS_FILE = DICTIONARIES_DIR / 'instructions_fr_en_es.json'
-INGREDIENTS_FILE = DICTIONARIES_DIR / 'ingredients_fr_en_es.json'
-RECIPE_NAMES_FILE = DICTIONARIES_DIR / 'recipe_names_fr_en_es.json'
+# Backend SQLite optionnel (--sqlite) : recherche et statistiques via les index
+BACKEND = None
 
+# Index inversé des instructions (construit à la première recherche, mis à jour à chaque ajout)
+_INSTRUCTION_INDEX: Optional[InstructionIndex] = None
+_INDEXED_ENTRIES: Optional[Dict] = None
 
-def load_json_file(file_path: Path) -> Dict:
-    """Charge un fichier JSON"""
-    if not file_path.exists():
-        return {}
+# Index SymSpell des ingrédients (construit à la première faute de frappe, mis à jour à chaque ajout)
+_INGREDIENT_INDEX: Optional[FuzzyIndex] = None
+_INDEXED_INGREDIENTS: Optional[Dict] = None
+
+# Score relatif minimal pour proposer une instruction similaire
+MIN_SIMILARITY = 0.3
+
+def load_dictionary(name: str) -> Dict:
+    """Charge un dictionnaire via le store partagé (chargé une seule fois par session)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return open_store(name).data
     except Exception as e:
-        print(f"{RED}❌ Erreur lors du chargement de {file_path}: {e}{NC}")
+        print(f"{RED}❌ Erreur lors du chargement du dictionnaire {name}: {e}{NC}")
         return {}
 
 
-def save_json_file(file_path: Path, data: Dict):
-    """Sauvegarde un fichier JSON avec formatage"""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def save_dictionary(name: str, key: Optional[str] = None):
+    """Journalise les entrées modifiées d'un dictionnaire (et les recopie dans SQLite)"""
+    store = open_store(name)
+    store.save(update_metadata=False)
+    if name == 'ingredients' and key is not None and _INDEXED_INGREDIENTS is store.entries:
+        _INGREDIENT_INDEX.add(key)
+    if BACKEND is not None and key is not None:
+        BACKEND.upsert(name, key, store.get(key))
 
 
 def init_instructions_file():
     """Initialise le fichier d'instructions s'il n'existe pas"""
-    if not INSTRUCTIONS_FILE.exists():
-        data = {
-            "metadata": {
-                "version": "1.0.0",
-                "source": "Manual improvements",
-                "languages": ["en", "fr", "es"],
-                "total_terms": 0,
-                "last_updated": datetime.now().strftime("%Y-%m-%d")
-            },
-            "instructions": {}
-        }
-        save_json_file(INSTRUCTIONS_FILE, data)
+    store = open_store('instructions')
+    if not store.json_file.exists():
+        store.compact()
         print(f"{GREEN}✅ Fichier d'instructions créé{NC}")
-    return load_json_file(INSTRUCTIONS_FILE)
+    return store.data
 
 
-def normalize_text(text: str) -> str:
-    """Normalise un texte pour la recherche (minuscules, sans accents)"""
-    import unicodedata
-    # Enlever les accents
-    text = unicodedata.normalize('NFD', text.lower().strip())
-    text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
-    return text
+def instruction_index(instructions: Dict) -> InstructionIndex:
+    """Index des instructions du store partagé (construit une seule fois par session)"""
+    global _INSTRUCTION_INDEX, _INDEXED_ENTRIES
+    if _INSTRUCTION_INDEX is None or _INDEXED_ENTRIES is not instructions:
+        _INSTRUCTION_INDEX = InstructionIndex((key, key) for key in instructions)
+        _INDEXED_ENTRIES = instructions
+    return _INSTRUCTION_INDEX
+
+
+def ingredient_index(ingredients: Dict) -> FuzzyIndex:
+    """Index SymSpell des clés d'ingrédients, construit une seule fois par session"""
+    global _INGREDIENT_INDEX, _INDEXED_INGREDIENTS
+    if _INGREDIENT_INDEX is None or _INDEXED_INGREDIENTS is not ingredients:
+        _INGREDIENT_INDEX = FuzzyIndex(ingredients)
+        _INDEXED_INGREDIENTS = ingredients
+    return _INGREDIENT_INDEX
 
 
 def find_similar_instructions(instructions_data: Dict, search_text: str, limit: int = 5) -> List[tuple]:
-    """Trouve des instructions similaires"""
-    search_normalized = normalize_text(search_text)
-    similar = []
-    
-    for key, translations in instructions_data.get('instructions', {}).items():
-        key_normalized = normalize_text(key)
-        # Calculer une similarité simple (nombre de mots communs)
-        search_words = set(search_normalized.split())
-        key_words = set(key_normalized.split())
-        common_words = search_words & key_words
-        if common_words:
-            similarity = len(common_words) / max(len(search_words), len(key_words))
-            if similarity > 0.3:  # Au moins 30% de similarité
-                similar.append((similarity, key, translations))
-    
-    # Trier par similarité décroissante
-    similar.sort(reverse=True, key=lambda x: x[0])
-    return similar[:limit]
+    """Trouve des instructions similaires (BM25 sur l'index inversé)"""
+    instructions = instructions_data.get('instructions', {})
+    if instructions is open_store('instructions').entries:
+        index = instruction_index(instructions)
+    else:
+        # Candidats déjà filtrés (ex. par FTS5) : petit index temporaire
+        index = InstructionIndex((key, key) for key in instructions)
+    return [(similarity, key, instructions[key]) for similarity, key in index.search(search_text, limit)
+            if similarity > MIN_SIMILARITY]
 
 
 def add_instruction_translation():
@@ -141,7 +140,9 @@ def add_instruction_translation():
     instructions_data['metadata']['total_terms'] = len(instructions_data['instructions'])
     instructions_data['metadata']['last_updated'] = datetime.now().strftime("%Y-%m-%d")
     
-    save_json_file(INSTRUCTIONS_FILE, instructions_data)
+    save_dictionary('instructions', original.lower())
+    if _INSTRUCTION_INDEX is not None and _INDEXED_ENTRIES is instructions_data['instructions']:
+        _INSTRUCTION_INDEX.add(original.lower(), original.lower())
     print(f"\n{GREEN}✅ Traduction sauvegardée!{NC}")
 
 
@@ -158,7 +159,10 @@ def search_instructions():
         return
     
     # Recherche exacte
-    found = instructions_data.get('instructions', {}).get(search.lower())
+    if BACKEND is not None:
+        found = BACKEND.get('instructions', search.lower())
+    else:
+        found = instructions_data.get('instructions', {}).get(search.lower())
     if found:
         print(f"\n{GREEN}✓ Trouvé (correspondance exacte):{NC}")
         print(f"  EN: {found.get('en', search)}")
@@ -167,11 +171,15 @@ def search_instructions():
         return
     
     # Recherche partielle
-    matches = []
-    search_lower = search.lower()
-    for key, translations in instructions_data.get('instructions', {}).items():
-        if search_lower in key or search_lower in translations.get('en', '').lower():
-            matches.append((key, translations))
+    if BACKEND is not None:
+        matches = [(key, translations) for _, key, translations
+                   in BACKEND.search('instructions', search, limit=10)]
+    else:
+        matches = []
+        search_lower = search.lower()
+        for key, translations in instructions_data.get('instructions', {}).items():
+            if search_lower in key or search_lower in translations.get('en', '').lower():
+                matches.append((key, translations))
     
     if matches:
         print(f"\n{GREEN}✓ {len(matches)} résultat(s) trouvé(s):{NC}")
@@ -181,7 +189,12 @@ def search_instructions():
             print(f"     ES: {trans.get('es', '')}")
     else:
         # Recherche similaire
-        similar = find_similar_instructions(instructions_data, search)
+        if BACKEND is not None:
+            candidates = {key: translations for _, key, translations
+                          in BACKEND.search('instructions', search, limit=50, match_all=False)}
+            similar = find_similar_instructions({'instructions': candidates}, search)
+        else:
+            similar = find_similar_instructions(instructions_data, search)
         if similar:
             print(f"\n{YELLOW}⚠ Aucune correspondance exacte, mais voici des instructions similaires:{NC}")
             for similarity, key, trans in similar:
@@ -214,7 +227,7 @@ def list_all_instructions():
 
 def improve_ingredient_translation():
     """Améliore une traduction d'ingrédient"""
-    ingredients_data = load_json_file(INGREDIENTS_FILE)
+    ingredients_data = load_dictionary('ingredients')
     
     print(f"\n{BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{NC}")
     print(f"{BLUE}🍅 Améliorer une traduction d'ingrédient{NC}")
@@ -228,6 +241,14 @@ def improve_ingredient_translation():
         ingredients_data['ingredients'] = {}
     
     existing = ingredients_data['ingredients'].get(ingredient)
+    if not existing:
+        # Faute de frappe probable ("tinned tomatos") : proposer la clé connue la plus proche
+        matches = ingredient_index(ingredients_data['ingredients']).lookup(ingredient, allowed_distance(ingredient))
+        if matches:
+            response = input(f"{YELLOW}Vouliez-vous dire '{matches[0][1]}'? (o/n): {NC}").strip().lower()
+            if response == 'o':
+                ingredient = matches[0][1]
+                existing = ingredients_data['ingredients'][ingredient]
     if existing:
         print(f"\n{GREEN}✓ Ingrédient existant:{NC}")
         print(f"  EN: {existing.get('en', ingredient)}")
@@ -255,23 +276,29 @@ def improve_ingredient_translation():
     ingredients_data['metadata']['total_terms'] = len(ingredients_data['ingredients'])
     ingredients_data['metadata']['last_updated'] = datetime.now().strftime("%Y-%m-%d")
     
-    save_json_file(INGREDIENTS_FILE, ingredients_data)
+    save_dictionary('ingredients', ingredient)
     print(f"\n{GREEN}✅ Traduction sauvegardée!{NC}")
 
 
 def show_statistics():
     """Affiche les statistiques des dictionnaires"""
     instructions_data = init_instructions_file()
-    ingredients_data = load_json_file(INGREDIENTS_FILE)
-    recipe_names_data = load_json_file(RECIPE_NAMES_FILE)
+    ingredients_data = load_dictionary('ingredients')
+    recipe_names_data = load_dictionary('recipe_names')
     
     print(f"\n{BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{NC}")
     print(f"{BLUE}📊 Statistiques des dictionnaires{NC}")
     print(f"{BLUE}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{NC}\n")
     
-    instructions_count = len(instructions_data.get('instructions', {}))
-    ingredients_count = len(ingredients_data.get('ingredients', {}))
-    recipe_names_count = len(recipe_names_data.get('recipe_names', {}))
+    if BACKEND is not None:
+        counts = BACKEND.statistics()
+        instructions_count = counts['instructions']['count']
+        ingredients_count = counts['ingredients']['count']
+        recipe_names_count = counts['recipe_names']['count']
+    else:
+        instructions_count = len(instructions_data.get('instructions', {}))
+        ingredients_count = len(ingredients_data.get('ingredients', {}))
+        recipe_names_count = len(recipe_names_data.get('recipe_names', {}))
     
     print(f"  📝 Instructions: {GREEN}{instructions_count}{NC}")
     print(f"  🍅 Ingrédients: {GREEN}{ingredients_count}{NC}")
@@ -287,6 +314,13 @@ def show_statistics():
 
 def main():
     """Menu principal"""
+    global BACKEND
+    if '--sqlite' in sys.argv:
+        from sqlite_dictionary import SqliteDictionary
+        BACKEND = SqliteDictionary()
+        BACKEND.sync_all()
+        print(f"{GREEN}✓ Backend SQLite actif: {BACKEND.database_file}{NC}")
+    
     while True:
         print(f"\n{GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{NC}")
         print(f"{GREEN}🌍 Amélioration des Traductions de Recettes{NC}")
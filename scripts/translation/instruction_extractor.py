@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Extracteur compilé des ingrédients cités dans les instructions de recettes
+
+Produit exactement les mêmes candidats que l'ancienne version à base de regex
+(22 motifs connus + 2 regex construites par mot-clé, soit ~90 passages sur chaque
+texte), mais en deux passages :
+  - une alternative compilée pour les termes connus (soy sauce, baking powder...)
+  - un découpage en mots ASCII ([a-z]+), puis un automate au niveau des mots qui
+    reproduit les motifs "1 ou 2 mots + mot-clé" et "mot-clé + 1 ou 2 mots"
+    autour de chaque occurrence de mot-clé (y compris la règle des correspondances
+    sans chevauchement de re.finditer, mot-clé par mot-clé)
+
+Usage:
+    python3 scripts/translation/instruction_extractor.py bench
+    python3 scripts/translation/instruction_extractor.py bench recettes.jsonl
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+# Mots-clés qui indiquent un ingrédient
+INGREDIENT_KEYWORDS = [
+    'breadcrumbs', 'panko', 'cornstarch', 'corn starch', 'baking powder', 'baking soda',
+    'sauce', 'paste', 'oil', 'vinegar', 'wine', 'broth', 'stock', 'cream', 'butter',
+    'cheese', 'flour', 'sugar', 'salt', 'pepper', 'spice', 'herb', 'extract', 'spray',
+    'powder', 'soda', 'juice', 'milk', 'yogurt', 'tofu', 'tempeh', 'seitan'
+]
+
+# Mots composés connus (2-3 mots max)
+KNOWN_PATTERNS = [
+    r'\b(panko(?:\s+breadcrumbs?)?)\b',
+    r'\b(corn\s*starch)\b',
+    r'\b(baking\s+(?:powder|soda))\b',
+    r'\b(cooking\s+spray)\b',
+    r'\b(nonstick\s+spray)\b',
+    r'\b(soy\s+sauce)\b',
+    r'\b(oyster\s+sauce)\b',
+    r'\b(fish\s+sauce)\b',
+    r'\b(hoisin\s+sauce)\b',
+    r'\b(worcestershire\s+sauce)\b',
+    r'\b(hot\s+sauce)\b',
+    r'\b(sriracha)\b',
+    r'\b(tahini)\b',
+    r'\b(mirin)\b',
+    r'\b(sake)\b',
+    r'\b(rice\s+(?:wine|vinegar))\b',
+    r'\b(sesame\s+oil)\b',
+    r'\b(coconut\s+oil)\b',
+    r'\b(canola\s+oil)\b',
+    r'\b(vegetable\s+(?:broth|stock))\b',
+    r'\b(chicken\s+(?:broth|stock))\b',
+    r'\b(beef\s+(?:broth|stock))\b',
+]
+
+_RUN_RE = re.compile(r'[a-z]+')
+
+
+def _is_word_char(char: str) -> bool:
+    # Même définition que \w pour les motifs str
+    return char.isalnum() or char == '_'
+
+
+class InstructionExtractor:
+    """Extracteur précompilé : termes connus + groupes nominaux ancrés sur un mot-clé"""
+
+    def __init__(self, keywords: Iterable[str] = INGREDIENT_KEYWORDS,
+                 known_patterns: Iterable[str] = KNOWN_PATTERNS):
+        self.keywords = list(keywords)
+        # Les termes connus ne peuvent pas se chevaucher (premiers mots tous distincts) :
+        # une seule alternative donne la même union que des finditer séparés
+        self._known_re = re.compile('|'.join(known_patterns), re.IGNORECASE)
+        self._by_first: Dict[str, List[Tuple[str, Tuple[str, ...]]]] = {}
+        for keyword in self.keywords:
+            tokens = tuple(keyword.split(' '))
+            self._by_first.setdefault(tokens[0], []).append((keyword, tokens))
+
+    def extract(self, text: str) -> Set[str]:
+        """Candidats ingrédients trouvés dans le texte"""
+        text = text.lower()
+        found = set()
+
+        for match in self._known_re.finditer(text):
+            ingredient = match.group(0).strip()
+            if len(ingredient.split()) <= 3:  # Max 3 mots
+                found.add(ingredient)
+
+        spans = [match.span() for match in _RUN_RE.finditer(text)]
+        words = [text[start:end] for start, end in spans]
+        size = len(text)
+        count = len(spans)
+
+        def boundary_before(index: int) -> bool:
+            start = spans[index][0]
+            return start == 0 or not _is_word_char(text[start - 1])
+
+        def boundary_after(index: int) -> bool:
+            end = spans[index][1]
+            return end == size or not _is_word_char(text[end])
+
+        def space_after(index: int) -> bool:
+            # Le mot est suivi uniquement d'espaces puis d'un autre mot
+            return index + 1 < count and text[spans[index][1]:spans[index + 1][0]].isspace()
+
+        # Occurrences (premier mot, dernier mot) de chaque mot-clé
+        occurrences: Dict[str, List[Tuple[int, int]]] = {}
+        by_first = self._by_first
+        for index in [i for i, word in enumerate(words) if word in by_first]:
+            for keyword, tokens in by_first[words[index]]:
+                if len(tokens) == 1:
+                    occurrences.setdefault(keyword, []).append((index, index))
+                elif (index + 1 < count and words[index + 1] == tokens[1]
+                      and text[spans[index][1]:spans[index + 1][0]] == ' '):
+                    occurrences.setdefault(keyword, []).append((index, index + 1))
+
+        for keyword, keyword_occurrences in occurrences.items():
+            last_by_first = dict(keyword_occurrences)
+
+            # "1 ou 2 mots + mot-clé" : départs possibles 1 ou 2 mots avant une occurrence
+            starts = sorted({first - offset for first, _ in keyword_occurrences
+                             for offset in (1, 2) if first - offset >= 0})
+            resume = 0
+            for start in starts:
+                if spans[start][0] < resume or not boundary_before(start) or not space_after(start):
+                    continue
+                last = last_by_first.get(start + 2)
+                if last is not None and space_after(start + 1) and boundary_after(last):
+                    prefix = text[spans[start][0]:spans[start + 1][1]]
+                else:
+                    last = last_by_first.get(start + 1)
+                    if last is None or not boundary_after(last):
+                        continue
+                    prefix = words[start]
+                found.add(f"{prefix} {keyword}")
+                resume = spans[last][1]
+
+            # "mot-clé + 1 ou 2 mots"
+            resume = 0
+            for first, last in keyword_occurrences:
+                if spans[first][0] < resume or not boundary_before(first) or not space_after(last):
+                    continue
+                word = last + 1
+                if space_after(word) and boundary_after(word + 1):
+                    suffix = text[spans[word][0]:spans[word + 1][1]]
+                    resume = spans[word + 1][1]
+                elif boundary_after(word):
+                    suffix = words[word]
+                    resume = spans[word][1]
+                else:
+                    continue
+                found.add(f"{keyword} {suffix}")
+
+        return found
+
+
+EXTRACTOR = InstructionExtractor()
+
+
+def extract_real_ingredients(text: str) -> Set[str]:
+    """Extrait les VRAIS ingrédients du texte (pas des phrases)"""
+    return EXTRACTOR.extract(text)
+
+
+def extract_with_regexes(text: str) -> Set[str]:
+    """Implémentation d'origine (un passage par motif), gardée comme référence du benchmark"""
+    found = set()
+    text_lower = text.lower()
+
+    for pattern in KNOWN_PATTERNS:
+        for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+            ingredient = match.group(1).strip()
+            if len(ingredient.split()) <= 3:
+                found.add(ingredient)
+
+    for keyword in INGREDIENT_KEYWORDS:
+        for match in re.finditer(rf'\b([a-z]+(?:\s+[a-z]+)?)\s+{keyword}\b', text_lower):
+            prefix = match.group(1).strip()
+            if len(prefix.split()) <= 2:
+                found.add(f"{prefix} {keyword}")
+        for match in re.finditer(rf'\b{keyword}\s+([a-z]+(?:\s+[a-z]+)?)\b', text_lower):
+            suffix = match.group(1).strip()
+            if len(suffix.split()) <= 2:
+                found.add(f"{keyword} {suffix}")
+
+    return found
+
+
+# ----------------------------------------------------------------------
+# Benchmark
+# ----------------------------------------------------------------------
+
+def load_instructions(corpus_file: Path) -> List[str]:
+    """Instructions d'un fichier JSONL de recettes TheMealDB (un objet meal par ligne)"""
+    from streaming_extraction import iter_instructions, iter_meals
+
+    return list(iter_instructions(iter_meals(corpus_file)))
+
+
+def synthetic_instructions(count: int = 2000, seed: int = 42) -> List[str]:
+    """Corpus synthétique reproductible (verbes de cuisine, ingrédients, quantités, ponctuation)"""
+    from lexicon import load_lexicon
+
+    rng = random.Random(seed)
+    ingredients = sorted(load_lexicon().ingredients) + INGREDIENT_KEYWORDS
+    verbs = ['Add', 'Stir in', 'Mix the', 'Pour', 'Whisk together', 'Season with',
+             'Heat the', 'Drizzle', 'Combine', 'Fold in', 'Sprinkle', 'Brush with']
+    tails = ['and cook for 5 minutes.', 'until golden.', 'then set aside.', 'to taste.',
+             '(optional).', 'over medium heat;', 'and serve hot!', '- about 2 tbsp.']
+    texts = []
+    for _ in range(count):
+        sentences = []
+        for _ in range(rng.randint(4, 12)):
+            picked = rng.sample(ingredients, rng.randint(1, 3))
+            quantity = rng.choice(['', '2 tbsp ', '1/2 cup ', '200g ', 'a pinch of '])
+            sentences.append(f"{rng.choice(verbs)} {quantity}{', '.join(picked)} {rng.choice(tails)}")
+        texts.append('\r\n'.join(sentences) if rng.random() < 0.3 else ' '.join(sentences))
+    return texts
+
+
+def benchmark(texts: List[str], extract: Callable[[str], Set[str]], repeat: int = 3) -> float:
+    """Débit en instructions par seconde (meilleur de repeat passages)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            extract(text)
+        best = min(best, time.perf_counter() - start)
+    return len(texts) / best if best > 0 else float('inf')
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'bench'
+    if command != 'bench' or len(sys.argv) > 3:
+        print(f"Usage: {sys.argv[0]} bench [recettes.jsonl]")
+        sys.exit(1)
+
+    if len(sys.argv) == 3:
+        texts = load_instructions(Path(sys.argv[2]))
+        print(f"📚 {len(texts)} instructions chargées depuis {sys.argv[2]}")
+    else:
+        texts = synthetic_instructions()
+        print(f"📚 {len(texts)} instructions synthétiques")
+
+    mismatches = sum(1 for text in texts if extract_real_ingredients(text) != extract_with_regexes(text))
+    if mismatches:
+        print(f"❌ {mismatches} instruction(s) avec des candidats différents de la référence")
+        sys.exit(1)
+    print("✅ Candidats identiques à l'implémentation par regex")
+
+    compiled = benchmark(texts, extract_real_ingredients)
+    reference = benchmark(texts, extract_with_regexes)
+    print(f"⚡ Extracteur compilé : {compiled:,.0f} instructions/s")
+    print(f"🐢 Regex par mot-clé  : {reference:,.0f} instructions/s")
+    print(f"📈 Accélération : x{compiled / reference:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Index inversé des instructions pour la recherche d'instructions similaires
+
+Chaque instruction est découpée une seule fois en mots normalisés
+(text_utils.tokenize) ; l'index garde, pour chaque mot, les instructions qui le
+contiennent avec sa fréquence. Une recherche ne parcourt que les postings des mots
+de la requête, les note avec BM25 et garde les meilleures avec un tas (top-k) : le
+temps de réponse dépend des postings touchés, pas de la taille du dictionnaire.
+Les mots sont traités du plus rare au plus fréquent ; dès que les mots restants ne
+peuvent plus faire entrer une nouvelle instruction dans le top-k, leurs postings
+ne servent plus qu'à compléter les candidats déjà trouvés (élagage MaxScore).
+
+Le score affiché est le score BM25 rapporté à celui qu'obtiendrait une instruction
+identique à la requête (1.0 = mêmes mots).
+
+Usage:
+    python3 scripts/translation/instruction_index.py bench [nombre]
+"""
+
+import heapq
+import math
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from text_utils import tokenize
+
+# Paramètres BM25 usuels : saturation de la fréquence et normalisation par la longueur
+K1 = 1.2
+B = 0.75
+
+
+class InstructionIndex:
+    """Index inversé mot -> {clé: fréquence}, mis à jour entrée par entrée"""
+
+    def __init__(self, documents: Iterable[Tuple[str, str]] = ()):
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._terms: Dict[str, Tuple[str, ...]] = {}
+        self._total_length = 0
+        for key, text in documents:
+            self.add(key, text)
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._lengths
+
+    def add(self, key: str, text: str):
+        """Indexe (ou réindexe) une instruction"""
+        if key in self._lengths:
+            self.remove(key)
+        counts = Counter(tokenize(text))
+        for term, count in counts.items():
+            self.postings.setdefault(term, {})[key] = count
+        length = sum(counts.values())
+        self._lengths[key] = length
+        self._terms[key] = tuple(counts)
+        self._total_length += length
+
+    def remove(self, key: str):
+        for term in self._terms.pop(key, ()):
+            postings = self.postings[term]
+            del postings[key]
+            if not postings:
+                del self.postings[term]
+        self._total_length -= self._lengths.pop(key, 0)
+
+    def _idf(self, term: str) -> float:
+        frequency = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self._lengths) - frequency + 0.5) / (frequency + 0.5))
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[float, str]]:
+        """(score relatif, clé) des limit meilleures instructions, par score décroissant"""
+        query_counts = Counter(tokenize(query))
+        if not query_counts or not self._lengths or limit <= 0:
+            return []
+        average_length = self._total_length / len(self._lengths) or 1.0
+        terms = sorted(((self._idf(term), term) for term in query_counts if term in self.postings), reverse=True)
+        # Score maximal que peuvent encore apporter les mots restants (fréquence saturée)
+        remaining = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + terms[i][0] * (K1 + 1)
+
+        # Normalisation BM25 par longueur, calculée seulement pour les instructions
+        # atteintes par les postings (avec la longueur moyenne courante)
+        lengths = self._lengths
+        base, slope = K1 * (1 - B), K1 * B / average_length
+        scores: Dict[str, float] = {}
+        for i, (idf, term) in enumerate(terms):
+            postings = self.postings[term]
+            weight = idf * (K1 + 1)
+            if len(scores) >= limit and heapq.nlargest(limit, scores.values())[-1] >= remaining[i]:
+                # Élagage (MaxScore) : une instruction absente des candidats ne peut plus
+                # entrer dans le top-k, seuls les candidats sont complétés
+                for key in scores:
+                    frequency = postings.get(key)
+                    if frequency:
+                        scores[key] += weight * frequency / (frequency + base + slope * lengths[key])
+                continue
+            for key, frequency in postings.items():
+                scores[key] = scores.get(key, 0.0) + weight * frequency / (frequency + base + slope * lengths[key])
+
+        # Score d'une instruction identique à la requête : borne pour un score relatif
+        query_length = sum(query_counts.values())
+        norm = K1 * (1 - B + B * query_length / average_length)
+        best = sum(self._idf(term) * count * (K1 + 1) / (count + norm) for term, count in query_counts.items())
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(min(score / best, 1.0), key) for key, score in top]
+
+
+def main():
+    if len(sys.argv) > 3 or (len(sys.argv) > 1 and sys.argv[1] != 'bench'):
+        print(f"Usage: {sys.argv[0]} bench [nombre]")
+        sys.exit(1)
+    from instruction_extractor import synthetic_instructions
+
+    count = int(sys.argv[2]) if len(sys.argv) == 3 else 20000
+    instructions = synthetic_instructions(count)
+    start = time.perf_counter()
+    index = InstructionIndex((text.lower(), text) for text in instructions)
+    built = time.perf_counter() - start
+    print(f"⚡ {len(index)} instructions indexées en {built:.2f}s ({len(index.postings)} mots)")
+
+    rng = random.Random(0)
+    sentences = instructions[:100]
+    # Recherche interactive : quelques mots tirés d'une instruction
+    keywords = [' '.join(rng.sample(words, min(4, len(words))))
+                for words in (tokenize(text) for text in sentences) if words]
+    for label, queries in (("mots-clés", keywords), ("phrases complètes", sentences)):
+        start = time.perf_counter()
+        for query in queries:
+            index.search(query)
+        elapsed = time.perf_counter() - start
+        print(f"   {label}: {elapsed / len(queries) * 1000:.2f} ms par recherche")
+
+if __name__ == '__main__':
+    main()
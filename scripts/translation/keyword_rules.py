@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Moteur de règles par mots-clés pour la traduction des ingrédients
+
+Les règles (ingredient_rules.json) sont des données déclaratives :
+    {"when": [["sugar"], ["brown"], ["light", "soft"]], "fr": "Sucre roux", "es": "..."}
+Chaque groupe de "when" doit contenir au moins un mot-clé présent dans le texte
+(sous-chaîne, comme les tests `'x' in texte` qu'elles remplacent). Tous les
+mots-clés sont compilés une seule fois dans un automate d'Aho-Corasick : un seul
+passage sur le texte trouve toutes les correspondances, puis la règle appliquée
+est la première de la liste (priorité) dont tous les groupes sont satisfaits.
+
+Une règle peut aussi être un gabarit : "strip" retire les mots-clés du texte et
+"{base}" est remplacé par le reste, traduit par la fonction fournie par l'appelant.
+"""
+
+import hashlib
+import json
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+RULES_FILE = Path(__file__).resolve().parent / 'ingredient_rules.json'
+
+
+class KeywordAutomaton:
+    """Automate d'Aho-Corasick sur un ensemble de mots-clés"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for pattern in patterns:
+            if pattern and pattern not in self._ids:
+                self._add(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern: str):
+        pattern_id = len(self.patterns)
+        self._ids[pattern] = pattern_id
+        self.patterns.append(pattern)
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        self._out[state] = self._out[state] + (pattern_id,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def pattern_id(self, pattern: str) -> int:
+        return self._ids[pattern]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Itère sur (position de fin, id du mot-clé) pour chaque occurrence"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in out[state]:
+                yield index + 1, pattern_id
+
+    def find_ids(self, text: str) -> Set[int]:
+        """Ids de tous les mots-clés présents dans le texte (un seul passage)"""
+        return {pattern_id for _, pattern_id in self.iter_matches(text)}
+
+    def find_all(self, text: str) -> Set[str]:
+        return {self.patterns[pattern_id] for pattern_id in self.find_ids(text)}
+
+
+class RuleEngine:
+    """Règles compilées : sélection par priorité à partir des mots-clés trouvés"""
+
+    def __init__(self, rules: List[Dict]):
+        self.rules = rules
+        keywords = [kw for rule in rules for group in rule['when'] for kw in group]
+        self.automaton = KeywordAutomaton(keywords)
+        self._groups: List[Tuple[FrozenSet[int], ...]] = []
+        self._rules_by_keyword: Dict[int, List[int]] = {}
+        for index, rule in enumerate(rules):
+            groups = tuple(frozenset(self.automaton.pattern_id(kw) for kw in group)
+                           for group in rule['when'])
+            self._groups.append(groups)
+            for pattern_id in groups[0]:
+                self._rules_by_keyword.setdefault(pattern_id, []).append(index)
+
+    def match(self, text: str) -> Optional[Dict]:
+        """Règle de plus haute priorité satisfaite par le texte, ou None"""
+        found = self.automaton.find_ids(text)
+        if not found:
+            return None
+        candidates = sorted({index for pattern_id in found
+                             for index in self._rules_by_keyword.get(pattern_id, ())})
+        for index in candidates:
+            if all(group & found for group in self._groups[index]):
+                return self.rules[index]
+        return None
+
+    def apply(self, text: str,
+              translate_base: Optional[Callable[[str, str], str]] = None) -> Optional[Dict[str, str]]:
+        """Traduction {"fr", "es"} produite par la règle sélectionnée, ou None"""
+        rule = self.match(text)
+        if rule is None:
+            return None
+        if 'strip' not in rule:
+            return {"fr": rule["fr"], "es": rule["es"]}
+
+        base = text
+        for keyword in rule['strip']:
+            base = base.replace(f' {keyword}', '')
+        for keyword in rule['strip']:
+            base = base.replace(keyword, '')
+        base = base.strip()
+        result = {}
+        for lang in ('fr', 'es'):
+            translated = translate_base(base, lang) if translate_base else base
+            result[lang] = rule[lang].format(base=translated)
+        return result
+
+
+_ENGINES: Dict[str, RuleEngine] = {}
+_RULES_DATA: Optional[Dict] = None
+
+
+def _rules_data() -> Dict:
+    global _RULES_DATA
+    if _RULES_DATA is None:
+        with open(RULES_FILE, 'r', encoding='utf-8') as f:
+            _RULES_DATA = json.load(f)
+    return _RULES_DATA
+
+
+def rules_version() -> str:
+    """Empreinte du fichier de règles (change dès qu'une table de règles est modifiée)"""
+    return hashlib.sha256(RULES_FILE.read_bytes()).hexdigest()[:16]
+
+
+def load_rule_engine(name: str) -> RuleEngine:
+    """Retourne le moteur compilé (une seule fois par processus) d'un jeu de règles"""
+    engine = _ENGINES.get(name)
+    if engine is None:
+        engine = RuleEngine(_rules_data()['rule_sets'][name])
+        _ENGINES[name] = engine
+    return engine
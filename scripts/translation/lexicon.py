@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Lexique culinaire partagé (EN -> FR/ES)
+
+Toutes les tables de traduction utilisées par les scripts (expressions d'ingrédients,
+mots simples, noms de recettes courants) sont dans un seul fichier versionné avec le
+code, lexicon.json :
+    ingredients         : expressions d'ingrédients -> {"fr", "es"}
+    recipe_names        : noms de recettes courants (le premier contenu dans le nom gagne)
+    words               : mots simples, en minuscules
+    substitution_words  : mots remplacés sur place par translate_remaining_ingredients.py
+
+load_lexicon() construit les tables de recherche au premier appel et en garde une
+forme précompilée (pickle) dans data/culinary_dictionaries/lexicon.pickle, reconstruite
+dès que lexicon.json change.
+
+Usage:
+    python3 scripts/translation/lexicon.py build
+    python3 scripts/translation/lexicon.py lookup "olive oil"
+"""
+
+import hashlib
+import json
+import pickle
+import sys
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional
+
+from dictionary_store import WORK_DIR, atomic_write
+from keyword_rules import KeywordAutomaton
+
+LEXICON_FILE = Path(__file__).resolve().parent / 'lexicon.json'
+CACHE_FILE = WORK_DIR / 'lexicon.pickle'
+CACHE_FORMAT = 1
+LANGS = ('fr', 'es')
+
+
+def lexicon_version(lexicon_file: Path = LEXICON_FILE) -> str:
+    """Empreinte du fichier de lexique (sert aussi de version aux caches de traduction)"""
+    return hashlib.sha256(Path(lexicon_file).read_bytes()).hexdigest()[:16]
+
+
+class Lexicon:
+    """Tables de recherche construites à partir de lexicon.json"""
+
+    def __init__(self, data: Dict, version: str):
+        self.version = version
+        self.ingredients: Dict[str, Dict[str, str]] = data['ingredients']
+        self.recipe_names: Dict[str, Dict[str, str]] = data['recipe_names']
+        self.words: Dict[str, Dict[str, str]] = data['words']
+        # Tables {'fr': {mot: trad}, 'es': {mot: trad}} construites une seule fois
+        self.word_tables: Dict[str, Dict[str, str]] = {
+            lang: {word: translation[lang] for word, translation in self.words.items()}
+            for lang in LANGS
+        }
+        self.substitutions: Dict[str, Dict[str, str]] = {
+            word: self.words[word] for word in data['substitution_words']
+        }
+        # Noms principaux composables avec leurs compléments (phrase_trie)
+        self.compound_heads: FrozenSet[str] = frozenset(data.get('compound_heads', ()))
+        self.recipe_patterns = KeywordAutomaton(self.recipe_names)
+
+    def phrase(self, text: str) -> Optional[Dict[str, str]]:
+        """Traduction d'une expression d'ingrédient connue"""
+        return self.ingredients.get(text.lower().strip())
+
+    def word(self, word: str, lang: str, default: Optional[str] = None) -> Optional[str]:
+        """Traduction d'un mot simple (en minuscules), ou default"""
+        return self.word_tables[lang].get(word.lower().strip(), default)
+
+    def recipe_name(self, text: str) -> Optional[Dict[str, str]]:
+        """Premier nom de recette courant (dans l'ordre du lexique) contenu dans le texte"""
+        found = self.recipe_patterns.find_ids(text.lower())
+        if not found:
+            return None
+        return self.recipe_names[self.recipe_patterns.patterns[min(found)]]
+
+
+def _source_stamp(lexicon_file: Path):
+    stat = lexicon_file.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def build_lexicon(lexicon_file: Path = LEXICON_FILE, cache_file: Path = CACHE_FILE) -> Lexicon:
+    """Construit le lexique depuis le JSON et écrit sa forme précompilée"""
+    with open(lexicon_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    lexicon = Lexicon(data, lexicon_version(lexicon_file))
+    payload = {
+        'format': CACHE_FORMAT,
+        'source': _source_stamp(lexicon_file),
+        # Attributs seulement : la classe reste importée depuis ce module au chargement
+        'state': vars(lexicon),
+    }
+    atomic_write(cache_file, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    return lexicon
+
+
+def _load_cached(lexicon_file: Path, cache_file: Path) -> Optional[Lexicon]:
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if payload.get('format') != CACHE_FORMAT or payload.get('source') != _source_stamp(lexicon_file):
+        return None
+    lexicon = Lexicon.__new__(Lexicon)
+    lexicon.__dict__.update(payload['state'])
+    return lexicon
+
+
+_LEXICON: Optional[Lexicon] = None
+
+
+def load_lexicon() -> Lexicon:
+    """Retourne le lexique (une seule fois par processus, depuis le cache précompilé si à jour)"""
+    global _LEXICON
+    if _LEXICON is None:
+        _LEXICON = _load_cached(LEXICON_FILE, CACHE_FILE) or build_lexicon()
+    return _LEXICON
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'build':
+        lexicon = build_lexicon()
+        print(f"📚 {len(lexicon.ingredients)} expressions, {len(lexicon.recipe_names)} noms de recettes, "
+              f"{len(lexicon.words)} mots")
+        print(f"✅ Lexique {lexicon.version} précompilé: {CACHE_FILE}")
+    elif command == 'lookup' and len(sys.argv) == 3:
+        lexicon = load_lexicon()
+        text = sys.argv[2]
+        entry = lexicon.phrase(text) or lexicon.recipe_name(text)
+        if entry is None and lexicon.word(text, 'fr'):
+            entry = lexicon.words[text.lower().strip()]
+        if entry:
+            print(f"  FR: {entry['fr']}\n  ES: {entry['es']}")
+        else:
+            print(f"❌ '{text}' introuvable dans le lexique")
+            sys.exit(1)
+    else:
+        print(f"Usage: {sys.argv[0]} build | lookup <texte>")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Client LibreTranslate par lots pour les scripts de traduction
+
+Le service Docker (docker-compose.libretranslate.yml, port 7071) accepte un
+tableau de textes dans `q` : au lieu d'une requête HTTP par texte comme
+backend/src/services/libretranslate.js, les textes sont
+  - dédoublonnés (espaces et casse normalisés, comme les clés de TranslationCache)
+  - cherchés d'abord dans le cache persistant (translation_cache.py)
+  - regroupés en requêtes dont le total de caractères reste sous LT_CHAR_LIMIT
+    (5000, limite appliquée par le serveur à la somme des textes d'une requête)
+  - envoyés sur des connexions keep-alive réutilisées (async_fetcher.http_request),
+    au plus `concurrency` requêtes en cours
+  - renvoyés avec attente exponentielle aléatoire sur les erreurs réseau, 429 et
+    5xx (Retry-After respecté)
+Remplir toutes les traductions manquantes d'un dictionnaire prend ainsi quelques
+dizaines de requêtes au lieu de milliers.
+
+Configuration : LIBRETRANSLATE_URL (défaut http://localhost:7071),
+LIBRETRANSLATE_API_KEY, LT_CHAR_LIMIT, LT_BATCH_LIMIT (nombre de textes par
+requête, illimité par défaut comme sur le serveur).
+
+Usage:
+    python3 scripts/translation/libretranslate_client.py translate "Chicken breast" ["Sea salt" ...]
+    python3 scripts/translation/libretranslate_client.py fill [ingredients|recipe_names] [--dry-run]
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+from async_fetcher import ConnectionPool, HttpStatusError, http_request
+from dictionary_store import open_store
+from translation_cache import TranslationCache, normalize_cache_text, table_version
+
+LIBRETRANSLATE_URL = os.environ.get('LIBRETRANSLATE_URL', 'http://localhost:7071')
+API_KEY = os.environ.get('LIBRETRANSLATE_API_KEY', '')
+CHAR_LIMIT = int(os.environ.get('LT_CHAR_LIMIT', '5000'))
+BATCH_LIMIT = int(os.environ.get('LT_BATCH_LIMIT', '0')) or None
+CONCURRENCY = 4
+RETRIES = 4
+BACKOFF = 0.5
+LANGS = ('fr', 'es')
+
+
+def pack_batches(texts: Sequence[str], char_limit: int = CHAR_LIMIT,
+                 batch_limit: Optional[int] = BATCH_LIMIT) -> List[List[str]]:
+    """
+    Regroupe les textes (dans l'ordre) en lots dont la somme des longueurs reste
+    sous char_limit ; un texte plus long que la limite est ignoré (refusé par le serveur)
+    """
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    size = 0
+    for text in texts:
+        if len(text) > char_limit:
+            continue
+        if batch and (size + len(text) > char_limit or len(batch) == batch_limit):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(text)
+        size += len(text)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class LibreTranslateClient:
+    """Client asynchrone de POST /translate (à utiliser avec `async with`)"""
+
+    def __init__(self, base_url: str = LIBRETRANSLATE_URL, concurrency: int = CONCURRENCY,
+                 char_limit: int = CHAR_LIMIT, batch_limit: Optional[int] = BATCH_LIMIT,
+                 retries: int = RETRIES, backoff: float = BACKOFF, timeout: float = 60,
+                 api_key: str = API_KEY):
+        self.url = base_url.rstrip('/') + '/translate'
+        self.char_limit = char_limit
+        self.batch_limit = batch_limit
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.api_key = api_key
+        self.network_requests = 0
+        self.retried = 0
+        self.errors: List[Exception] = []
+        self._slots = asyncio.Semaphore(concurrency)
+        self._pool = ConnectionPool()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._pool.close()
+
+    async def translate_many(self, texts: Iterable[str], target: str, source: str = 'en') -> Dict[str, str]:
+        """
+        {texte: traduction} pour les textes distincts ; les textes trop longs et ceux
+        d'un lot en échec (erreur gardée dans self.errors) sont absents
+        """
+        distinct = list(dict.fromkeys(text.strip() for text in texts if text and text.strip()))
+        batches = pack_batches(distinct, self.char_limit, self.batch_limit)
+        results = await asyncio.gather(*(self._translate_batch(batch, source, target) for batch in batches),
+                                       return_exceptions=True)
+        translated = {}
+        for batch, translations in zip(batches, results):
+            if isinstance(translations, Exception):
+                self.errors.append(translations)
+                continue
+            translated.update(zip(batch, translations))
+        return translated
+
+    async def _translate_batch(self, batch: List[str], source: str, target: str) -> List[str]:
+        payload = {'q': batch, 'source': source, 'target': target, 'format': 'text'}
+        if self.api_key:
+            payload['api_key'] = self.api_key
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        for attempt in range(self.retries + 1):
+            try:
+                data = await self._request(body)
+                translations = data.get('translatedText') if isinstance(data, dict) else None
+                if not isinstance(translations, list) or len(translations) != len(batch):
+                    raise ValueError(f"réponse LibreTranslate invalide: {str(data)[:200]}")
+                return translations
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, HttpStatusError) as error:
+                retryable = not isinstance(error, HttpStatusError) or error.status == 429 or error.status >= 500
+                if not retryable or attempt == self.retries:
+                    raise
+                self.retried += 1
+                delay = random.uniform(0, self.backoff * 2 ** attempt)
+                if isinstance(error, HttpStatusError) and error.retry_after:
+                    delay = max(delay, error.retry_after)
+                await asyncio.sleep(delay)
+
+    async def _request(self, body: bytes):
+        async with self._slots:
+            self.network_requests += 1
+            status, headers, response = await http_request(
+                self._pool, 'POST', self.url, {'Content-Type': 'application/json', 'Accept': 'application/json'},
+                body, self.timeout)
+
+        if status == 429 or status >= 500:
+            retry_after = headers.get('retry-after')
+            raise HttpStatusError(status, self.url, float(retry_after) if retry_after and retry_after.isdigit() else None)
+        data = json.loads(response) if response else None
+        if status != 200:
+            error = data.get('error') if isinstance(data, dict) else None
+            raise HttpStatusError(status, f"{self.url} ({error or 'erreur'})")
+        return data
+
+
+def translate_by_language(texts_by_lang: Mapping[str, Iterable[str]], source: str = 'en',
+                          cache: Optional[TranslationCache] = None, stats: Optional[Dict[str, int]] = None,
+                          **options) -> Dict[str, Dict[str, str]]:
+    """
+    Version synchrone pour les scripts : {langue: {texte: traduction}} pour les
+    textes demandés dans chaque langue (une langue déjà traduite n'est pas
+    redemandée). Les textes déjà en cache ne sont pas envoyés, un même texte à la
+    casse près n'est envoyé qu'une fois par langue, et les nouvelles traductions
+    sont ajoutées au cache. Une traduction absente signale un lot en échec ;
+    stats reçoit requests, retries et errors.
+    """
+    results: Dict[str, Dict[str, str]] = {}
+    # Par langue : texte normalisé -> variantes du texte à traduire
+    missing: Dict[str, Dict[str, List[str]]] = {}
+    for lang, texts in texts_by_lang.items():
+        results[lang] = {}
+        for text in dict.fromkeys(text.strip() for text in texts if text and text.strip()):
+            cached = cache.get(text, lang) if cache is not None else None
+            if cached is not None:
+                results[lang][text] = cached
+            else:
+                missing.setdefault(lang, {}).setdefault(normalize_cache_text(text), []).append(text)
+    if not missing:
+        return results
+
+    async def run():
+        async with LibreTranslateClient(**options) as client:
+            answers = await asyncio.gather(
+                *(client.translate_many([variants[0] for variants in groups.values()], lang, source)
+                  for lang, groups in missing.items()))
+            return client, answers
+
+    client, answers = asyncio.run(run())
+    for (lang, groups), answer in zip(missing.items(), answers):
+        for variants in groups.values():
+            translation = answer.get(variants[0])
+            if translation is None:
+                continue
+            for text in variants:
+                results[lang][text] = translation
+            if cache is not None:
+                cache.put(variants[0], lang, translation)
+    if stats is not None:
+        stats.update(requests=client.network_requests, retries=client.retried, errors=len(client.errors))
+    for error in client.errors[:3]:
+        print(f"⚠️  LibreTranslate: {error}")
+    return results
+
+
+def translate_texts(texts: Iterable[str], langs: Sequence[str] = LANGS, source: str = 'en',
+                    cache: Optional[TranslationCache] = None, stats: Optional[Dict[str, int]] = None,
+                    **options) -> Dict[str, Dict[str, str]]:
+    """{texte: {langue: traduction}} : translate_by_language avec les mêmes textes pour chaque langue"""
+    texts = list(dict.fromkeys(text.strip() for text in texts if text and text.strip()))
+    by_lang = translate_by_language({lang: texts for lang in langs}, source, cache, stats, **options)
+    return {text: {lang: by_lang[lang][text] for lang in langs if text in by_lang[lang]} for text in texts}
+
+
+def libretranslate_cache(source: str = 'en') -> TranslationCache:
+    """Cache des traductions LibreTranslate (invalidé si l'URL du service change)"""
+    return TranslationCache(f'libretranslate-{source}', table_version(LIBRETRANSLATE_URL))
+
+
+def _is_missing(value: Dict, lang: str, en_name: str) -> bool:
+    translation = (value.get(lang) or '').strip()
+    return not translation or translation.lower() == en_name.lower()
+
+
+def main():
+    args = sys.argv[1:]
+    command = args[0] if args else ''
+    if command == 'translate' and len(args) > 1:
+        with libretranslate_cache() as cache:
+            results = translate_texts(args[1:], cache=cache)
+        for text, translations in results.items():
+            print(f"🌍 {text}: FR={translations.get('fr', '?')}, ES={translations.get('es', '?')}")
+        return
+    if command != 'fill':
+        print(f"Usage: {sys.argv[0]} translate <texte>... | fill [ingredients|recipe_names] [--dry-run]")
+        sys.exit(1)
+
+    name = next((arg for arg in args[1:] if arg in ('ingredients', 'recipe_names')), 'ingredients')
+    store = open_store(name)
+    missing = {}
+    for key, value in store.items():
+        en_name = (value.get('en') or key).strip()
+        langs = [lang for lang in LANGS if _is_missing(value, lang, en_name)]
+        if langs:
+            missing[key] = (en_name, langs)
+    print(f"📚 {len(missing)} entrée(s) de {name} avec une traduction manquante")
+    if not missing:
+        return
+
+    start = time.perf_counter()
+    stats = {'requests': 0, 'retries': 0, 'errors': 0}
+    with libretranslate_cache() as cache:
+        # Seules les langues manquantes de chaque entrée sont demandées
+        requested = {lang: [en_name for en_name, langs in missing.values() if lang in langs] for lang in LANGS}
+        results = translate_by_language(requested, cache=cache, stats=stats)
+        print(cache.report())
+    print(f"🌍 {stats['requests']} requête(s) LibreTranslate ({stats['retries']} nouvelle(s) tentative(s), "
+          f"{stats['errors']} lot(s) en échec, {time.perf_counter() - start:.1f}s)")
+
+    filled = 0
+    for key, (en_name, langs) in missing.items():
+        value = dict(store.get(key))
+        for lang in langs:
+            translation = (results[lang].get(en_name) or '').strip()
+            if translation and translation.lower() != en_name.lower():
+                value[lang] = translation
+                filled += 1
+        store.set(key, value)
+    if stats['errors'] and not filled:
+        print(f"❌ LibreTranslate non disponible sur {LIBRETRANSLATE_URL} "
+              f"(docker compose -f docker-compose.libretranslate.yml up -d)")
+        sys.exit(1)
+    if '--dry-run' in args:
+        print(f"ℹ️  --dry-run : {filled} traduction(s) non enregistrée(s)")
+        return
+    written = store.save()
+    print(f"✅ {filled} traduction(s) ajoutée(s) ({written} modification(s) journalisée(s) "
+          f"pour {store.json_file.name})")
+
+
+if __name__ == '__main__':
+    main()
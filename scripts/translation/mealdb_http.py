@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Couche HTTP partagée pour l'API TheMealDB (cache disque + enregistrement/rejeu)
+
+Chaque réponse JSON est stockée compressée (gzip) dans
+data/culinary_dictionaries/http_cache/, sous l'empreinte de l'endpoint appelé
+(chemin relatif à l'API, ex. "filter.php?c=Beef"). Le mode est choisi par la
+variable d'environnement MEALDB_HTTP_MODE :
+    cache   (défaut) réponse en cache si plus récente que le TTL, sinon réseau puis cache
+    record  toujours le réseau, chaque réponse est enregistrée
+    replay  uniquement le cache (TTL ignoré), aucune requête réseau
+    live    réseau sans cache
+
+Les appels réseau sont faits par async_fetcher.py, qui consulte et alimente ce
+cache (lookup / store).
+
+Les endpoints non déterministes (random.php) sont appelés avec variant=n : chaque
+tirage est une entrée distincte, rejouée dans le même ordre.
+
+Le serveur local (`serve`) sert les réponses enregistrées sous le même chemin que
+l'API ; MEALDB_API=http://localhost:7373/api/json/v1/1 y redirige les scripts.
+
+Usage:
+    python3 scripts/translation/mealdb_http.py stats
+    python3 scripts/translation/mealdb_http.py serve [port]
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlsplit
+
+from dictionary_store import WORK_DIR, atomic_write
+
+MEALDB_API = os.environ.get('MEALDB_API', 'https://www.themealdb.com/api/json/v1/1')
+CACHE_DIR = WORK_DIR / 'http_cache'
+MODES = ('cache', 'record', 'replay', 'live')
+DEFAULT_TTL = 7 * 24 * 3600
+SERVER_PORT = 7373
+API_PATH = '/api/json/v1/1/'
+
+
+class CacheMiss(LookupError):
+    """Réponse absente du cache en mode replay"""
+
+
+def http_mode() -> str:
+    mode = os.environ.get('MEALDB_HTTP_MODE', 'cache')
+    if mode not in MODES:
+        raise ValueError(f"MEALDB_HTTP_MODE inconnu: {mode} (attendu: {', '.join(MODES)})")
+    return mode
+
+
+def cache_key(endpoint: str, variant: Optional[int] = None) -> str:
+    if variant is not None:
+        endpoint = f"{endpoint}#{variant}"
+    return hashlib.sha256(endpoint.encode('utf-8')).hexdigest()
+
+
+def cache_path(key: str, cache_dir: Path = CACHE_DIR) -> Path:
+    return cache_dir / key[:2] / f"{key}.json.gz"
+
+
+def read_cached(endpoint: str, variant: Optional[int] = None,
+                ttl: Optional[float] = DEFAULT_TTL, cache_dir: Path = CACHE_DIR) -> Optional[Dict]:
+    """Entrée en cache {'endpoint', 'variant', 'fetched_at', 'data'}, ou None si absente/expirée"""
+    path = cache_path(cache_key(endpoint, variant), cache_dir)
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, EOFError, ValueError):
+        return None
+    if ttl is not None and time.time() - entry['fetched_at'] > ttl:
+        return None
+    return entry
+
+
+def write_cached(endpoint: str, data, variant: Optional[int] = None, cache_dir: Path = CACHE_DIR):
+    entry = {'endpoint': endpoint, 'variant': variant, 'fetched_at': time.time(), 'data': data}
+    payload = gzip.compress(json.dumps(entry, ensure_ascii=False).encode('utf-8'), mtime=0)
+    atomic_write(cache_path(cache_key(endpoint, variant), cache_dir), payload)
+
+
+def lookup(endpoint: str, variant: Optional[int] = None, ttl: Optional[float] = DEFAULT_TTL):
+    """
+    (True, données) si le mode courant permet de répondre depuis le cache, (False, None)
+    s'il faut appeler le réseau. Lève CacheMiss en mode replay.
+    """
+    mode = http_mode()
+    if mode in ('cache', 'replay'):
+        entry = read_cached(endpoint, variant, ttl=None if mode == 'replay' else ttl)
+        if entry is not None:
+            return True, entry['data']
+        if mode == 'replay':
+            raise CacheMiss(f"{endpoint} absent du cache (MEALDB_HTTP_MODE=replay)")
+    return False, None
+
+
+def store(endpoint: str, data, variant: Optional[int] = None):
+    """Enregistre une réponse réseau, sauf en mode live"""
+    if data is not None and http_mode() != 'live':
+        write_cached(endpoint, data, variant)
+
+
+def iter_cache_entries(cache_dir: Path = CACHE_DIR):
+    for path in sorted(cache_dir.glob('*/*.json.gz')):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            yield path, json.load(f)
+
+
+# ----------------------------------------------------------------------
+# Serveur local de rejeu
+# ----------------------------------------------------------------------
+
+class FixtureServer(ThreadingHTTPServer):
+    """Sert les réponses enregistrées ; les variantes d'un endpoint sont servies à tour de rôle"""
+
+    daemon_threads = True
+
+    def __init__(self, port: int = SERVER_PORT, cache_dir: Path = CACHE_DIR):
+        self.fixtures: Dict[str, List[Dict]] = {}
+        for _, entry in iter_cache_entries(cache_dir):
+            self.fixtures.setdefault(entry['endpoint'], []).append(entry)
+        for entries in self.fixtures.values():
+            entries.sort(key=lambda entry: entry['variant'] if entry['variant'] is not None else -1)
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        super().__init__(('127.0.0.1', port), _FixtureHandler)
+
+    def next_fixture(self, endpoint: str):
+        entries = self.fixtures.get(endpoint)
+        if not entries:
+            return None
+        with self._lock:
+            index = self._served.get(endpoint, 0)
+            self._served[endpoint] = index + 1
+        return entries[index % len(entries)]['data']
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    # Connexions keep-alive, comme l'API réelle
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        # Le client encode les espaces et accents (%20, %C3%A8) : les clés du cache sont en clair
+        url = urlsplit(self.path)
+        path, query = unquote(url.path), unquote(url.query)
+        endpoint = path[len(API_PATH):] if path.startswith(API_PATH) else path.lstrip('/')
+        if query:
+            endpoint = f"{endpoint}?{query}"
+        data = self.server.next_fixture(endpoint)
+        if data is None:
+            self.send_error(404, f"Aucune réponse enregistrée pour {endpoint}")
+            return
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    if command == 'stats':
+        entries = list(iter_cache_entries())
+        size = sum(path.stat().st_size for path, _ in entries)
+        endpoints = {entry['endpoint'] for _, entry in entries}
+        print(f"📦 {len(entries)} réponses en cache ({len(endpoints)} endpoints, {size / 1024:.1f} Ko)")
+        print(f"📁 {CACHE_DIR}")
+    elif command == 'serve' and len(sys.argv) <= 3:
+        port = int(sys.argv[2]) if len(sys.argv) == 3 else SERVER_PORT
+        server = FixtureServer(port)
+        print(f"🌐 {sum(len(e) for e in server.fixtures.values())} réponses servies sur "
+              f"http://localhost:{port}{API_PATH.rstrip('/')}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+    else:
+        print(f"Usage: {sys.argv[0]} stats | serve [port]")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Synchronisation complète du catalogue TheMealDB (au lieu de tirages aléatoires)
+
+1. endpoints de liste : catégories, zones (areas) et ingrédients (list.php)
+2. ids de toutes les recettes par catégorie et par zone (filter.php)
+3. détail de chaque recette encore inconnue (lookup.php?i=<idMeal>)
+
+Les recettes sont ajoutées au fur et à mesure, par lots, à
+data/culinary_dictionaries/mealdb_meals.jsonl (une recette par ligne) : ce fichier
+sert de point de reprise. Une exécution interrompue reprend là où elle s'est
+arrêtée et les exécutions suivantes ne demandent que les nouvelles recettes. Le
+fichier peut être passé directement aux extracteurs (--corpus).
+
+Usage:
+    python3 scripts/translation/mealdb_sync.py [sync|status]
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from async_fetcher import fetch_all
+from dictionary_store import WORK_DIR, atomic_write
+
+MEALS_FILE = WORK_DIR / 'mealdb_meals.jsonl'
+CATALOG_FILE = WORK_DIR / 'mealdb_catalog.json'
+BATCH_SIZE = 50
+# Les listes et filtres changent quand des recettes sont ajoutées : cache d'un jour
+CATALOG_TTL = 24 * 3600
+
+
+def load_meals(meals_file: Path = MEALS_FILE) -> Dict[str, Dict]:
+    """Recettes déjà synchronisées {idMeal: meal} ; une dernière ligne tronquée est retirée"""
+    meals = {}
+    if not meals_file.exists():
+        return meals
+    valid_size = 0
+    with open(meals_file, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                meal = json.loads(line)
+            except ValueError:
+                break
+            meals[meal['idMeal']] = meal
+            valid_size += len(line)
+    if valid_size != meals_file.stat().st_size:
+        # Interruption pendant une écriture : on repart de la dernière ligne complète
+        with open(meals_file, 'r+b') as f:
+            f.truncate(valid_size)
+    return meals
+
+
+def _append_meals(meals: List[Dict], meals_file: Path = MEALS_FILE):
+    meals_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(meals_file, 'a', encoding='utf-8') as f:
+        for meal in meals:
+            f.write(json.dumps(meal, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _names(data, field: str) -> List[str]:
+    return sorted({item[field].strip() for item in (data or {}).get('meals') or [] if item.get(field)})
+
+
+def fetch_catalog() -> Dict:
+    """Listes de catégories, zones, ingrédients et ids de toutes les recettes"""
+    lists = fetch_all(["list.php?c=list", "list.php?a=list", "list.php?i=list"], ttl=CATALOG_TTL)
+    for response in lists:
+        if isinstance(response, Exception):
+            raise response
+    categories = _names(lists[0], 'strCategory')
+    areas = _names(lists[1], 'strArea')
+    ingredients = _names(lists[2], 'strIngredient')
+
+    # Chaque recette a une catégorie et une zone : les deux filtres se recoupent
+    filters = [f"filter.php?c={category}" for category in categories] + [f"filter.php?a={area}" for area in areas]
+    ids: Dict[str, str] = {}
+    for endpoint, response in zip(filters, fetch_all(filters, ttl=CATALOG_TTL)):
+        if isinstance(response, Exception):
+            print(f"   ⚠️  Erreur pour {endpoint}: {response}")
+            continue
+        for meal in (response or {}).get('meals') or []:
+            ids[meal['idMeal']] = meal.get('strMeal', '')
+
+    catalog = {'categories': categories, 'areas': areas, 'ingredients': ingredients,
+               'meals': dict(sorted(ids.items(), key=lambda item: int(item[0])))}
+    atomic_write(CATALOG_FILE, json.dumps(catalog, ensure_ascii=False, indent=1).encode('utf-8'))
+    return catalog
+
+
+def sync_catalog(batch_size: int = BATCH_SIZE) -> Dict[str, Dict]:
+    """Synchronise le catalogue et retourne toutes les recettes connues {idMeal: meal}"""
+    meals = load_meals()
+    print(f"📚 {len(meals)} recettes déjà synchronisées")
+
+    catalog = fetch_catalog()
+    missing = [meal_id for meal_id in catalog['meals'] if meal_id not in meals]
+    print(f"🗂️  {len(catalog['categories'])} catégories, {len(catalog['areas'])} zones, "
+          f"{len(catalog['ingredients'])} ingrédients, {len(catalog['meals'])} recettes au catalogue")
+    print(f"📥 {len(missing)} nouvelles recettes à récupérer")
+
+    errors = 0
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start:start + batch_size]
+        fetched = []
+        for meal_id, response in zip(batch, fetch_all([f"lookup.php?i={meal_id}" for meal_id in batch])):
+            if isinstance(response, Exception):
+                errors += 1
+                continue
+            for meal in (response or {}).get('meals') or []:
+                fetched.append(meal)
+        # Point de reprise : chaque lot terminé est écrit avant de passer au suivant
+        _append_meals(fetched)
+        meals.update((meal['idMeal'], meal) for meal in fetched)
+        print(f"   Progression: {min(start + batch_size, len(missing))}/{len(missing)}...")
+
+    if errors:
+        print(f"⚠️  {errors} recette(s) en erreur, reprises à la prochaine synchronisation")
+    print(f"✅ {len(meals)} recettes synchronisées dans {MEALS_FILE}")
+    return meals
+
+
+def load_catalog() -> Dict:
+    with open(CATALOG_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def meal_ingredients(meal: Dict) -> List[str]:
+    """Ingrédients d'une recette (strIngredient1 à strIngredient20)"""
+    return [meal[f'strIngredient{j}'].strip() for j in range(1, 21)
+            if meal.get(f'strIngredient{j}') and meal[f'strIngredient{j}'].strip()]
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'sync'
+    if command == 'sync':
+        sync_catalog()
+    elif command == 'status':
+        meals = load_meals()
+        known = len(load_catalog()['meals']) if CATALOG_FILE.exists() else 0
+        print(f"📚 {len(meals)} recettes synchronisées / {known} au dernier catalogue")
+        print(f"📁 {MEALS_FILE}")
+    else:
+        print(f"Usage: {sys.argv[0]} [sync|status]")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Analyse et normalisation des mesures TheMealDB (strMeasure)
+
+Une mesure ("1 tbs", "200g", "½ cup", "2-3 cloves chopped", "pinch") devient
+Measure(quantity, quantity_max, unit, modifier) :
+  - quantity : nombre (fractions unicode, fractions "3/4", nombres mixtes "1 1/2",
+    décimales "0,5", quelques nombres en lettres), None si absent
+  - quantity_max : borne haute d'un intervalle ("2-3", "2 to 3"), sinon None
+  - unit : unité canonique (tbsp, g, ml, cup, pinch...) ou None
+  - modifier : reste du texte ("chopped", "(400g)", "to taste")
+
+Toutes les formes d'unités sont compilées en une seule expression régulière.
+parse_measures() analyse une colonne entière : chaque chaîne distincte n'est
+analysée qu'une fois (cache partagé), ce qui permet de précalculer conversions
+(to_base) et mises à l'échelle (scale) pour tout le corpus. Les libellés FR/ES
+des unités reprennent ceux de l'application (translation_service.dart).
+
+Usage:
+    python3 scripts/translation/measure_parser.py "1 ½ tbs" "200g" "2-3 cloves chopped"
+    python3 scripts/translation/measure_parser.py stats   # mesures du stockage colonnaire
+"""
+
+import re
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Unité canonique : (dimension, facteur vers l'unité de base g/ml, formes reconnues)
+UNITS: Dict[str, Tuple[str, Optional[float], Tuple[str, ...]]] = {
+    'g': ('mass', 1.0, ('g', 'gr', 'grs', 'gm', 'gms', 'gram', 'grams', 'gramme', 'grammes')),
+    'kg': ('mass', 1000.0, ('kg', 'kgs', 'kilo', 'kilos', 'kilogram', 'kilograms', 'kilogramme', 'kilogrammes')),
+    'oz': ('mass', 28.3495, ('oz', 'ozs', 'ounce', 'ounces')),
+    'lb': ('mass', 453.592, ('lb', 'lbs', 'pound', 'pounds')),
+    'ml': ('volume', 1.0, ('ml', 'mls', 'milliliter', 'milliliters', 'millilitre', 'millilitres')),
+    'cl': ('volume', 10.0, ('cl', 'centiliter', 'centiliters', 'centilitre', 'centilitres')),
+    'dl': ('volume', 100.0, ('dl', 'deciliter', 'deciliters', 'decilitre', 'decilitres')),
+    'l': ('volume', 1000.0, ('l', 'ltr', 'liter', 'liters', 'litre', 'litres')),
+    'tsp': ('volume', 5.0, ('tsp', 'tsps', 'tspn', 'ts', 'teaspoon', 'teaspoons')),
+    'tbsp': ('volume', 15.0, ('tbsp', 'tbsps', 'tbs', 'tbls', 'tbl', 'tb', 'tblsp', 'tblspn',
+                              'tablespoon', 'tablespoons')),
+    'cup': ('volume', 240.0, ('cup', 'cups')),
+    'fl oz': ('volume', 29.5735, ('fl oz', 'fl. oz', 'floz', 'fluid ounce', 'fluid ounces')),
+    'pint': ('volume', 473.176, ('pt', 'pint', 'pints')),
+    'quart': ('volume', 946.353, ('qt', 'quart', 'quarts')),
+    'pinch': ('count', None, ('pinch', 'pinches')),
+    'dash': ('count', None, ('dash', 'dashes', 'splash', 'splashes')),
+    'drop': ('count', None, ('drop', 'drops')),
+    'handful': ('count', None, ('handful', 'handfuls')),
+    'clove': ('count', None, ('clove', 'cloves')),
+    'slice': ('count', None, ('slice', 'slices')),
+    'piece': ('count', None, ('piece', 'pieces', 'pcs')),
+    'can': ('count', None, ('can', 'cans', 'tin', 'tins')),
+    'package': ('count', None, ('package', 'packages', 'pack', 'packs', 'packet', 'packets')),
+    'bunch': ('count', None, ('bunch', 'bunches')),
+    'sprig': ('count', None, ('sprig', 'sprigs')),
+    'stalk': ('count', None, ('stalk', 'stalks')),
+    'knob': ('count', None, ('knob', 'knobs')),
+    'head': ('count', None, ('head', 'heads')),
+    'leaf': ('count', None, ('leaf', 'leaves')),
+    'jar': ('count', None, ('jar', 'jars')),
+    'bottle': ('count', None, ('bottle', 'bottles')),
+    'bag': ('count', None, ('bag', 'bags')),
+    'box': ('count', None, ('box', 'boxes')),
+}
+
+# Libellés (singulier, pluriel) par langue
+UNIT_LABELS: Dict[str, Dict[str, Tuple[str, str]]] = {
+    'g': {'en': ('g', 'g'), 'fr': ('g', 'g'), 'es': ('g', 'g')},
+    'kg': {'en': ('kg', 'kg'), 'fr': ('kg', 'kg'), 'es': ('kg', 'kg')},
+    'oz': {'en': ('oz', 'oz'), 'fr': ('once', 'onces'), 'es': ('onza', 'onzas')},
+    'lb': {'en': ('lb', 'lbs'), 'fr': ('livre', 'livres'), 'es': ('libra', 'libras')},
+    'ml': {'en': ('ml', 'ml'), 'fr': ('ml', 'ml'), 'es': ('ml', 'ml')},
+    'cl': {'en': ('cl', 'cl'), 'fr': ('cl', 'cl'), 'es': ('cl', 'cl')},
+    'dl': {'en': ('dl', 'dl'), 'fr': ('dl', 'dl'), 'es': ('dl', 'dl')},
+    'l': {'en': ('l', 'l'), 'fr': ('l', 'l'), 'es': ('l', 'l')},
+    'tsp': {'en': ('tsp', 'tsp'), 'fr': ('cuillère à café', 'cuillères à café'),
+            'es': ('cucharadita', 'cucharaditas')},
+    'tbsp': {'en': ('tbsp', 'tbsp'), 'fr': ('cuillère à soupe', 'cuillères à soupe'),
+             'es': ('cucharada', 'cucharadas')},
+    'cup': {'en': ('cup', 'cups'), 'fr': ('tasse', 'tasses'), 'es': ('taza', 'tazas')},
+    'fl oz': {'en': ('fl oz', 'fl oz'), 'fr': ('fl oz', 'fl oz'), 'es': ('fl oz', 'fl oz')},
+    'pint': {'en': ('pint', 'pints'), 'fr': ('pinte', 'pintes'), 'es': ('pinta', 'pintas')},
+    'quart': {'en': ('quart', 'quarts'), 'fr': ('quart', 'quarts'), 'es': ('cuarto', 'cuartos')},
+    'pinch': {'en': ('pinch', 'pinches'), 'fr': ('pincée', 'pincées'), 'es': ('pizca', 'pizcas')},
+    'dash': {'en': ('dash', 'dashes'), 'fr': ('filet', 'filets'), 'es': ('chorrito', 'chorritos')},
+    'drop': {'en': ('drop', 'drops'), 'fr': ('goutte', 'gouttes'), 'es': ('gota', 'gotas')},
+    'handful': {'en': ('handful', 'handfuls'), 'fr': ('poignée', 'poignées'), 'es': ('puñado', 'puñados')},
+    'clove': {'en': ('clove', 'cloves'), 'fr': ('gousse', 'gousses'), 'es': ('diente', 'dientes')},
+    'slice': {'en': ('slice', 'slices'), 'fr': ('tranche', 'tranches'), 'es': ('rodaja', 'rodajas')},
+    'piece': {'en': ('piece', 'pieces'), 'fr': ('pièce', 'pièces'), 'es': ('pieza', 'piezas')},
+    'can': {'en': ('can', 'cans'), 'fr': ('boîte', 'boîtes'), 'es': ('lata', 'latas')},
+    'package': {'en': ('package', 'packages'), 'fr': ('paquet', 'paquets'), 'es': ('paquete', 'paquetes')},
+    'bunch': {'en': ('bunch', 'bunches'), 'fr': ('botte', 'bottes'), 'es': ('manojo', 'manojos')},
+    'sprig': {'en': ('sprig', 'sprigs'), 'fr': ('brin', 'brins'), 'es': ('ramita', 'ramitas')},
+    'stalk': {'en': ('stalk', 'stalks'), 'fr': ('branche', 'branches'), 'es': ('tallo', 'tallos')},
+    'knob': {'en': ('knob', 'knobs'), 'fr': ('noix', 'noix'), 'es': ('nuez', 'nueces')},
+    'head': {'en': ('head', 'heads'), 'fr': ('tête', 'têtes'), 'es': ('cabeza', 'cabezas')},
+    'leaf': {'en': ('leaf', 'leaves'), 'fr': ('feuille', 'feuilles'), 'es': ('hoja', 'hojas')},
+    'jar': {'en': ('jar', 'jars'), 'fr': ('pot', 'pots'), 'es': ('frasco', 'frascos')},
+    'bottle': {'en': ('bottle', 'bottles'), 'fr': ('bouteille', 'bouteilles'), 'es': ('botella', 'botellas')},
+    'bag': {'en': ('bag', 'bags'), 'fr': ('sachet', 'sachets'), 'es': ('bolsa', 'bolsas')},
+    'box': {'en': ('box', 'boxes'), 'fr': ('boîte', 'boîtes'), 'es': ('caja', 'cajas')},
+}
+
+UNICODE_FRACTIONS = {
+    '½': '1/2', '⅓': '1/3', '⅔': '2/3', '¼': '1/4', '¾': '3/4', '⅕': '1/5', '⅖': '2/5',
+    '⅗': '3/5', '⅘': '4/5', '⅙': '1/6', '⅚': '5/6', '⅛': '1/8', '⅜': '3/8', '⅝': '5/8', '⅞': '7/8',
+}
+WORD_NUMBERS = {
+    'a': 1.0, 'an': 1.0, 'one': 1.0, 'two': 2.0, 'three': 3.0, 'four': 4.0, 'five': 5.0, 'six': 6.0,
+    'seven': 7.0, 'eight': 8.0, 'nine': 9.0, 'ten': 10.0, 'twelve': 12.0, 'dozen': 12.0, 'half': 0.5,
+}
+
+# "1½" -> "1 1/2", fraction slash unicode -> "/"
+_NORMALIZE = str.maketrans({**{char: f" {fraction}" for char, fraction in UNICODE_FRACTIONS.items()},
+                            '⁄': '/', '–': '-', '—': '-'})
+
+_ALIASES: Dict[str, str] = {alias: unit for unit, (_, _, aliases) in UNITS.items() for alias in aliases}
+
+_NUMBER = r"\d+\s+\d+/\d+|\d+/\d+|\d+(?:[.,]\d+)?"
+_WORD = '|'.join(sorted(WORD_NUMBERS, key=len, reverse=True))
+_UNIT = '|'.join(re.escape(alias).replace(r'\ ', r'\s*') for alias in sorted(_ALIASES, key=len, reverse=True))
+_MEASURE_RE = re.compile(
+    rf"""^\s*
+    (?:(?P<qty>{_NUMBER})(?:\s*(?:-|to|or)\s*(?P<qty_max>{_NUMBER}))?
+      |(?P<word>{_WORD})\b)?
+    \s*(?:\((?P<note>[^)]*)\)\s*)?
+    (?:(?P<unit>{_UNIT})\.?(?!\w))?
+    \s*(?P<rest>.*?)\s*$""",
+    re.IGNORECASE | re.VERBOSE | re.DOTALL)
+
+
+class Measure(NamedTuple):
+    quantity: Optional[float]
+    quantity_max: Optional[float]
+    unit: Optional[str]
+    modifier: str
+
+
+EMPTY = Measure(None, None, None, '')
+
+
+def _number(text: str) -> float:
+    total = 0.0
+    for part in text.split():
+        if '/' in part:
+            numerator, denominator = part.split('/')
+            total += int(numerator) / int(denominator) if int(denominator) else 0.0
+        else:
+            total += float(part.replace(',', '.'))
+    return total
+
+
+def _parse(measure: str) -> Measure:
+    text = measure.translate(_NORMALIZE).strip()
+    if not text:
+        return EMPTY
+    match = _MEASURE_RE.match(text)
+    quantity = quantity_max = None
+    if match['qty']:
+        quantity = _number(match['qty'])
+        if match['qty_max']:
+            quantity_max = _number(match['qty_max'])
+    word = match['word']
+    unit = _ALIASES[re.sub(r'\s+', ' ', match['unit'].lower())] if match['unit'] else None
+    if word and (unit or word.lower() not in ('a', 'an')):
+        quantity = WORD_NUMBERS[word.lower()]
+    elif word:
+        # "a" sans unité derrière ("a little") : pas une quantité
+        return Measure(None, None, None, text)
+    modifier = ' '.join(part for part in (f"({match['note']})" if match['note'] else '', match['rest']) if part)
+    return Measure(quantity, quantity_max, unit, modifier)
+
+
+_cache: Dict[str, Measure] = {}
+
+
+def parse_measure(measure: Optional[str]) -> Measure:
+    """Analyse une mesure (résultat mis en cache par chaîne)"""
+    if not measure:
+        return EMPTY
+    parsed = _cache.get(measure)
+    if parsed is None:
+        parsed = _cache[measure] = _parse(measure)
+    return parsed
+
+
+def parse_measures(measures: Iterable[Optional[str]]) -> List[Measure]:
+    """Analyse une colonne de mesures ; chaque chaîne distincte n'est analysée qu'une fois"""
+    return [parse_measure(measure) for measure in measures]
+
+
+def to_base(measure: Measure) -> Optional[Tuple[str, float]]:
+    """(dimension, quantité en g ou ml) pour une masse ou un volume chiffré, sinon None"""
+    if measure.unit is None or measure.quantity is None:
+        return None
+    dimension, factor, _ = UNITS[measure.unit]
+    if factor is None:
+        return None
+    return dimension, measure.quantity * factor
+
+
+def scale(measure: Measure, factor: float) -> Measure:
+    """Mesure pour factor fois plus de portions"""
+    if measure.quantity is None:
+        return measure
+    quantity_max = measure.quantity_max * factor if measure.quantity_max is not None else None
+    return measure._replace(quantity=measure.quantity * factor, quantity_max=quantity_max)
+
+
+def _format_number(value: float, lang: str) -> str:
+    text = f"{round(value, 2):g}"
+    return text.replace('.', ',') if lang in ('fr', 'es') else text
+
+
+def unit_label(unit: str, lang: str, quantity: Optional[float] = None) -> str:
+    """Libellé d'une unité canonique dans une langue (pluriel selon la quantité)"""
+    singular, plural = UNIT_LABELS[unit].get(lang, UNIT_LABELS[unit]['en'])
+    if quantity is None:
+        return singular
+    # En français, le pluriel commence à 2 ; en anglais et en espagnol, au-delà de 1
+    is_plural = quantity >= 2 if lang == 'fr' else quantity > 1
+    return plural if is_plural else singular
+
+
+def format_measure(measure: Measure, lang: str = 'fr') -> str:
+    """Mesure réécrite dans une langue (le modificateur reste tel quel)"""
+    parts = []
+    if measure.quantity is not None:
+        quantity = _format_number(measure.quantity, lang)
+        if measure.quantity_max is not None:
+            quantity += f"-{_format_number(measure.quantity_max, lang)}"
+        parts.append(quantity)
+    if measure.unit:
+        parts.append(unit_label(measure.unit, lang, measure.quantity_max or measure.quantity))
+    if measure.modifier:
+        parts.append(measure.modifier)
+    return ' '.join(parts)
+
+
+def main():
+    if len(sys.argv) == 2 and sys.argv[1] == 'stats':
+        from recipe_store import load_store
+        with load_store() as recipes:
+            measures = recipes.vocabulary['measure']
+            parsed = parse_measures(measures)
+            counts = recipes.value_counts('measure')
+        rows = sum(counts)
+        with_unit = sum(count for measure, count in zip(parsed, counts) if measure.unit)
+        with_quantity = sum(count for measure, count in zip(parsed, counts) if measure.quantity is not None)
+        print(f"📏 {len(measures)} mesures distinctes pour {rows} lignes ingrédient")
+        if rows:
+            print(f"   {with_quantity / rows:.1%} avec quantité, {with_unit / rows:.1%} avec unité reconnue")
+        unknown = sorted(((count, measure) for measure, parsed_measure, count in zip(measures, parsed, counts)
+                          if measure and not parsed_measure.unit and parsed_measure.modifier), reverse=True)
+        for count, measure in unknown[:15]:
+            print(f"   {count:6d}  {measure}")
+    elif len(sys.argv) > 1:
+        for measure in sys.argv[1:]:
+            parsed = parse_measure(measure)
+            print(f"{measure!r}: {tuple(parsed)}")
+            print(f"   FR: {format_measure(parsed, 'fr')}   ES: {format_measure(parsed, 'es')}")
+    else:
+        print(f"Usage: {sys.argv[0]} <mesure>... | stats")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
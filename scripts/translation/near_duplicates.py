@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Détection des quasi-doublons d'un dictionnaire (MinHash + LSH)
+
+Chaque entrée est découpée en trigrammes de caractères, séparément pour la clé
+anglaise et pour les traductions fr/es (une traduction identique à l'anglais est
+ignorée) ; les espaces sont retirés pour que "corn starch" et "cornstarch" aient
+les mêmes trigrammes. Chaque ensemble reçoit une signature MinHash de
+NUM_HASHES valeurs, découpée en BANDS bandes : deux entrées qui partagent une
+bande dans une langue deviennent candidates. Le travail est donc linéaire en
+nombre d'entrées, seules les paires candidates sont comparées.
+
+Le score d'une paire est la moyenne, sur les langues renseignées des deux côtés,
+de la similarité de Jaccard exacte des trigrammes : "minced pork" / "ground pork"
+ont des clés différentes mais la même traduction. Les paires au-dessus du seuil
+sont regroupées en clusters.
+
+Avec --collapse, chaque cluster est fusionné dans son entrée canonique (connue du
+lexique, puis la plus utilisée dans les recettes et les dictionnaires) : les clés
+qui n'en diffèrent que par les espaces, un pluriel ou une faute de frappe sont
+retirées du dictionnaire et listées dans le champ "aliases" de l'entrée canonique.
+
+Usage:
+    python3 scripts/translation/near_duplicates.py [ingredients|recipe_names|instructions]
+        [--threshold 0.7] [--collapse]
+"""
+
+import random
+import sys
+import time
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from dictionary_store import DICTIONARIES, open_store
+from fuzzy_index import allowed_distance, damerau_levenshtein, is_spelling_variant
+from lexicon import load_lexicon
+from recipe_store import STORE_DIR, VOCABULARY_FILE, RecipeStore
+from text_utils import normalize_text
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : signatures calculées en Python
+    np = None
+
+SHINGLE_SIZE = 3
+NUM_HASHES = 64
+BANDS = 16
+ROWS = NUM_HASHES // BANDS
+DEFAULT_THRESHOLD = 0.7
+LANGUAGES = ('en', 'fr', 'es')
+
+# Permutations (a * x + b) mod PRIME, tirées une fois pour toutes
+PRIME = (1 << 31) - 1
+_rng = random.Random(0)
+HASH_PARAMS = [(_rng.randrange(1, PRIME), _rng.randrange(PRIME)) for _ in range(NUM_HASHES)]
+if np is not None:
+    _A = np.array([a for a, _ in HASH_PARAMS], dtype=np.uint64)[:, None]
+    _B = np.array([b for _, b in HASH_PARAMS], dtype=np.uint64)[:, None]
+
+Shingles = Dict[str, Set[str]]
+
+
+def shingles(text: str) -> Set[str]:
+    text = ''.join(normalize_text(text).split())
+    if len(text) <= SHINGLE_SIZE:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def entry_shingles(key: str, value: Mapping) -> Shingles:
+    """Trigrammes de la clé et des traductions réelles de l'entrée, par langue"""
+    en = (value.get('en') or key).strip().lower()
+    result = {'en': shingles(key)}
+    for lang in ('fr', 'es'):
+        text = (value.get(lang) or '').strip()
+        if text and text.lower() != en:
+            result[lang] = shingles(text)
+    return result
+
+
+def minhash(grams: Set[str]) -> Tuple[int, ...]:
+    hashes = [zlib.crc32(gram.encode('utf-8')) for gram in grams]
+    if np is not None:
+        values = (_A * np.array(hashes, dtype=np.uint64)[None, :] + _B) % PRIME
+        return tuple(values.min(axis=1).tolist())
+    return tuple(min((a * x + b) % PRIME for x in hashes) for a, b in HASH_PARAMS)
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def similarity(a: Shingles, b: Shingles) -> float:
+    """Moyenne des Jaccard sur les langues présentes dans les deux entrées"""
+    scores = [jaccard(a[lang], b[lang]) for lang in LANGUAGES if lang in a and lang in b]
+    return sum(scores) / len(scores) if scores else 0.0
+
+
+def candidate_pairs(grams: Sequence[Shingles]) -> Set[Tuple[int, int]]:
+    """Paires d'entrées (i < j) qui partagent au moins une bande LSH dans une langue"""
+    buckets: Dict[Tuple, List[int]] = {}
+    for i, entry in enumerate(grams):
+        for lang, values in entry.items():
+            if not values:
+                continue
+            signature = minhash(values)
+            for band in range(BANDS):
+                bucket = (lang, band, signature[band * ROWS:(band + 1) * ROWS])
+                buckets.setdefault(bucket, []).append(i)
+    pairs = set()
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                pairs.add((members[x], members[y]))
+    return pairs
+
+
+class Cluster:
+    """Groupe de clés quasi identiques, avec la plus faible similarité qui les relie"""
+
+    def __init__(self, keys: List[str], score: float):
+        self.keys = keys
+        self.score = score
+
+    def __repr__(self):
+        return f"Cluster({self.keys!r}, {self.score:.2f})"
+
+
+def find_clusters(entries: Mapping[str, Mapping], threshold: float = DEFAULT_THRESHOLD) -> List[Cluster]:
+    """Clusters de quasi-doublons, les plus similaires d'abord"""
+    keys = list(entries)
+    grams = [entry_shingles(key, entries[key]) for key in keys]
+    parent = list(range(len(keys)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    links = []
+    for i, j in candidate_pairs(grams):
+        score = similarity(grams[i], grams[j])
+        if score >= threshold:
+            links.append((i, score))
+            parent[find(j)] = find(i)
+
+    groups: Dict[int, List[str]] = {}
+    for i, key in enumerate(keys):
+        groups.setdefault(find(i), []).append(key)
+    weakest: Dict[int, float] = {}
+    for i, score in links:
+        root = find(i)
+        weakest[root] = min(score, weakest.get(root, 1.0))
+    clusters = [Cluster(sorted(members), weakest[root]) for root, members in groups.items() if len(members) > 1]
+    clusters.sort(key=lambda cluster: (-cluster.score, cluster.keys))
+    return clusters
+
+
+def _translated(key: str, value: Mapping) -> int:
+    return len(entry_shingles(key, value)) - 1
+
+
+def word_usage() -> Counter:
+    """Occurrences de chaque mot dans les clés et traductions de tous les dictionnaires"""
+    words = Counter()
+    for name in DICTIONARIES:
+        for key, value in open_store(name).items():
+            texts = [key, *(value.get(lang) or '' for lang in LANGUAGES)] if isinstance(value, dict) else [key]
+            words.update(word for text in texts for word in normalize_text(text).split())
+    return words
+
+
+def recipe_usage(name: str) -> Counter:
+    """Nombre de recettes TheMealDB par ingrédient (ou par nom de recette), vide sans recipe_store"""
+    if name not in ('ingredients', 'recipe_names') or not (STORE_DIR / VOCABULARY_FILE).exists():
+        return Counter()
+    with RecipeStore() as recipes:
+        if name == 'recipe_names':
+            return Counter(meal.strip().lower() for meal in recipes.meal_names.values())
+        return Counter(dict(recipes.ingredient_frequency()))
+
+
+def canonical_key(cluster: Cluster, entries: Mapping[str, Mapping], words: Counter,
+                  recipes: Counter, lexicon_words: Set[str]) -> str:
+    """
+    Entrée gardée : celle dont tous les mots sont connus du lexique, puis la plus
+    utilisée dans les recettes, puis celle dont le mot le plus rare est le plus
+    courant dans les dictionnaires (une faute de frappe y est rare), puis la
+    mieux traduite
+    """
+    def rank(key: str):
+        tokens = normalize_text(key).split() or [key]
+        known = key in lexicon_words or all(token in lexicon_words for token in tokens)
+        usage = min(words[token] for token in tokens)
+        return (not known, -recipes[key], -usage, -_translated(key, entries[key]), len(key), key)
+
+    return min(cluster.keys, key=rank)
+
+
+def _same_word(a: str, b: str, substitution: bool) -> bool:
+    """
+    Même mot au pluriel près ou à une faute de frappe près : lettres ajoutées,
+    retirées ou inversées, et lettre remplacée seulement si substitution est vrai
+    """
+    if a == b or a in (b + 's', b + 'es') or b in (a + 's', a + 'es'):
+        return True
+    limit = min(allowed_distance(a), allowed_distance(b))
+    distance = damerau_levenshtein(a, b, limit)
+    return distance <= limit and (substitution or is_spelling_variant(a, b, distance))
+
+
+def _real_translation(key: str, value: Mapping, lang: str) -> str:
+    text = (value.get(lang) or '').strip()
+    return text if text.lower() not in ('', (value.get('en') or key).strip().lower()) else ''
+
+
+def mergeable(canonical: str, key: str, entries: Mapping[str, Mapping]) -> bool:
+    """
+    Vrai si key peut devenir un alias de canonical : même clé aux espaces près
+    ("corn starch" / "cornstarch"), ou mêmes mots au pluriel ou à une faute de
+    frappe près sans traduction contradictoire (le singulier garde sa traduction
+    au singulier). Une lettre remplacée ("challots" / "shallots") donne souvent
+    un autre mot ("custard" / "mustard") : il faut alors des traductions
+    identiques. Des clés aux mots différents ne sont jamais fusionnées, même
+    traduites à l'identique : les règles par mots-clés donnent la même traduction
+    à des recettes différentes.
+    """
+    words, other = normalize_text(canonical).split(), normalize_text(key).split()
+    if ''.join(words) == ''.join(other):
+        return True
+    pairs = [(_real_translation(canonical, entries[canonical], lang), _real_translation(key, entries[key], lang))
+             for lang in ('fr', 'es')]
+    if any(mine and theirs and mine != theirs for mine, theirs in pairs):
+        return False
+    confirmed = all(mine and mine == theirs for mine, theirs in pairs)
+    return len(words) == len(other) and all(_same_word(a, b, confirmed) for a, b in zip(words, other))
+
+
+def collapse(clusters: Iterable[Cluster], entries: Dict[str, Dict], name: str = 'ingredients') -> Dict[str, List[str]]:
+    """
+    Fusionne chaque cluster dans son entrée canonique (modifie entries).
+    Seules les clés fusionnables avec l'entrée canonique elle-même (mergeable)
+    deviennent des alias, pour ne pas fusionner toute une chaîne de voisins ;
+    l'entrée canonique reprend les traductions qui lui manquent.
+    Retourne {clé canonique: alias ajoutés}.
+    """
+    words = word_usage()
+    recipes = recipe_usage(name)
+    lexicon = load_lexicon()
+    lexicon_words = set(lexicon.words) | set(lexicon.ingredients)
+    merged = {}
+    for cluster in clusters:
+        canonical = canonical_key(cluster, entries, words, recipes, lexicon_words)
+        aliases = [key for key in cluster.keys if key != canonical and mergeable(canonical, key, entries)]
+        if not aliases:
+            continue
+        value = dict(entries[canonical])
+        known = set(value.get('aliases', ()))
+        for key in aliases:
+            alias = entries.pop(key)
+            for lang in ('fr', 'es'):
+                translation = _real_translation(key, alias, lang)
+                if translation and not _real_translation(canonical, value, lang):
+                    value[lang] = translation
+            known.add(key)
+            known.update(alias.get('aliases', ()))
+        value['aliases'] = sorted(known)
+        entries[canonical] = value
+        merged[canonical] = aliases
+    return merged
+
+
+def _option(argv: List[str], name: str) -> Optional[str]:
+    if name not in argv:
+        return None
+    index = argv.index(name) + 1
+    return argv[index] if index < len(argv) else None
+
+
+def main():
+    args = sys.argv[1:]
+    names = [arg for arg in args if arg in DICTIONARIES] or ['ingredients', 'recipe_names']
+    try:
+        threshold = float(_option(args, '--threshold') or DEFAULT_THRESHOLD)
+    except ValueError:
+        threshold = -1.0
+    if not 0 < threshold <= 1 or any(arg.startswith('-') and arg not in ('--threshold', '--collapse')
+                                     for arg in args):
+        print(f"Usage: {sys.argv[0]} [ingredients|recipe_names|instructions] [--threshold 0.7] [--collapse]")
+        sys.exit(1)
+
+    for name in names:
+        store = open_store(name)
+        start = time.perf_counter()
+        clusters = find_clusters(store.entries, threshold)
+        elapsed = time.perf_counter() - start
+        duplicates = sum(len(cluster.keys) - 1 for cluster in clusters)
+        print(f"🔍 {name}: {len(clusters)} cluster(s), {duplicates} doublon(s) probable(s) sur "
+              f"{len(store)} entrées ({elapsed:.2f}s, {'NumPy' if np is not None else 'Python'})")
+        for cluster in clusters[:30]:
+            print(f"   {cluster.score:.2f}  {' | '.join(cluster.keys)}")
+
+        if '--collapse' in args and clusters:
+            before = len(store)
+            merged = collapse(clusters, store.entries, name)
+            written = store.save()
+            print(f"✅ {name}: {before} → {len(store)} entrées ({len(merged)} entrée(s) canonique(s), "
+                  f"{written} modification(s) journalisée(s))")
+
+
+if __name__ == '__main__':
+    main()
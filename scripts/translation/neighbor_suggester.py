@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Suggestions de traduction pour les entrées restées en anglais, par plus proches voisins
+
+Les clés anglaises sont représentées par leurs trigrammes de caractères (avec les
+limites de mots) pondérés TF-IDF et normalisés, rangés dans une matrice creuse CSR
+(indptr / indices / data, comme scipy.sparse). Les lignes non traduites (fr ou es
+identique à l'anglais) sont comparées à toutes les lignes traduites par un seul
+produit matriciel creux U · Tᵀ : avec NumPy, chaque trigramme d'une ligne non
+traduite est joint aux postings de ce trigramme dans T (np.repeat) et les produits
+sont sommés par couple de lignes (np.bincount), par blocs de lignes pour borner la
+mémoire ; sans NumPy, le même calcul est fait par accumulation sur les postings.
+
+Pour chaque entrée, les top-k voisins traduits sont essayés dans l'ordre : quand
+les deux clés ne diffèrent que par des mots remplacés ("smoked paprika" / "sweet
+paprika", "egg" / "eggs"), la traduction du voisin est reprise en remplaçant la
+traduction de ses mots par celle des mots de l'entrée (trie d'expressions de
+translate_all_ingredients, pluriel d'un mot connu).
+
+Usage:
+    python3 scripts/translation/neighbor_suggester.py [ingredients|recipe_names] [--top 5] [--apply]
+"""
+
+import math
+import re
+import sys
+import time
+from array import array
+from collections import Counter
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from dictionary_store import open_store
+from fuzzy_index import is_translated
+from phrase_trie import LANGS, PhraseTrie, _lower_first, _upper_first, tokenize_phrase
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : produit calculé en Python
+    np = None
+
+GRAM_SIZE = 3
+DEFAULT_TOP = 5
+MIN_SIMILARITY = 0.3
+# Taille maximale d'un bloc dense (lignes non traduites × lignes traduites)
+BLOCK_CELLS = 4_000_000
+
+
+def char_ngrams(text: str) -> List[str]:
+    """Trigrammes de chaque mot, bordé d'espaces pour marquer début et fin"""
+    grams = []
+    for word in text.lower().split():
+        word = f" {word} "
+        grams.extend(word[i:i + GRAM_SIZE] for i in range(max(1, len(word) - GRAM_SIZE + 1)))
+    return grams
+
+
+class CsrMatrix:
+    """Matrice creuse ligne par ligne (indptr, indices, data), lignes normalisées L2"""
+
+    def __init__(self, indptr: array, indices: array, data: array, shape: Tuple[int, int]):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+
+    def row(self, i: int) -> Tuple[Sequence[int], Sequence[float]]:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def transpose(self) -> 'CsrMatrix':
+        """Matrice transposée (une ligne par colonne : les postings de chaque trigramme)"""
+        rows, columns = self.shape
+        counts = [0] * (columns + 1)
+        for column in self.indices:
+            counts[column + 1] += 1
+        for column in range(columns):
+            counts[column + 1] += counts[column]
+        indptr = array('i', counts)
+        indices = array('i', bytes(4 * len(self.indices)))
+        data = array('f', bytes(4 * len(self.data)))
+        fill = list(counts[:-1])
+        for i in range(rows):
+            for position in range(self.indptr[i], self.indptr[i + 1]):
+                column = self.indices[position]
+                indices[fill[column]] = i
+                data[fill[column]] = self.data[position]
+                fill[column] += 1
+        return CsrMatrix(indptr, indices, data, (columns, rows))
+
+
+def tfidf_matrix(texts: Sequence[str]) -> Tuple[CsrMatrix, Dict[str, int]]:
+    """Matrice TF-IDF (idf lissé, lignes normalisées) des trigrammes des textes"""
+    counts = [Counter(char_ngrams(text)) for text in texts]
+    frequency = Counter(gram for row in counts for gram in row)
+    vocabulary = {gram: column for column, gram in enumerate(sorted(frequency))}
+    idf = {gram: math.log((1 + len(texts)) / (1 + df)) + 1 for gram, df in frequency.items()}
+
+    indptr, indices, data = array('i', [0]), array('i'), array('f')
+    for row in counts:
+        weights = [count * idf[gram] for gram, count in row.items()]
+        norm = math.sqrt(sum(weight * weight for weight in weights)) or 1.0
+        indices.extend([vocabulary[gram] for gram in row])
+        data.extend([weight / norm for weight in weights])
+        indptr.append(len(indices))
+    return CsrMatrix(indptr, indices, data, (len(texts), len(vocabulary))), vocabulary
+
+
+def _select_rows(matrix: CsrMatrix, rows: Sequence[int]) -> CsrMatrix:
+    indptr, indices, data = array('i', [0]), array('i'), array('f')
+    for i in rows:
+        columns, weights = matrix.row(i)
+        indices.extend(columns)
+        data.extend(weights)
+        indptr.append(len(indices))
+    return CsrMatrix(indptr, indices, data, (len(rows), matrix.shape[1]))
+
+
+def _top_k_numpy(left: CsrMatrix, right_t: CsrMatrix, k: int) -> List[List[Tuple[float, int]]]:
+    indptr = np.frombuffer(left.indptr, dtype=np.int32)
+    columns = np.frombuffer(left.indices, dtype=np.int32)
+    weights = np.frombuffer(left.data, dtype=np.float32)
+    postings_ptr = np.frombuffer(right_t.indptr, dtype=np.int32).astype(np.int64)
+    postings_rows = np.frombuffer(right_t.indices, dtype=np.int32)
+    postings_data = np.frombuffer(right_t.data, dtype=np.float32)
+    n_right = right_t.shape[1]
+    block = max(1, BLOCK_CELLS // max(1, n_right))
+
+    results: List[List[Tuple[float, int]]] = []
+    for first in range(0, left.shape[0], block):
+        last = min(first + block, left.shape[0])
+        start, end = indptr[first], indptr[last]
+        row_of = np.repeat(np.arange(last - first), np.diff(indptr[first:last + 1]))
+        cols, vals = columns[start:end], weights[start:end]
+        # Chaque coefficient non nul est joint à tous les postings de sa colonne
+        lengths = postings_ptr[cols + 1] - postings_ptr[cols]
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        positions = np.repeat(postings_ptr[cols], lengths) + offsets
+        pairs = np.repeat(row_of, lengths).astype(np.int64) * n_right + postings_rows[positions]
+        products = np.repeat(vals, lengths) * postings_data[positions]
+        scores = np.bincount(pairs, weights=products, minlength=(last - first) * n_right)
+        scores = scores.reshape(last - first, n_right)
+
+        top = min(k, n_right)
+        best = np.argpartition(-scores, top - 1, axis=1)[:, :top]
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind='stable')
+        best = np.take_along_axis(best, order, axis=1).tolist()
+        best_scores = np.take_along_axis(best_scores, order, axis=1).tolist()
+        for row, row_scores in zip(best, best_scores):
+            results.append([(score, j) for score, j in zip(row_scores, row) if score > 0])
+    return results
+
+
+def _top_k_python(left: CsrMatrix, right_t: CsrMatrix, k: int) -> List[List[Tuple[float, int]]]:
+    results = []
+    for i in range(left.shape[0]):
+        scores: Dict[int, float] = {}
+        for column, weight in zip(*left.row(i)):
+            for j, other in zip(*right_t.row(column)):
+                scores[j] = scores.get(j, 0.0) + weight * other
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        results.append([(score, j) for j, score in best])
+    return results
+
+
+def nearest_translated(entries: Mapping[str, Mapping[str, str]], k: int = DEFAULT_TOP
+                       ) -> Dict[str, List[Tuple[float, str]]]:
+    """{clé non traduite: [(similarité cosinus, clé traduite)...]} par similarité décroissante"""
+    keys = list(entries)
+    matrix, _ = tfidf_matrix(keys)
+    translated = [i for i, key in enumerate(keys) if is_translated(key, entries[key])]
+    untranslated = [i for i, key in enumerate(keys) if not is_translated(key, entries[key])]
+    if not translated or not untranslated:
+        return {}
+    left = _select_rows(matrix, untranslated)
+    right_t = _select_rows(matrix, translated).transpose()
+    top_k = _top_k_numpy if np is not None else _top_k_python
+    return {keys[untranslated[i]]: [(score, keys[translated[j]]) for score, j in row]
+            for i, row in enumerate(top_k(left, right_t, k))}
+
+
+def _plural(text: str) -> str:
+    words = text.split(' ', 1)
+    if words[0][-1:] in ('s', 'x', 'z'):
+        return text
+    return ' '.join([words[0] + 's', *words[1:]])
+
+
+def _word_translation(trie: PhraseTrie, word: str, neighbor_word: str) -> Optional[Dict[str, str]]:
+    translation = trie.longest_match((word,), 0)[1]
+    if translation is None and word in (neighbor_word + 's', neighbor_word + 'es'):
+        # Pluriel d'un mot connu : "egg" / "eggs" -> "Œuf" / "Œufs"
+        singular = trie.longest_match((neighbor_word,), 0)[1]
+        if singular is not None:
+            translation = {lang: _plural(singular[lang]) for lang in LANGS}
+    return translation
+
+
+def derive_translation(key: str, neighbor: str, neighbor_value: Mapping[str, str],
+                       trie: PhraseTrie) -> Optional[Dict[str, str]]:
+    """
+    Traduction de key calquée sur celle du voisin, si les deux clés ont le même
+    nombre de mots et que chaque mot remplacé est traduisible et retrouvé dans la
+    traduction du voisin ; None sinon
+    """
+    words, neighbor_words = tokenize_phrase(key), tokenize_phrase(neighbor)
+    if len(words) != len(neighbor_words):
+        return None
+    # Un mot remplacé sans mot commun n'est plus un motif (sauf pluriel : "egg" / "eggs")
+    if not any(word == neighbor_word or word in (neighbor_word + 's', neighbor_word + 'es')
+               for word, neighbor_word in zip(words, neighbor_words)):
+        return None
+    result = {lang: neighbor_value[lang] for lang in LANGS}
+    for word, neighbor_word in zip(words, neighbor_words):
+        if word == neighbor_word:
+            continue
+        new, old = _word_translation(trie, word, neighbor_word), _word_translation(trie, neighbor_word, word)
+        if new is None or old is None:
+            return None
+        for lang in LANGS:
+            pattern = re.compile(rf"(?<!\w){re.escape(old[lang])}(?!\w)", re.IGNORECASE)
+            match = pattern.search(result[lang])
+            if match is None:
+                return None
+            replacement = _upper_first(new[lang]) if match.group()[:1].isupper() else _lower_first(new[lang])
+            result[lang] = result[lang][:match.start()] + replacement + result[lang][match.end():]
+    if any(result[lang].strip().lower() == key for lang in LANGS):
+        return None
+    return result
+
+
+def suggest(entries: Mapping[str, Mapping[str, str]], trie: PhraseTrie, k: int = DEFAULT_TOP,
+            min_similarity: float = MIN_SIMILARITY) -> Dict[str, Tuple[str, float, Optional[Dict[str, str]]]]:
+    """
+    {clé non traduite: (voisin, similarité, traduction proposée ou None)} : premier
+    voisin dont le motif s'applique, sinon le plus proche (sans proposition)
+    """
+    suggestions = {}
+    for key, neighbors in nearest_translated(entries, k).items():
+        neighbors = [(score, neighbor) for score, neighbor in neighbors if score >= min_similarity]
+        if not neighbors:
+            continue
+        suggestions[key] = (neighbors[0][1], neighbors[0][0], None)
+        for score, neighbor in neighbors:
+            proposal = derive_translation(key, neighbor, entries[neighbor], trie)
+            if proposal is not None:
+                suggestions[key] = (neighbor, score, proposal)
+                break
+    return suggestions
+
+
+def _option(argv: List[str], name: str) -> Optional[str]:
+    if name not in argv:
+        return None
+    index = argv.index(name) + 1
+    return argv[index] if index < len(argv) else None
+
+
+def main():
+    args = sys.argv[1:]
+    name = next((arg for arg in args if arg in ('ingredients', 'recipe_names')), 'ingredients')
+    top = _option(args, '--top') or str(DEFAULT_TOP)
+    if not top.isdigit() or int(top) < 1:
+        print(f"Usage: {sys.argv[0]} [ingredients|recipe_names] [--top 5] [--apply]")
+        sys.exit(1)
+    from translate_all_ingredients import phrase_trie
+
+    store = open_store(name)
+    start = time.perf_counter()
+    suggestions = suggest(store.entries, phrase_trie(), int(top))
+    elapsed = time.perf_counter() - start
+    proposals = {key: proposal for key, (_, _, proposal) in suggestions.items() if proposal}
+    print(f"🧭 {name}: {len(suggestions)} entrée(s) non traduite(s) avec un voisin traduit, "
+          f"{len(proposals)} proposition(s) ({elapsed:.2f}s, {'NumPy' if np is not None else 'Python'})")
+    for key, (neighbor, score, proposal) in list(suggestions.items())[:40]:
+        found = f"FR={proposal['fr']}, ES={proposal['es']}" if proposal else "aucun motif applicable"
+        print(f"   {key} ≈ {neighbor} ({score:.2f}) → {found}")
+
+    if '--apply' in args and proposals:
+        for key, proposal in proposals.items():
+            value = dict(store.entries[key])
+            en = (value.get('en') or key).strip().lower()
+            for lang in LANGS:
+                # Seules les langues encore en anglais sont remplies
+                if (value.get(lang) or '').strip().lower() in ('', en):
+                    value[lang] = proposal[lang]
+            store.set(key, value)
+        written = store.save()
+        print(f"✅ {len(proposals)} traduction(s) proposée(s) appliquée(s) "
+              f"({written} modification(s) journalisée(s) pour {store.json_file.name})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Trie d'expressions (au niveau des mots) pour la traduction compositionnelle
+
+Toutes les expressions connues (lexique partagé lexicon.json, dictionnaire JSON,
+tables de mots simples) sont insérées mot par mot dans un trie. Un ingrédient
+inconnu comme "smoked haddock fillets" est découpé en un seul passage de gauche
+à droite en plus longues expressions connues ("smoked haddock" + "fillets"),
+puis recomposé si tous les segments sont connus et que le dernier (le nom
+principal en anglais) est composable (compound_heads du lexique : fillets, loin,
+juice...) : il passe en tête, "Filets d'églefin fumé" / "Filetes de eglefino
+ahumado". Les autres noms ne sont pas composés ("beef tomatoes" n'est pas
+"Tomates de bœuf"), et un seul mot inconnu suffit à ne rien proposer : "Red
+oignon" passerait pour une traduction et ne serait plus jamais revu par les
+passes suivantes.
+
+La traduction de chaque segment est mémorisée, le coût est linéaire en nombre
+de mots (à longueur d'expression maximale bornée).
+
+Les entrées du dictionnaire peuvent aussi être cherchées sans copie dans une
+table attachée (attach_dictionary, ex. section mmap du dictionnaire compilé) :
+seuls le lexique et les mots simples sont alors rangés dans le trie.
+"""
+
+from typing import AbstractSet, Dict, Iterable, List, Mapping, Optional, Tuple
+
+LANGS = ('fr', 'es')
+_FR_ELISION = tuple('aeiouyhàâéèêëîïôœù')
+_PUNCTUATION = ',.;:()"\''
+
+
+def tokenize_phrase(text: str) -> Tuple[str, ...]:
+    """Découpe un nom d'ingrédient en mots minuscules (les tirets sont conservés)"""
+    return tuple(token for token in (raw.strip(_PUNCTUATION) for raw in text.lower().split())
+                 if token)
+
+
+def _lower_first(text: str) -> str:
+    return text[:1].lower() + text[1:]
+
+
+def _upper_first(text: str) -> str:
+    return text[:1].upper() + text[1:]
+
+
+def _dictionary_translation(key: str, value: Optional[Mapping[str, str]]) -> Optional[Dict[str, str]]:
+    """Traduction d'une entrée du dictionnaire, None si une langue reste en anglais"""
+    if not value:
+        return None
+    en = (value.get('en') or key).strip().lower()
+    if any((value.get(lang) or '').strip().lower() in ('', en) for lang in LANGS):
+        return None
+    return {lang: value[lang] for lang in LANGS}
+
+
+class PhraseTrie:
+    """Trie de mots -> traduction {"fr", "es"}"""
+
+    _VALUE = object()
+    _RANK = object()
+    # Priorité à longueur égale : tables d'expressions, dictionnaire, mots simples
+    TABLE, DICTIONARY, WORD = 0, 1, 2
+
+    def __init__(self):
+        self._root: Dict = {}
+        self._segment_cache: Dict[Tuple[str, ...], List[Tuple[Tuple[str, ...], Optional[Dict]]]] = {}
+        self._dictionary: Optional[Mapping[str, Mapping[str, str]]] = None
+        self._dictionary_words = 0
+        # Noms principaux (en anglais) qui acceptent des compléments : "fillets" -> "Filets de ..."
+        self.compound_heads: AbstractSet[str] = frozenset()
+        self.size = 0
+
+    def add(self, phrase: str, translation: Dict[str, str], overwrite: bool = False, rank: int = TABLE):
+        tokens = tokenize_phrase(phrase)
+        if not tokens or not all(translation.get(lang) for lang in LANGS):
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if overwrite or self._VALUE not in node:
+            if self._VALUE not in node:
+                self.size += 1
+            node[self._VALUE] = {lang: translation[lang] for lang in LANGS}
+            node[self._RANK] = rank
+            self._segment_cache.clear()
+
+    def attach_dictionary(self, entries: Mapping[str, Mapping[str, str]], max_words: Optional[int] = None):
+        """
+        Cherche les entrées traduites du dictionnaire directement dans entries (get)
+        au lieu de les copier dans le trie : une section mmap du dictionnaire compilé
+        reste partagée entre les processus. max_words (nombre maximal de mots d'une
+        clé, écrit dans l'en-tête du dictionnaire compilé) n'est recalculé en
+        parcourant toutes les clés que s'il n'est pas fourni
+        """
+        if max_words is None:
+            max_words = max((len(tokenize_phrase(key)) for key in entries.keys()), default=0)
+        self._dictionary = entries
+        self._dictionary_words = max_words
+        self._segment_cache.clear()
+
+    def add_all(self, table: Dict[str, Dict[str, str]], overwrite: bool = False):
+        for phrase, translation in table.items():
+            self.add(phrase, translation, overwrite)
+
+    def add_word_table(self, table: Dict[str, Dict[str, str]], overwrite: bool = False):
+        """Ajoute une table {'fr': {mot: trad}, 'es': {mot: trad}}"""
+        for word in set(table.get('fr', {})) & set(table.get('es', {})):
+            self.add(word, {lang: table[lang][word] for lang in LANGS}, overwrite, rank=self.WORD)
+
+    def longest_match(self, tokens: Tuple[str, ...], start: int) -> Tuple[int, Optional[Dict]]:
+        """Fin et traduction de la plus longue expression connue commençant à start"""
+        node = self._root
+        best_end, best_value, best_rank = start, None, self.WORD
+        for index in range(start, len(tokens)):
+            node = node.get(tokens[index])
+            if node is None:
+                break
+            value = node.get(self._VALUE)
+            if value is not None:
+                best_end, best_value, best_rank = index + 1, value, node[self._RANK]
+        if self._dictionary is not None:
+            # Expression du dictionnaire attaché plus longue (ou de même longueur qu'un mot simple)
+            lowest = best_end if best_value is not None and best_rank > self.DICTIONARY else best_end + 1
+            for end in range(min(len(tokens), start + self._dictionary_words), max(lowest, start + 1) - 1, -1):
+                phrase = ' '.join(tokens[start:end])
+                value = _dictionary_translation(phrase, self._dictionary.get(phrase))
+                if value is not None:
+                    return end, value
+        return best_end, best_value
+
+    def segment(self, tokens: Tuple[str, ...]) -> List[Tuple[Tuple[str, ...], Optional[Dict]]]:
+        """Découpe en plus longues expressions connues (les mots inconnus sont isolés)"""
+        cached = self._segment_cache.get(tokens)
+        if cached is not None:
+            return cached
+        segments = []
+        start = 0
+        while start < len(tokens):
+            end, value = self.longest_match(tokens, start)
+            if value is None:
+                segments.append((tokens[start:start + 1], None))
+                start += 1
+            else:
+                segments.append((tokens[start:end], value))
+                start = end
+        self._segment_cache[tokens] = segments
+        return segments
+
+    def translate(self, text: str) -> Optional[Dict[str, str]]:
+        """Traduction composée, ou None si un segment n'est pas connu ou si le nom principal n'est pas composable"""
+        tokens = tokenize_phrase(text)
+        if not tokens:
+            return None
+        segments = self.segment(tokens)
+        if any(value is None for _, value in segments):
+            return None
+        if len(segments) > 1 and ' '.join(segments[-1][0]) not in self.compound_heads:
+            return None
+
+        result = {}
+        head, modifiers = segments[-1][1], [value for _, value in reversed(segments[:-1])]
+        for lang in LANGS:
+            parts = [_upper_first(head[lang])]
+            for modifier in modifiers:
+                word = _lower_first(modifier[lang])
+                if lang == 'fr' and word.startswith(_FR_ELISION):
+                    parts.append(f"d'{word}")
+                else:
+                    parts.append(f"de {word}")
+            result[lang] = ' '.join(parts)
+        return result
+
+
+def build_phrase_trie(tables: Iterable[Dict[str, Dict[str, str]]] = (),
+                      word_tables: Iterable[Dict[str, Dict[str, str]]] = (),
+                      dictionary_entries: Optional[Dict[str, Dict[str, str]]] = None,
+                      dictionary: Optional[Mapping[str, Mapping[str, str]]] = None,
+                      compound_heads: Iterable[str] = (),
+                      dictionary_words: Optional[int] = None) -> PhraseTrie:
+    """
+    Construit un trie à partir des tables d'expressions (prioritaires, dans l'ordre),
+    des tables de mots simples et des entrées déjà traduites du dictionnaire JSON
+    (copiées dans le trie), ou d'un dictionnaire consulté sans copie (attach_dictionary).
+    Seuls les noms principaux de compound_heads sont composés avec leurs compléments.
+    dictionary_words (nombre maximal de mots d'une clé de dictionary) évite de
+    parcourir toutes ses clés.
+    """
+    trie = PhraseTrie()
+    trie.compound_heads = frozenset(compound_heads)
+    for table in tables:
+        trie.add_all(table)
+    if dictionary_entries:
+        for key, value in dictionary_entries.items():
+            translation = _dictionary_translation(key, value)
+            if translation is not None:
+                trie.add(key, translation, rank=PhraseTrie.DICTIONARY)
+    if dictionary is not None:
+        trie.attach_dictionary(dictionary, dictionary_words)
+    for table in word_tables:
+        trie.add_word_table(table)
+    return trie
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Stockage colonnaire local des recettes TheMealDB
+
+Chaque recette synchronisée est aplatie en une ligne par ingrédient, rangée dans
+des colonnes d'entiers 32 bits :
+    meal        idMeal
+    position    numéro de l'ingrédient dans la recette (1 à 20)
+    ingredient  code de l'ingrédient (minuscules) dans le vocabulaire
+    measure     code de la mesure
+    category    code de la catégorie de la recette
+    area        code de la zone de la recette
+Les chaînes ne sont stockées qu'une fois, dans vocabulary.json ; un ingrédient cité
+deux fois dans une recette ne garde que sa première ligne, donc le nombre de lignes
+d'un ingrédient est son nombre de recettes.
+
+Chaque colonne est un fichier .npy (format NumPy standard, écrit sans NumPy) dans
+data/culinary_dictionaries/recipe_columns/. Le lecteur les ouvre avec mmap, sans
+copie : en tableaux NumPy si NumPy est installé (requêtes vectorisées : bincount,
+masques), sinon en memoryview parcourues par les boucles C de Counter et compress.
+
+Usage:
+    python3 scripts/translation/recipe_store.py build [recettes.jsonl]
+    python3 scripts/translation/recipe_store.py top [n]
+    python3 scripts/translation/recipe_store.py uses "olive oil"
+    python3 scripts/translation/recipe_store.py breakdown [category|area] [ingrédient]
+"""
+
+import ast
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from collections import Counter
+from itertools import compress
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dictionary_store import WORK_DIR
+from mealdb_sync import MEALS_FILE, load_meals
+from streaming_extraction import iter_meals
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : lecture par memoryview
+    np = None
+
+STORE_DIR = WORK_DIR / 'recipe_columns'
+VOCABULARY_FILE = 'vocabulary.json'
+COLUMNS = ('meal', 'position', 'ingredient', 'measure', 'category', 'area')
+# Colonnes dont les valeurs sont des codes dans le vocabulaire
+ENCODED = ('ingredient', 'measure', 'category', 'area')
+
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+_NPY_DESCR = '<i4'
+
+
+class _Vocabulary:
+    """Chaînes distinctes d'une colonne, numérotées dans l'ordre d'apparition"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+
+def _write_npy(path: Path, values: array):
+    """Écrit un tableau int32 au format .npy version 1.0 (en-tête aligné sur 64 octets)"""
+    header = f"{{'descr': '{_NPY_DESCR}', 'fortran_order': False, 'shape': ({len(values)},), }}"
+    padding = -(len(_NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = (header + ' ' * padding + '\n').encode('latin-1')
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    with open(path, 'wb') as f:
+        f.write(_NPY_MAGIC + struct.pack('<H', len(header)) + header)
+        values.tofile(f)
+
+
+def _npy_layout(mm) -> Tuple[int, int]:
+    """(offset des données, nombre de valeurs) d'un fichier .npy écrit par _write_npy"""
+    if mm[:len(_NPY_MAGIC)] != _NPY_MAGIC:
+        raise ValueError("fichier .npy invalide")
+    header_length, = struct.unpack_from('<H', mm, len(_NPY_MAGIC))
+    offset = len(_NPY_MAGIC) + 2
+    header = ast.literal_eval(mm[offset:offset + header_length].decode('latin-1'))
+    if header['descr'] != _NPY_DESCR or header['fortran_order'] or len(header['shape']) != 1:
+        raise ValueError(f"colonne .npy non supportée: {header}")
+    return offset + header_length, header['shape'][0]
+
+
+def build_store(meals: Iterable[Dict], store_dir: Path = STORE_DIR, source: Optional[Path] = None) -> Path:
+    """
+    Aplatit les recettes en colonnes et remplace le stockage de façon atomique (les
+    lecteurs ouverts gardent l'ancienne version). source est le fichier de recettes
+    dont dépend le stockage (voir is_stale).
+    """
+    columns = {name: array('i') for name in COLUMNS}
+    vocabularies = {name: _Vocabulary() for name in ENCODED}
+    names: Dict[str, str] = {}
+    for meal in meals:
+        meal_id = str(meal.get('idMeal') or '')
+        if not meal_id.isdigit() or meal_id in names:
+            continue
+        names[meal_id] = meal.get('strMeal') or ''
+        category = vocabularies['category'].code((meal.get('strCategory') or '').strip())
+        area = vocabularies['area'].code((meal.get('strArea') or '').strip())
+        seen = set()
+        for position in range(1, 21):
+            ingredient = (meal.get(f'strIngredient{position}') or '').strip().lower()
+            if not ingredient or ingredient in seen:
+                continue
+            seen.add(ingredient)
+            columns['meal'].append(int(meal_id))
+            columns['position'].append(position)
+            columns['ingredient'].append(vocabularies['ingredient'].code(ingredient))
+            columns['measure'].append(vocabularies['measure'].code((meal.get(f'strMeasure{position}') or '').strip()))
+            columns['category'].append(category)
+            columns['area'].append(area)
+
+    store_dir.parent.mkdir(parents=True, exist_ok=True)
+    build_dir = Path(tempfile.mkdtemp(prefix=f"{store_dir.name}-", dir=store_dir.parent))
+    for name, values in columns.items():
+        _write_npy(build_dir / f"{name}.npy", values)
+    vocabulary = {name: list(vocabularies[name].codes) for name in ENCODED}
+    vocabulary['meal_names'] = names
+    vocabulary['source'] = _source_signature(source)
+    with open(build_dir / VOCABULARY_FILE, 'w', encoding='utf-8') as f:
+        json.dump(vocabulary, f, ensure_ascii=False)
+
+    # Un répertoire non vide ne peut pas être remplacé directement : ancien mis de côté puis supprimé
+    previous = None
+    if store_dir.exists():
+        previous = Path(tempfile.mkdtemp(prefix=f"{store_dir.name}-old-", dir=store_dir.parent))
+        os.replace(store_dir, previous / store_dir.name)
+    os.replace(build_dir, store_dir)
+    if previous is not None:
+        shutil.rmtree(previous, ignore_errors=True)
+    return store_dir
+
+
+def _source_signature(source: Optional[Path]) -> Optional[List[int]]:
+    if source is None or not source.exists():
+        return None
+    stat = source.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def is_stale(store_dir: Path = STORE_DIR, source: Path = MEALS_FILE) -> bool:
+    """Vrai si le stockage est absent ou construit à partir d'une autre version de source"""
+    vocabulary_file = store_dir / VOCABULARY_FILE
+    if not vocabulary_file.exists():
+        return True
+    with open(vocabulary_file, 'r', encoding='utf-8') as f:
+        built_from = json.load(f).get('source')
+    return built_from != _source_signature(source)
+
+
+class RecipeStore:
+    """Colonnes ouvertes par mmap (tableaux NumPy ou memoryview int32, sans copie)"""
+
+    def __init__(self, store_dir: Path = STORE_DIR):
+        self.store_dir = Path(store_dir)
+        with open(self.store_dir / VOCABULARY_FILE, 'r', encoding='utf-8') as f:
+            self.vocabulary: Dict = json.load(f)
+        self.meal_names: Dict[str, str] = self.vocabulary['meal_names']
+        self._codes: Dict[str, Dict[str, int]] = {}
+        self._maps: List[mmap.mmap] = []
+        self.columns = {name: self._open_column(name) for name in COLUMNS}
+
+    def _open_column(self, name: str):
+        with open(self.store_dir / f"{name}.npy", 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mm)
+        offset, count = _npy_layout(mm)
+        if np is not None:
+            return np.frombuffer(mm, dtype=_NPY_DESCR, count=count, offset=offset)
+        return memoryview(mm)[offset:offset + 4 * count].cast('i')
+
+    def __len__(self) -> int:
+        return len(self.columns['meal'])
+
+    @property
+    def meal_count(self) -> int:
+        return len(self.meal_names)
+
+    def code(self, column: str, value: str) -> Optional[int]:
+        """Code d'une valeur dans le vocabulaire d'une colonne (None si absente)"""
+        codes = self._codes.get(column)
+        if codes is None:
+            codes = self._codes[column] = {text: code for code, text in enumerate(self.vocabulary[column])}
+        return codes.get(value)
+
+    def _counts(self, values, size: int) -> List[int]:
+        if np is not None:
+            return np.bincount(values, minlength=size).tolist()
+        counts = [0] * size
+        for code, count in Counter(values).items():
+            counts[code] = count
+        return counts
+
+    def value_counts(self, column: str) -> List[int]:
+        """Nombre de lignes par code du vocabulaire d'une colonne codée"""
+        return self._counts(self.columns[column], len(self.vocabulary[column]))
+
+    def _rows_of(self, column, ingredient: str):
+        """Valeurs de column sur les lignes d'un ingrédient (vide s'il est inconnu)"""
+        code = self.code('ingredient', ingredient.strip().lower())
+        codes = self.columns['ingredient']
+        if np is not None:
+            return column[codes == code] if code is not None else column[:0]
+        if code is None:
+            return []
+        return list(compress(column, map(code.__eq__, codes)))
+
+    def ingredient_frequency(self, top: Optional[int] = None) -> List[Tuple[str, int]]:
+        """(ingrédient, nombre de recettes) du plus fréquent au moins fréquent"""
+        names = self.vocabulary['ingredient']
+        counts = self.value_counts('ingredient')
+        ranked = sorted(zip(names, counts), key=lambda item: (-item[1], item[0]))
+        return ranked[:top] if top is not None else ranked
+
+    def recipes_using(self, ingredient: str) -> List[int]:
+        """idMeal (triés) des recettes qui utilisent l'ingrédient"""
+        meals = self._rows_of(self.columns['meal'], ingredient)
+        if np is not None:
+            return np.unique(meals).tolist()
+        return sorted(set(meals))
+
+    def breakdown(self, by: str = 'category', ingredient: Optional[str] = None) -> Dict[str, int]:
+        """
+        Nombre de recettes par catégorie (ou par zone avec by='area'), toutes recettes
+        confondues ou seulement celles qui utilisent ingredient
+        """
+        if by not in ('category', 'area'):
+            raise ValueError(f"répartition par 'category' ou 'area', pas '{by}'")
+        column = self.columns[by]
+        if ingredient is not None:
+            values = self._rows_of(column, ingredient)
+        else:
+            # Une ligne par recette : la première, les lignes d'une recette étant contiguës
+            meals = self.columns['meal']
+            if np is not None:
+                first = np.ones(len(meals), dtype=bool)
+                first[1:] = meals[1:] != meals[:-1]
+                values = column[first]
+            else:
+                values = list(compress(column, (i == 0 or meals[i] != meals[i - 1] for i in range(len(meals)))))
+        names = self.vocabulary[by]
+        counts = self._counts(values, len(names))
+        return {name: count for name, count in sorted(zip(names, counts), key=lambda item: (-item[1], item[0]))
+                if count}
+
+    def top_by_category(self, top: int = 5, by: str = 'category') -> Dict[str, List[Tuple[str, int]]]:
+        """Ingrédients les plus fréquents de chaque catégorie (ou zone)"""
+        groups, ingredients = self.vocabulary[by], self.vocabulary['ingredient']
+        column, codes = self.columns[by], self.columns['ingredient']
+        if np is not None:
+            # Comptage de tous les couples (groupe, ingrédient) en un seul bincount
+            pairs = column.astype(np.int64) * len(ingredients) + codes
+            matrix = np.bincount(pairs, minlength=len(groups) * len(ingredients)).reshape(len(groups), -1)
+            result = {}
+            for group, row in zip(groups, matrix):
+                best = np.argsort(-row, kind='stable')[:top]
+                result[group] = [(ingredients[i], int(row[i])) for i in best if row[i]]
+            return result
+        pairs = Counter(zip(column, codes))
+        ranked: Dict[str, List[Tuple[str, int]]] = {group: [] for group in groups}
+        for (group, code), count in sorted(pairs.items(), key=lambda item: (-item[1], item[0][1])):
+            if len(ranked[groups[group]]) < top:
+                ranked[groups[group]].append((ingredients[code], count))
+        return ranked
+
+    def close(self):
+        # Les vues doivent être libérées avant les mmap
+        for column in self.columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        self.columns = {}
+        for mm in self._maps:
+            try:
+                mm.close()
+            except BufferError:
+                # Un tableau NumPy est encore référencé ailleurs : le mmap sera libéré avec lui
+                pass
+        self._maps = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_store(store_dir: Path = STORE_DIR, rebuild: bool = True) -> RecipeStore:
+    """Ouvre le stockage, en le reconstruisant si mealdb_meals.jsonl a changé depuis"""
+    if rebuild and is_stale(store_dir) and MEALS_FILE.exists():
+        build_store(load_meals().values(), store_dir, source=MEALS_FILE)
+    return RecipeStore(store_dir)
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'build' and len(sys.argv) <= 3:
+        if len(sys.argv) == 3:
+            path = build_store(iter_meals(Path(sys.argv[2])))
+        else:
+            path = build_store(load_meals().values(), source=MEALS_FILE)
+        with RecipeStore(path) as recipes:
+            print(f"📚 {recipes.meal_count} recettes, {len(recipes)} lignes ingrédient, "
+                  f"{len(recipes.vocabulary['ingredient'])} ingrédients distincts")
+        print(f"✅ Stockage colonnaire: {path} ({'NumPy' if np is not None else 'memoryview'})")
+    elif command == 'top' and len(sys.argv) <= 3:
+        with load_store() as recipes:
+            for ingredient, count in recipes.ingredient_frequency(int(sys.argv[2]) if len(sys.argv) == 3 else 20):
+                print(f"   {count:6d}  {ingredient}")
+    elif command == 'uses' and len(sys.argv) == 3:
+        with load_store() as recipes:
+            meal_ids = recipes.recipes_using(sys.argv[2])
+            print(f"🍽️  {len(meal_ids)} recette(s) utilisent '{sys.argv[2]}'")
+            for meal_id in meal_ids:
+                print(f"   {meal_id}  {recipes.meal_names.get(str(meal_id), '')}")
+    elif command == 'breakdown' and len(sys.argv) <= 4:
+        by = sys.argv[2] if len(sys.argv) > 2 else 'category'
+        with load_store() as recipes:
+            for name, count in recipes.breakdown(by, sys.argv[3] if len(sys.argv) == 4 else None).items():
+                print(f"   {count:6d}  {name or '(aucune)'}")
+    else:
+        print(f"Usage: {sys.argv[0]} build [recettes.jsonl] | top [n] | uses <ingrédient> "
+              f"| breakdown [category|area] [ingrédient]")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
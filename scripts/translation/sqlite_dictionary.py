@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Backend SQLite optionnel pour les dictionnaires culinaires
+
+Les dictionnaires (ingrédients, noms de recettes, instructions) sont copiés dans
+des tables SQLite indexées, avec une table virtuelle FTS5 sur le texte normalisé
+en/fr/es. La synchronisation avec les fichiers JSON est bidirectionnelle :
+  - JSON -> SQLite : les entrées modifiées dans les JSON (ou leur journal) sont recopiées
+  - SQLite -> JSON : les entrées modifiées via ce backend sont journalisées dans le store
+
+La base vit à côté de data/database.sqlite et peut être lue par le backend Node
+(table dictionary_entries : dictionary, key, en, fr, es, updated_at).
+
+Usage:
+    python3 scripts/translation/sqlite_dictionary.py sync
+    python3 scripts/translation/sqlite_dictionary.py search instructions "heat the oil"
+    python3 scripts/translation/sqlite_dictionary.py stats
+"""
+
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dictionary_store import DICTIONARIES, PROJECT_ROOT, content_hash, open_store, serialize_dictionary
+from text_utils import normalize_text, tokenize
+
+DATABASE_FILE = PROJECT_ROOT / 'data' / 'culinary_dictionaries.sqlite'
+LANGUAGES = ('en', 'fr', 'es')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dictionary_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dictionary TEXT NOT NULL,
+    key TEXT NOT NULL,
+    en TEXT NOT NULL DEFAULT '',
+    fr TEXT NOT NULL DEFAULT '',
+    es TEXT NOT NULL DEFAULT '',
+    norm_key TEXT NOT NULL DEFAULT '',
+    norm_en TEXT NOT NULL DEFAULT '',
+    norm_fr TEXT NOT NULL DEFAULT '',
+    norm_es TEXT NOT NULL DEFAULT '',
+    dirty INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    UNIQUE (dictionary, key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_dictionary_entries_dirty
+    ON dictionary_entries (dictionary, dirty);
+
+CREATE TABLE IF NOT EXISTS dictionary_sync (
+    dictionary TEXT PRIMARY KEY,
+    content_sha256 TEXT NOT NULL,
+    last_updated TEXT,
+    synced_at TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS dictionary_fts USING fts5(
+    norm_key, norm_en, norm_fr, norm_es,
+    content='dictionary_entries', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS dictionary_entries_ai AFTER INSERT ON dictionary_entries BEGIN
+    INSERT INTO dictionary_fts (rowid, norm_key, norm_en, norm_fr, norm_es)
+    VALUES (new.id, new.norm_key, new.norm_en, new.norm_fr, new.norm_es);
+END;
+
+CREATE TRIGGER IF NOT EXISTS dictionary_entries_ad AFTER DELETE ON dictionary_entries BEGIN
+    INSERT INTO dictionary_fts (dictionary_fts, rowid, norm_key, norm_en, norm_fr, norm_es)
+    VALUES ('delete', old.id, old.norm_key, old.norm_en, old.norm_fr, old.norm_es);
+END;
+
+CREATE TRIGGER IF NOT EXISTS dictionary_entries_au AFTER UPDATE ON dictionary_entries BEGIN
+    INSERT INTO dictionary_fts (dictionary_fts, rowid, norm_key, norm_en, norm_fr, norm_es)
+    VALUES ('delete', old.id, old.norm_key, old.norm_en, old.norm_fr, old.norm_es);
+    INSERT INTO dictionary_fts (rowid, norm_key, norm_en, norm_fr, norm_es)
+    VALUES (new.id, new.norm_key, new.norm_en, new.norm_fr, new.norm_es);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO dictionary_entries
+    (dictionary, key, en, fr, es, norm_key, norm_en, norm_fr, norm_es, dirty, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (dictionary, key) DO UPDATE SET
+    en = excluded.en, fr = excluded.fr, es = excluded.es,
+    norm_key = excluded.norm_key, norm_en = excluded.norm_en,
+    norm_fr = excluded.norm_fr, norm_es = excluded.norm_es,
+    dirty = excluded.dirty, updated_at = excluded.updated_at
+"""
+
+
+def _row_values(name: str, key: str, value: Dict, dirty: int, now: str) -> Tuple:
+    texts = [value.get(lang, '') or '' for lang in LANGUAGES]
+    return (name, key, *texts, normalize_text(key), *(normalize_text(t) for t in texts),
+            dirty, now)
+
+
+def _fts_query(text: str, match_all: bool) -> Optional[str]:
+    """Construit une requête FTS5 (préfixes) à partir d'un texte libre"""
+    tokens = tokenize(text)
+    if not tokens:
+        return None
+    operator = ' AND ' if match_all else ' OR '
+    return operator.join(f'"{token}"*' for token in tokens)
+
+
+class SqliteDictionary:
+    """Miroir SQLite indexé des dictionnaires JSON"""
+
+    def __init__(self, database_file: Path = DATABASE_FILE):
+        self.database_file = Path(database_file)
+        self.database_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.database_file))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Synchronisation
+    # ------------------------------------------------------------------
+
+    def sync(self, name: str) -> Tuple[int, int]:
+        """Synchronise un dictionnaire dans les deux sens. Retourne (poussées, tirées)"""
+        pushed = self.push_to_json(name)
+        pulled = self.pull_from_json(name)
+        return pushed, pulled
+
+    def sync_all(self) -> Dict[str, Tuple[int, int]]:
+        return {name: self.sync(name) for name in DICTIONARIES}
+
+    def pull_from_json(self, name: str) -> int:
+        """Recopie dans SQLite les entrées JSON modifiées depuis la dernière synchro"""
+        store = open_store(name)
+        digest = content_hash(serialize_dictionary(store.data))
+        row = self.conn.execute("SELECT content_sha256 FROM dictionary_sync WHERE dictionary = ?",
+                                (name,)).fetchone()
+        if row and row['content_sha256'] == digest:
+            return 0
+
+        existing = {r['key']: r for r in self.conn.execute(
+            "SELECT key, en, fr, es, dirty FROM dictionary_entries WHERE dictionary = ?", (name,))}
+        now = datetime.now().isoformat(timespec='seconds')
+        upserts = []
+        for key, value in store.items():
+            current = existing.pop(key, None)
+            if current is not None:
+                if current['dirty']:
+                    continue
+                if all((value.get(lang, '') or '') == current[lang] for lang in LANGUAGES):
+                    continue
+            upserts.append(_row_values(name, key, value, 0, now))
+        removed = [(name, key) for key, current in existing.items() if not current['dirty']]
+
+        with self.conn:
+            self.conn.executemany(_UPSERT, upserts)
+            self.conn.executemany("DELETE FROM dictionary_entries WHERE dictionary = ? AND key = ?",
+                                  removed)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO dictionary_sync VALUES (?, ?, ?, ?)",
+                (name, digest, store.metadata.get('last_updated'), now))
+        return len(upserts) + len(removed)
+
+    def push_to_json(self, name: str) -> int:
+        """Journalise dans le store JSON les entrées modifiées via SQLite"""
+        rows = self.conn.execute(
+            "SELECT key, en, fr, es FROM dictionary_entries WHERE dictionary = ? AND dirty = 1",
+            (name,)).fetchall()
+        if not rows:
+            return 0
+        store = open_store(name)
+        for row in rows:
+            # Les champs propres au JSON (aliases) sont conservés
+            store.set(row['key'], {**store.get(row['key'], {}), **{lang: row[lang] for lang in LANGUAGES}})
+        store.metadata['last_updated'] = datetime.now().strftime("%Y-%m-%d")
+        store.save()
+        with self.conn:
+            self.conn.execute("UPDATE dictionary_entries SET dirty = 0 "
+                              "WHERE dictionary = ? AND dirty = 1", (name,))
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Lecture / écriture
+    # ------------------------------------------------------------------
+
+    def get(self, name: str, key: str) -> Optional[Dict[str, str]]:
+        row = self.conn.execute(
+            "SELECT en, fr, es FROM dictionary_entries WHERE dictionary = ? AND key = ?",
+            (name, key)).fetchone()
+        return {lang: row[lang] for lang in LANGUAGES} if row else None
+
+    def upsert(self, name: str, key: str, value: Dict[str, str]):
+        """Recopie une entrée déjà sauvegardée dans le JSON (pas de retour vers le JSON)"""
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.execute(_UPSERT, _row_values(name, key, value, 0, now))
+
+    def set_entry(self, name: str, key: str, value: Dict[str, str]):
+        """Écrit une entrée dans SQLite puis la journalise dans le JSON"""
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.execute(_UPSERT, _row_values(name, key, value, 1, now))
+        self.push_to_json(name)
+
+    def search(self, name: str, text: str, limit: int = 10,
+               match_all: bool = True) -> List[Tuple[float, str, Dict[str, str]]]:
+        """
+        Recherche plein texte (préfixes, sans accents) dans un dictionnaire.
+        Retourne des tuples (score bm25, clé, traductions), meilleurs en premier.
+        """
+        query = _fts_query(text, match_all)
+        if query is None:
+            return []
+        rows = self.conn.execute(
+            """
+            SELECT e.key, e.en, e.fr, e.es, bm25(dictionary_fts) AS rank
+            FROM dictionary_fts
+            JOIN dictionary_entries e ON e.id = dictionary_fts.rowid
+            WHERE dictionary_fts MATCH ? AND e.dictionary = ?
+            ORDER BY rank
+            LIMIT ?
+            """, (query, name, limit)).fetchall()
+        # bm25() est négatif : plus il est petit, meilleure est la correspondance
+        return [(-row['rank'], row['key'], {lang: row[lang] for lang in LANGUAGES})
+                for row in rows]
+
+    def statistics(self) -> Dict[str, Dict]:
+        """Nombre d'entrées et date de mise à jour par dictionnaire"""
+        stats = {name: {'count': 0, 'last_updated': None} for name in DICTIONARIES}
+        for row in self.conn.execute(
+                "SELECT dictionary, COUNT(*) AS count FROM dictionary_entries GROUP BY dictionary"):
+            stats.setdefault(row['dictionary'], {'last_updated': None})['count'] = row['count']
+        for row in self.conn.execute("SELECT dictionary, last_updated FROM dictionary_sync"):
+            stats.setdefault(row['dictionary'], {'count': 0})['last_updated'] = row['last_updated']
+        return stats
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'sync'
+    backend = SqliteDictionary()
+    try:
+        if command == 'sync':
+            for name, (pushed, pulled) in backend.sync_all().items():
+                print(f"🔄 {name}: {pushed} → JSON, {pulled} → SQLite")
+            print(f"✅ Base synchronisée: {backend.database_file}")
+        elif command == 'search' and len(sys.argv) == 4:
+            backend.sync(sys.argv[2])
+            for score, key, trans in backend.search(sys.argv[2], sys.argv[3]):
+                print(f"  • ({score:.2f}) EN: {trans['en']} | FR: {trans['fr']} | ES: {trans['es']}")
+        elif command == 'stats':
+            backend.sync_all()
+            for name, info in backend.statistics().items():
+                print(f"📊 {name}: {info['count']} entrées (mise à jour: {info['last_updated']})")
+        else:
+            print(f"Usage: {sys.argv[0]} sync | search <dictionnaire> <texte> | stats")
+            sys.exit(1)
+    finally:
+        backend.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Extraction en flux des ingrédients cités dans les instructions
+
+Les recettes sont lues paresseusement (corpus JSONL local, ou tout itérable de
+meals TheMealDB), regroupées en morceaux de quelques centaines d'instructions et
+traitées sur un ProcessPoolExecutor. Seuls les textes des morceaux en cours sont
+en mémoire : au plus 2 morceaux par worker sont soumis en même temps. Les
+candidats de chaque morceau sont fusionnés dans un Counter (nombre d'instructions
+où chaque candidat apparaît).
+
+Pour les gros corpus, SpillingCounter borne la mémoire des candidats : au-delà du
+budget, les comptes sont écrits sur disque en séquences triées, puis fusionnés
+(fusion k-voies) en additionnant les comptes, ce qui permet aussi d'écarter les
+candidats trop rares (--min-support).
+
+Usage:
+    python3 scripts/translation/streaming_extraction.py recettes.jsonl [--workers N]
+        [--memory-budget Mo] [--min-support N]
+"""
+
+import heapq
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from dictionary_store import WORK_DIR
+from instruction_extractor import extract_real_ingredients
+
+CHUNK_SIZE = 500
+# Morceaux soumis en même temps par worker (borne la mémoire des textes en attente)
+PENDING_PER_WORKER = 2
+# Coût estimé d'une entrée du Counter en plus de la chaîne (slot de dict + entier)
+ENTRY_OVERHEAD = 100
+# Nombre maximal de séquences fusionnées en une fois (fichiers ouverts simultanément)
+MERGE_FAN_IN = 64
+
+Extractor = Callable[[str], Set[str]]
+
+
+def iter_meals(corpus_file: Path) -> Iterator[Dict]:
+    """Meals d'un fichier JSONL (un meal par ligne, ou une réponse {"meals": [...]} par ligne)"""
+    with open(corpus_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            yield from record.get('meals') or [record]
+
+
+def iter_instructions(meals: Iterable[Dict]) -> Iterator[str]:
+    for meal in meals:
+        instructions = meal.get('strInstructions')
+        if instructions:
+            yield instructions
+
+
+def _extract_chunk(texts: List[str], extract: Extractor) -> Counter:
+    counts = Counter()
+    for text in texts:
+        counts.update(extract(text))
+    return counts
+
+
+class SpillingCounter:
+    """
+    Compteur de candidats à mémoire bornée : au-delà de memory_mb (estimation), les
+    comptes en mémoire sont écrits sur disque en une séquence triée. items() fusionne
+    les séquences et le reste en mémoire, dans l'ordre des clés.
+    """
+
+    def __init__(self, memory_mb: float = 64, spill_dir: Path = WORK_DIR):
+        self.budget = memory_mb * 1024 * 1024
+        self.spill_dir = spill_dir
+        self.spills = 0
+        self._counts = Counter()
+        self._bytes = 0
+        self._runs: List[Path] = []
+        self._run_dir: Optional[Path] = None
+
+    def update(self, counts: Mapping[str, int]):
+        for key, count in counts.items():
+            if key not in self._counts:
+                self._bytes += sys.getsizeof(key) + ENTRY_OVERHEAD
+            self._counts[key] += count
+        if self._bytes > self.budget:
+            self._spill()
+
+    def _new_run(self) -> Path:
+        if self._run_dir is None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self._run_dir = Path(tempfile.mkdtemp(prefix='extraction-runs-', dir=self.spill_dir))
+        path = self._run_dir / f"run-{self.spills:05d}.jsonl"
+        self.spills += 1
+        return path
+
+    @staticmethod
+    def _write_run(path: Path, items: Iterable[Tuple[str, int]]):
+        with open(path, 'w', encoding='utf-8') as f:
+            for key, count in items:
+                # Clé en JSON : un candidat peut contenir des retours à la ligne
+                f.write(f"{json.dumps(key, ensure_ascii=False)}\t{count}\n")
+
+    @staticmethod
+    def _read_run(path: Path) -> Iterator[Tuple[str, int]]:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                key, _, count = line.rpartition('\t')
+                yield json.loads(key), int(count)
+
+    def _spill(self):
+        path = self._new_run()
+        self._write_run(path, sorted(self._counts.items()))
+        self._runs.append(path)
+        self._counts = Counter()
+        self._bytes = 0
+        if len(self._runs) >= MERGE_FAN_IN:
+            # Fusion intermédiaire : le nombre de fichiers ouverts reste borné
+            merged = self._new_run()
+            self._write_run(merged, self._merge([self._read_run(run) for run in self._runs]))
+            for run in self._runs:
+                run.unlink()
+            self._runs = [merged]
+
+    @staticmethod
+    def _merge(streams: List[Iterator[Tuple[str, int]]]) -> Iterator[Tuple[str, int]]:
+        current, total = None, 0
+        for key, count in heapq.merge(*streams, key=lambda item: item[0]):
+            if key != current:
+                if current is not None:
+                    yield current, total
+                current, total = key, 0
+            total += count
+        if current is not None:
+            yield current, total
+
+    def items(self, min_support: int = 1) -> Iterator[Tuple[str, int]]:
+        """(candidat, compte) triés par candidat ; les fichiers temporaires sont supprimés à la fin"""
+        streams = [self._read_run(run) for run in self._runs] + [iter(sorted(self._counts.items()))]
+        try:
+            for key, count in self._merge(streams):
+                if count >= min_support:
+                    yield key, count
+        finally:
+            if self._run_dir is not None:
+                shutil.rmtree(self._run_dir, ignore_errors=True)
+                self._run_dir = None
+            self._runs = []
+
+
+def peak_memory_mb() -> Tuple[float, float]:
+    """Pic de mémoire résidente (Mo) du processus courant et de ses workers terminés"""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # ru_maxrss est en kilo-octets sous Linux, en octets sous macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return own / scale, children / scale
+
+
+def extract_stream(meals: Iterable[Dict],
+                   extract: Extractor = extract_real_ingredients,
+                   workers: Optional[int] = None,
+                   chunk_size: int = CHUNK_SIZE,
+                   counts=None):
+    """
+    Extrait les candidats de toutes les instructions d'un flux de meals.
+    Retourne Counter({candidat: nombre d'instructions qui le citent}), ou counts
+    (tout objet avec update(), ex. SpillingCounter) complété.
+
+    extract doit être une fonction de module (sérialisable vers les workers).
+    Un flux qui tient dans un seul morceau est traité dans le processus courant.
+    """
+    counts = Counter() if counts is None else counts
+    texts = iter_instructions(meals)
+    first = list(islice(texts, chunk_size))
+    workers = workers or os.cpu_count() or 1
+    if len(first) < chunk_size or workers == 1:
+        counts.update(_extract_chunk(first, extract))
+        for chunk in iter(lambda: list(islice(texts, chunk_size)), []):
+            counts.update(_extract_chunk(chunk, extract))
+        return counts
+
+    chunks = iter(lambda: list(islice(texts, chunk_size)), [])
+    max_pending = workers * PENDING_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_extract_chunk, first, extract)}
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    counts.update(future.result())
+            pending.add(pool.submit(_extract_chunk, chunk, extract))
+        for future in pending:
+            counts.update(future.result())
+    return counts
+
+
+def _option(argv: List[str], name: str, expected: str) -> Optional[str]:
+    if name not in argv:
+        return None
+    index = argv.index(name) + 1
+    if index >= len(argv):
+        print(f"❌ {name} attend {expected}")
+        sys.exit(1)
+    return argv[index]
+
+
+def corpus_option(argv: List[str]) -> Optional[Path]:
+    """Valeur de l'option --corpus <fichier.jsonl> des scripts d'extraction"""
+    value = _option(argv, '--corpus', "un fichier JSONL de recettes")
+    return Path(value) if value else None
+
+
+def counter_options(argv: List[str]):
+    """
+    Compteur de candidats et support minimal selon --memory-budget <Mo> (compteur
+    à mémoire bornée) et --min-support <N> (candidats cités dans au moins N instructions)
+    """
+    budget = _option(argv, '--memory-budget', "un budget en Mo")
+    min_support = _option(argv, '--min-support', "un nombre d'instructions")
+    counts = SpillingCounter(float(budget)) if budget else Counter()
+    return counts, int(min_support) if min_support else 1
+
+
+def iter_counts(counts, min_support: int = 1) -> Iterator[Tuple[str, int]]:
+    """(candidat, compte) d'un Counter ou d'un SpillingCounter (une seule lecture), filtrés par support"""
+    if isinstance(counts, SpillingCounter):
+        return counts.items(min_support)
+    return ((key, count) for key, count in counts.items() if count >= min_support)
+
+
+def print_peak_memory(counts=None):
+    own, workers = peak_memory_mb()
+    spills = f", {counts.spills} séquences écrites sur disque" if isinstance(counts, SpillingCounter) else ''
+    print(f"📈 Mémoire max: {own:.0f} Mo (processus principal), {workers:.0f} Mo (workers){spills}")
+
+
+def main():
+    args = sys.argv[1:]
+    workers = _option(args, '--workers', "un nombre de processus")
+    counts, min_support = counter_options(args)
+    if not args or args[0].startswith('--'):
+        print(f"Usage: {sys.argv[0]} recettes.jsonl [--workers N] [--memory-budget Mo] [--min-support N]")
+        sys.exit(1)
+
+    counts = extract_stream(iter_meals(Path(args[0])), workers=int(workers) if workers else None, counts=counts)
+    candidates = 0
+    top: List[Tuple[int, str]] = []
+    for ingredient, count in iter_counts(counts, min_support):
+        candidates += 1
+        if len(top) < 20:
+            heapq.heappush(top, (count, ingredient))
+        elif count > top[0][0]:
+            heapq.heapreplace(top, (count, ingredient))
+    print(f"🔍 {candidates} candidats distincts")
+    for count, ingredient in sorted(top, reverse=True):
+        print(f"   {count:6d}  {ingredient}")
+    print_peak_memory(counts)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Fonctions de normalisation de texte partagées par les scripts de traduction
+"""
+
+import re
+import unicodedata
+from typing import List
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalise un texte pour la recherche (minuscules, sans accents)"""
+    if text.isascii():
+        return text.lower().strip()
+    text = unicodedata.normalize('NFD', text.lower().strip())
+    return ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+
+
+def tokenize(text: str) -> List[str]:
+    """Découpe un texte normalisé en mots (ponctuation ignorée)"""
+    return _TOKEN_RE.findall(normalize_text(text))
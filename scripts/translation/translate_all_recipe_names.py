@@ -4,77 +4,23 @@ Script pour traduire automatiquement TOUS les noms de recettes
 dans recipe_names_fr_en_es.json
 """
 
-import json
 import re
 from pathlib import Path
 
-# Dictionnaire de traductions pour les noms de recettes courants
-RECIPE_NAME_TRANSLATIONS = {
-    # Patterns de traduction
-    'chicken': {'fr': 'poulet', 'es': 'pollo'},
-    'beef': {'fr': 'bœuf', 'es': 'carne de res'},
-    'pork': {'fr': 'porc', 'es': 'cerdo'},
-    'lamb': {'fr': 'agneau', 'es': 'cordero'},
-    'fish': {'fr': 'poisson', 'es': 'pescado'},
-    'salmon': {'fr': 'saumon', 'es': 'salmón'},
-    'curry': {'fr': 'curry', 'es': 'curry'},
-    'soup': {'fr': 'soupe', 'es': 'sopa'},
-    'salad': {'fr': 'salade', 'es': 'ensalada'},
-    'stew': {'fr': 'ragoût', 'es': 'estofado'},
-    'burger': {'fr': 'burger', 'es': 'hamburguesa'},
-    'pizza': {'fr': 'pizza', 'es': 'pizza'},
-    'pasta': {'fr': 'pâtes', 'es': 'pasta'},
-    'rice': {'fr': 'riz', 'es': 'arroz'},
-    'bread': {'fr': 'pain', 'es': 'pan'},
-    'cake': {'fr': 'gâteau', 'es': 'pastel'},
-    'pie': {'fr': 'tarte', 'es': 'tarta'},
-    'sauce': {'fr': 'sauce', 'es': 'salsa'},
-    'roasted': {'fr': 'rôti', 'es': 'asado'},
-    'fried': {'fr': 'frit', 'es': 'frito'},
-    'baked': {'fr': 'cuit au four', 'es': 'al horno'},
-    'grilled': {'fr': 'grillé', 'es': 'a la parrilla'},
-    'vegetable': {'fr': 'légume', 'es': 'verdura'},
-    'vegetables': {'fr': 'légumes', 'es': 'verduras'},
-}
+from dictionary_store import open_store
+from fuzzy_index import KnownEntries, is_translated
+from lexicon import LEXICON_FILE, load_lexicon
+from translation_cache import TranslationCache, source_version
 
 def translate_recipe_name(en_name):
     """Traduit un nom de recette"""
     en_lower = en_name.lower()
+    lexicon = load_lexicon()
     
-    # Traductions directes pour les recettes courantes
-    direct_translations = {
-        'chicken curry': {'fr': 'Curry de poulet', 'es': 'Curry de pollo'},
-        'beef stew': {'fr': 'Ragoût de bœuf', 'es': 'Estofado de res'},
-        'vegetable soup': {'fr': 'Soupe de légumes', 'es': 'Sopa de verduras'},
-        'fish and chips': {'fr': 'Poisson frit et frites', 'es': 'Pescado con patatas fritas'},
-        'pasta salad': {'fr': 'Salade de pâtes', 'es': 'Ensalada de pasta'},
-        'tomato soup': {'fr': 'Soupe à la tomate', 'es': 'Sopa de tomate'},
-        'lamb tagine': {'fr': 'Tajine d\'agneau', 'es': 'Tajine de cordero'},
-        'pork chops': {'fr': 'Côtes de porc', 'es': 'Chuletas de cerdo'},
-        'salmon fillet': {'fr': 'Filet de saumon', 'es': 'Filete de salmón'},
-        'rice pudding': {'fr': 'Riz au lait', 'es': 'Arroz con leche'},
-        'apple pie': {'fr': 'Tarte aux pommes', 'es': 'Tarta de manzana'},
-        'chocolate cake': {'fr': 'Gâteau au chocolat', 'es': 'Pastel de chocolate'},
-        'caesar salad': {'fr': 'Salade César', 'es': 'Ensalada César'},
-        'beef burger': {'fr': 'Burger de bœuf', 'es': 'Hamburguesa de res'},
-        'margherita pizza': {'fr': 'Pizza Margherita', 'es': 'Pizza Margherita'},
-        'spaghetti bolognese': {'fr': 'Spaghettis bolognaise', 'es': 'Espaguetis a la boloñesa'},
-        'chicken noodle soup': {'fr': 'Soupe de poulet aux nouilles', 'es': 'Sopa de pollo con fideos'},
-        'roasted vegetables': {'fr': 'Légumes rôtis', 'es': 'Verduras asadas'},
-        'garlic bread': {'fr': 'Pain à l\'ail', 'es': 'Pan de ajo'},
-        'mashed potatoes': {'fr': 'Purée de pommes de terre', 'es': 'Puré de patatas'},
-        'green bean casserole': {'fr': 'Gratin de haricots verts', 'es': 'Cazuela de judías verdes'},
-        'lentil soup': {'fr': 'Soupe de lentilles', 'es': 'Sopa de lentejas'},
-        'chickpea salad': {'fr': 'Salade de pois chiches', 'es': 'Ensalada de garbanzos'},
-        'kidney bean curry': {'fr': 'Curry aux haricots rouges', 'es': 'Curry de frijoles rojos'},
-        'black bean soup': {'fr': 'Soupe de haricots noirs', 'es': 'Sopa de frijoles negros'},
-        'white bean stew': {'fr': 'Ragoût de haricots blancs', 'es': 'Estofado de frijoles blancos'},
-    }
-    
-    # Vérifier les traductions directes
-    for pattern, translation in direct_translations.items():
-        if pattern in en_lower:
-            return translation
+    # Traductions directes pour les recettes courantes (un seul passage de l'automate)
+    translation = lexicon.recipe_name(en_lower)
+    if translation:
+        return translation
     
     # Traduction par mots
     words = en_lower.split()
@@ -85,9 +31,9 @@ def translate_recipe_name(en_name):
         # Nettoyer les caractères spéciaux
         clean_word = re.sub(r'[^\w\s]', '', word)
         
-        if clean_word in RECIPE_NAME_TRANSLATIONS:
-            fr_words.append(RECIPE_NAME_TRANSLATIONS[clean_word]['fr'])
-            es_words.append(RECIPE_NAME_TRANSLATIONS[clean_word]['es'])
+        if clean_word in lexicon.words:
+            fr_words.append(lexicon.words[clean_word]['fr'])
+            es_words.append(lexicon.words[clean_word]['es'])
         else:
             # Garder le mot original si pas de traduction
             fr_words.append(word)
@@ -101,9 +47,9 @@ def translate_recipe_name(en_name):
     if len(words) == 2:
         # Ex: "Chicken Soup" -> "Soupe au Poulet"
         if words[1] in ['soup', 'soupe', 'salad', 'salade', 'stew', 'ragoût']:
-            if words[0] in RECIPE_NAME_TRANSLATIONS:
-                meat_fr = RECIPE_NAME_TRANSLATIONS[words[0]]['fr']
-                type_fr = RECIPE_NAME_TRANSLATIONS.get(words[1], {}).get('fr', words[1])
+            if words[0] in lexicon.words:
+                meat_fr = lexicon.words[words[0]]['fr']
+                type_fr = lexicon.word(words[1], 'fr', words[1])
                 fr_translation = f"{type_fr.title()} au {meat_fr.title()}"
     
     return {
@@ -112,25 +58,27 @@ def translate_recipe_name(en_name):
     }
 
 def main():
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    json_file = project_root / "frontend" / "lib" / "data" / "culinary_dictionaries" / "recipe_names_fr_en_es.json"
+    store = open_store('recipe_names')
     
-    if not json_file.exists():
-        print(f"❌ Fichier non trouvé: {json_file}")
+    if not store.json_file.exists():
+        print(f"❌ Fichier non trouvé: {store.json_file}")
         return
     
-    # Lire le fichier
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    recipe_names = data.get("recipe_names", {})
+    recipe_names = store.entries
+    # Les entrées sont invalidées dès que ce script ou le lexique partagé change
+    cache = TranslationCache('recipe_names', source_version(Path(__file__), LEXICON_FILE))
     updated_fr = 0
     updated_es = 0
     
     print(f"📚 Traduction de {len(recipe_names)} noms de recettes...")
     print("")
     
+    # Variante mal orthographiée d'un nom déjà traduit : traduction reprise telle quelle
+    nearest = KnownEntries(recipe_names).nearest_many(
+        key for key, value in recipe_names.items() if not is_translated(key, value))
+    if nearest:
+        print(f"🔎 {len(nearest)} nom(s) proche(s) d'une recette déjà traduite")
+    
     for key, value in recipe_names.items():
         en_name = value.get("en", key).strip()
         fr_name = value.get("fr", "").strip()
@@ -140,7 +88,7 @@ def main():
         
         # Vérifier FR
         if not fr_name or fr_name == en_name or fr_name.lower() == en_name.lower():
-            translations = translate_recipe_name(en_name)
+            translations = nearest[key][1] if key in nearest else cache.translate(en_name, translate_recipe_name)
             if translations["fr"] != fr_name:
                 value["fr"] = translations["fr"]
                 updated_fr += 1
@@ -148,7 +96,7 @@ def main():
         
         # Vérifier ES
         if not es_name or es_name == en_name or es_name.lower() == en_name.lower():
-            translations = translate_recipe_name(en_name)
+            translations = nearest[key][1] if key in nearest else cache.translate(en_name, translate_recipe_name)
             if translations["es"] != es_name:
                 value["es"] = translations["es"]
                 updated_es += 1
@@ -157,15 +105,15 @@ def main():
         if changed and (updated_fr + updated_es) <= 30:
             print(f"✓ {key}: FR={value['fr']}, ES={value['es']}")
     
-    # Sauvegarder
-    data["metadata"]["total_terms"] = len(recipe_names)
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Sauvegarder (seules les entrées modifiées sont journalisées)
+    written = store.save()
+    cache.close()
     
     print("")
+    print(cache.report())
     print(f"✅ {updated_fr} traductions FR ajoutées/corrigées")
     print(f"✅ {updated_es} traductions ES ajoutées/corrigées")
-    print(f"📁 Fichier sauvegardé: {json_file}")
+    print(f"📁 {written} modification(s) journalisée(s) pour {store.json_file.name}")
 
 if __name__ == "__main__":
     main()
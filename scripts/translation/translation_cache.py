@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Cache persistant des traductions
+
+Clé : (texte normalisé, langue cible, identifiant du traducteur, version des règles).
+Un LRU borné en mémoire est placé devant un stockage SQLite sur disque
+(data/culinary_dictionaries/translation_cache.sqlite). La version des règles est
+une empreinte des fichiers/tables utilisés par le traducteur : dès qu'une table de
+règles change, les entrées de l'ancienne version sont purgées à l'ouverture.
+
+Usage:
+    cache = TranslationCache('recipe_names', source_version(Path(__file__)))
+    translations = cache.translate(en_name, translate_recipe_name)
+    print(cache.report())
+    cache.close()
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from dictionary_store import WORK_DIR
+
+CACHE_FILE = WORK_DIR / 'translation_cache.sqlite'
+DEFAULT_CAPACITY = 10000
+LANGS = ('fr', 'es')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_cache_text(text: str) -> str:
+    """Normalise le texte source d'une clé de cache (minuscules, espaces réduits)"""
+    return _WHITESPACE_RE.sub(' ', text.strip().lower())
+
+
+def table_version(*tables) -> str:
+    """Empreinte d'une ou plusieurs tables de règles (dict, list...)"""
+    digest = hashlib.sha256()
+    for table in tables:
+        digest.update(json.dumps(table, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def source_version(*paths: Path) -> str:
+    """Empreinte des fichiers dont dépend un traducteur (script, fichiers de règles)"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class TranslationCache:
+    """LRU en mémoire devant un cache SQLite, pour un traducteur et une version de règles"""
+
+    def __init__(self, translator_id: str, rules_version: str,
+                 capacity: int = DEFAULT_CAPACITY, cache_file: Path = CACHE_FILE):
+        self.translator_id = translator_id
+        self.rules_version = rules_version
+        self.capacity = capacity
+        self._memory: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str], str] = {}
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(cache_file))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS translation_cache (
+                translator TEXT NOT NULL,
+                rules_version TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                text TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (translator, rules_version, lang, text)
+            ) WITHOUT ROWID
+        """)
+        with self.conn:
+            cursor = self.conn.execute(
+                "DELETE FROM translation_cache WHERE translator = ? AND rules_version != ?",
+                (translator_id, rules_version))
+        self.invalidated = cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # LRU mémoire
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: Tuple[str, str], value: str):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Accès
+    # ------------------------------------------------------------------
+
+    def get(self, text: str, lang: str) -> Optional[str]:
+        key = (lang, normalize_cache_text(text))
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+        value = self._pending.get(key)
+        if value is None:
+            row = self.conn.execute(
+                "SELECT value FROM translation_cache "
+                "WHERE translator = ? AND rules_version = ? AND lang = ? AND text = ?",
+                (self.translator_id, self.rules_version, key[0], key[1])).fetchone()
+            value = row[0] if row else None
+        if value is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        self._remember(key, value)
+        return value
+
+    def put(self, text: str, lang: str, value: str):
+        key = (lang, normalize_cache_text(text))
+        self._remember(key, value)
+        self._pending[key] = value
+        if len(self._pending) >= 1000:
+            self.flush()
+
+    def translate(self, text: str, compute: Callable[[str], Dict[str, str]],
+                  langs: Iterable[str] = LANGS) -> Dict[str, str]:
+        """Traductions de text dans langs, calculées une seule fois par compute en cas d'absence"""
+        langs = tuple(langs)
+        result = {}
+        for lang in langs:
+            value = self.get(text, lang)
+            if value is None:
+                break
+            result[lang] = value
+        else:
+            return result
+        computed = compute(text)
+        for lang in langs:
+            self.put(text, lang, computed[lang])
+        return {lang: computed[lang] for lang in langs}
+
+    # ------------------------------------------------------------------
+    # Persistance et statistiques
+    # ------------------------------------------------------------------
+
+    def flush(self):
+        if not self._pending:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO translation_cache VALUES (?, ?, ?, ?, ?)",
+                [(self.translator_id, self.rules_version, lang, text, value)
+                 for (lang, text), value in self._pending.items()])
+        self._pending.clear()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidated': self.invalidated,
+        }
+
+    def report(self) -> str:
+        stats = self.stats()
+        lookups = stats['hits'] + stats['disk_hits'] + stats['misses']
+        ratio = (stats['hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return (f"💾 Cache {self.translator_id}: {ratio:.0%} de succès "
+                f"({stats['hits']} mémoire, {stats['disk_hits']} disque, {stats['misses']} absents, "
+                f"{stats['evictions']} évictions, {stats['invalidated']} invalidées)")